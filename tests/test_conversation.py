@@ -0,0 +1,356 @@
+#!/usr/bin/env python
+"""
+Tests for the conversation tools' recording pipeline.
+
+Tests cover:
+- Silence detection in record_audio (adaptive noise floor, tail lengths)
+- Pause reporting and trimming of leading/trailing silence
+- Speculative transcription of paused recordings
+- voice_chat exit phrases
+- Warnings from the memoized TTS configuration and emotion checks
+
+The microphone is a scripted fake sounddevice module, so the tests run
+without PortAudio or an audio device.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+import types
+from unittest.mock import AsyncMock, patch
+import numpy as np
+import pytest
+
+# Set required environment variables before imports
+os.environ['OPENAI_API_KEY'] = os.environ.get('OPENAI_API_KEY', 'test-key')
+
+
+class FakeInputStream:
+    """InputStream that feeds scripted int16 blocks to the callback from a thread"""
+
+    script = []
+
+    def __init__(self, samplerate, channels, dtype, blocksize, callback):
+        self.callback = callback
+        self.active = True
+
+    def __enter__(self):
+        self.thread = threading.Thread(target=self._run)
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.active = False
+        self.thread.join()
+
+    def _run(self):
+        status = types.SimpleNamespace(input_overflow=False)
+        for block in self.script:
+            if not self.active:
+                return
+            try:
+                self.callback(block.reshape(-1, 1), len(block), None, status)
+            except fake_sounddevice.CallbackStop:
+                break
+            time.sleep(0.001)
+        self.active = False
+
+
+fake_sounddevice = types.ModuleType("sounddevice")
+fake_sounddevice.CallbackStop = type("CallbackStop", (Exception,), {})
+fake_sounddevice.InputStream = FakeInputStream
+fake_sounddevice.query_devices = lambda: []
+fake_sounddevice.default = types.SimpleNamespace(device=[0, 0])
+
+# Only the sounddevice entry is swapped; patch.dict would also unload every
+# module first imported during the import, splitting them between test files
+real_sounddevice = sys.modules.get("sounddevice")
+sys.modules["sounddevice"] = fake_sounddevice
+try:
+    from voice_mcp.tools import conversation
+finally:
+    if real_sounddevice is None:
+        del sys.modules["sounddevice"]
+    else:
+        sys.modules["sounddevice"] = real_sounddevice
+
+CHUNK = int(conversation.SAMPLE_RATE * 0.1)
+
+
+def loud(seed=0):
+    """100ms of speech-level noise"""
+    return (np.random.default_rng(seed).standard_normal(CHUNK) * 2000).astype(np.int16)
+
+
+def quiet():
+    """100ms of digital silence"""
+    return np.zeros(CHUNK, dtype=np.int16)
+
+
+def hum(rng):
+    """100ms of room noise above the fixed threshold"""
+    return (rng.standard_normal(CHUNK) * 150).astype(np.int16)
+
+
+@pytest.fixture
+def microphone(monkeypatch):
+    """Route record_audio to the fake microphone and return its script"""
+    monkeypatch.setattr(conversation, "sd", fake_sounddevice)
+    monkeypatch.setattr(FakeInputStream, "script", [])
+    return FakeInputStream.script
+
+
+class TestRecordAudio:
+    """Test silence detection and trimming in record_audio"""
+
+    def test_short_tail_after_speech(self, microphone):
+        """Once speech is heard, 0.9s of silence ends the recording"""
+        microphone[:] = [loud() for _ in range(10)] + [quiet() for _ in range(30)]
+
+        recording = conversation.record_audio(10)
+
+        # 1s of speech plus the 0.2s margin kept after it
+        assert len(recording) == 12 * CHUNK
+
+    def test_single_blip_keeps_long_tail(self, microphone):
+        """One loud chunk doesn't count as speech, so the 2.5s tail applies"""
+        microphone[:] = [quiet() for _ in range(5)] + [loud()] + [quiet() for _ in range(20)]
+
+        recording = conversation.record_audio(10)
+
+        # 2s of silence doesn't stop it, so the stream runs out and only
+        # the leading silence beyond the 0.2s margin is trimmed
+        assert len(recording) == 23 * CHUNK
+
+    def test_threshold_adapts_to_noise_floor(self, microphone):
+        """Room noise above the fixed threshold still counts as silence"""
+        rng = np.random.default_rng(1)
+        microphone[:] = (
+            [hum(rng) for _ in range(3)]
+            + [loud() for _ in range(10)]
+            + [hum(rng) for _ in range(40)]
+        )
+
+        recording = conversation.record_audio(10)
+
+        # Calibration, speech and the trailing margin; with the fixed
+        # threshold the hum would never end the recording
+        assert len(recording) == 15 * CHUNK
+
+    def test_duration_limit(self, microphone):
+        """Continuous speech stops at the maximum duration"""
+        microphone[:] = [loud() for _ in range(30)]
+
+        recording = conversation.record_audio(1.0)
+
+        assert len(recording) == 10 * CHUNK
+
+    def test_stream_ending_early(self, microphone):
+        """A stream that stops delivering audio returns what was recorded"""
+        microphone[:] = [loud() for _ in range(5)]
+
+        recording = conversation.record_audio(5)
+
+        assert len(recording) == 5 * CHUNK
+
+    def test_pauses_reported(self, microphone):
+        """A long pause reports the speech so far, and resumed speech withdraws it"""
+        microphone[:] = (
+            [loud() for _ in range(10)]
+            + [quiet() for _ in range(7)]
+            + [loud() for _ in range(5)]
+            + [quiet() for _ in range(20)]
+        )
+        events = []
+
+        recording = conversation.record_audio(
+            10, lambda prefix: events.append(None if prefix is None else len(prefix) // CHUNK)
+        )
+
+        # Reported after 0.6s of silence, withdrawn, then reported again
+        assert events == [16, None, 28]
+        assert len(recording) == 24 * CHUNK
+
+    def test_phrase_break_not_reported(self, microphone):
+        """A short mid-utterance pause is not reported at all"""
+        microphone[:] = (
+            [loud() for _ in range(10)]
+            + [quiet() for _ in range(4)]
+            + [loud() for _ in range(5)]
+            + [quiet() for _ in range(20)]
+        )
+        events = []
+
+        conversation.record_audio(
+            10, lambda prefix: events.append(None if prefix is None else len(prefix) // CHUNK)
+        )
+
+        # Only the final pause, once the whole utterance was heard
+        assert events == [25]
+
+    def test_no_pause_reported_without_speech(self, microphone):
+        """Silence alone never triggers a pause report"""
+        microphone[:] = [quiet() for _ in range(30)]
+        events = []
+
+        conversation.record_audio(10, events.append)
+
+        assert events == []
+
+
+class TestSpeculativeTranscription:
+    """Test transcribing a recording during its final pause"""
+
+    @pytest.mark.asyncio
+    async def test_pause_starts_transcription(self):
+        """A reported pause sends the audio so far to STT"""
+        prefix = np.ones(CHUNK, dtype=np.int16)
+        with patch.object(conversation, "speech_to_text", AsyncMock(return_value="hello")) as stt:
+            speculation = conversation.SpeculativeTranscription()
+            speculation.update(prefix)
+
+            assert await speculation.task == "hello"
+
+        stt.assert_awaited_once_with(prefix, speculative=True)
+
+    @pytest.mark.asyncio
+    async def test_resumed_speech_cancels_transcription(self):
+        """Speaking again cancels the transcription of the earlier pause"""
+        never = asyncio.Event()
+
+        async def slow_stt(audio, speculative):
+            await never.wait()
+
+        with patch.object(conversation, "speech_to_text", side_effect=slow_stt):
+            speculation = conversation.SpeculativeTranscription()
+            speculation.update(np.ones(CHUNK, dtype=np.int16))
+            task = speculation.task
+            await asyncio.sleep(0)
+            speculation.update(None)
+            await asyncio.sleep(0)
+
+        assert task.cancelled()
+        assert speculation.task is None
+
+    @pytest.mark.asyncio
+    async def test_new_pause_replaces_previous(self):
+        """Only the transcription of the latest pause is kept"""
+        stt = AsyncMock(side_effect=lambda audio, speculative: len(audio) // CHUNK)
+        with patch.object(conversation, "speech_to_text", stt):
+            speculation = conversation.SpeculativeTranscription()
+            speculation.update(np.ones(CHUNK, dtype=np.int16))
+            first = speculation.task
+            speculation.update(np.ones(2 * CHUNK, dtype=np.int16))
+
+            assert await speculation.task == 2
+
+        assert first.cancelled()
+
+    def test_empty_prefix_ignored(self):
+        """An empty prefix does not start a transcription"""
+        speculation = conversation.SpeculativeTranscription()
+        speculation.update(np.array([], dtype=np.int16))
+
+        assert speculation.task is None
+
+    @pytest.mark.asyncio
+    async def test_phrase_break_issues_no_upload(self, microphone):
+        """A mid-utterance pause followed by more speech sends one upload only"""
+        microphone[:] = (
+            [loud() for _ in range(10)]
+            + [quiet() for _ in range(4)]
+            + [loud() for _ in range(5)]
+            + [quiet() for _ in range(20)]
+        )
+        stt = AsyncMock(return_value="hello")
+        loop = asyncio.get_running_loop()
+        speculation = conversation.SpeculativeTranscription()
+
+        with patch.object(conversation, "speech_to_text", stt):
+            await loop.run_in_executor(
+                None,
+                conversation.record_audio,
+                10,
+                lambda prefix: loop.call_soon_threadsafe(speculation.update, prefix),
+            )
+            await asyncio.sleep(0)
+            assert await speculation.task == "hello"
+
+        assert stt.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_speculative_attempt_skips_saved_files(self, monkeypatch, tmp_path):
+        """Speculative uploads write neither the debug nor the saved recording"""
+        monkeypatch.setattr(conversation, "DEBUG", True)
+        client = AsyncMock()
+        client.audio.transcriptions.create = AsyncMock(return_value="hello")
+        monkeypatch.setitem(conversation.openai_clients, "stt", client)
+
+        with patch.object(conversation, "save_debug_file") as save:
+            text = await conversation.speech_to_text(
+                np.ones(CHUNK, dtype=np.int16), True, tmp_path, speculative=True
+            )
+
+        assert text == "hello"
+        save.assert_not_called()
+
+
+class TestExitPhrases:
+    """Test the phrases that end voice_chat"""
+
+    @pytest.mark.parametrize("response,should_exit", [
+        ("Goodbye!", True),
+        ("ok, END CHAT now", True),
+        ("let's stop here", True),
+        ("nonstop", True),
+        ("tell me more", False),
+    ])
+    def test_exit_phrase_matching(self, response, should_exit):
+        """Exit phrases match anywhere in the response, ignoring case"""
+        assert bool(conversation._EXIT_PHRASE_RE.search(response)) is should_exit
+
+
+class TestTtsConfigWarnings:
+    """Test that memoized TTS configuration still reports problems every turn"""
+
+    @pytest.mark.asyncio
+    async def test_ignored_instructions_warned_each_call(self, caplog):
+        """Instructions for a model without support are reported on every call"""
+        for _ in range(2):
+            config = await conversation.get_tts_config("openai", "nova", "tts-1", "sound cheerful")
+            assert config['instructions'] is None
+
+        warnings = [r for r in caplog.records if "only supported with gpt-4o-mini-tts" in r.message]
+        assert len(warnings) == 2
+
+    @pytest.mark.asyncio
+    async def test_unknown_provider_warned_each_call(self, caplog):
+        """An unknown provider is reported on every call and falls back to OpenAI"""
+        for _ in range(2):
+            config = await conversation.get_tts_config("bogus", "nova", "tts-1")
+            assert config['provider'] == "openai"
+
+        warnings = [r for r in caplog.records if "Unknown provider: bogus" in r.message]
+        assert len(warnings) == 2
+
+
+class TestEmotionValidation:
+    """Test the memoized emotion decision and its logging"""
+
+    def test_disallowed_emotions_stripped_and_warned_each_call(self, monkeypatch, caplog):
+        """Stripped instructions are reported on every call, not only the first"""
+        monkeypatch.setattr(conversation, "ALLOW_EMOTIONS", False)
+        conversation._emotion_decision.cache_clear()
+
+        for _ in range(2):
+            assert conversation.validate_emotion_request("gpt-4o-mini-tts", "happy", "openai") is None
+
+        warnings = [r for r in caplog.records if "VOICE_ALLOW_EMOTIONS not enabled" in r.message]
+        assert len(warnings) == 2
+        conversation._emotion_decision.cache_clear()
+
+    def test_other_models_keep_instructions(self):
+        """Instructions for other models pass through unchanged"""
+        assert conversation.validate_emotion_request("tts-1", "happy", "openai") == "happy"
@@ -0,0 +1,536 @@
+#!/usr/bin/env python
+"""
+Tests for core audio helpers.
+
+Tests cover:
+- Chime generation
+- Shared HTTP client
+- Decoded TTS audio cache
+- Synthesis without playback and chime playback
+- Streaming TTS playback
+- Sentence-pipelined TTS playback
+"""
+
+import asyncio
+import os
+import threading
+import types
+from unittest.mock import AsyncMock, MagicMock, patch
+import httpx
+import numpy as np
+import pytest
+
+# Set required environment variables before imports
+os.environ['OPENAI_API_KEY'] = os.environ.get('OPENAI_API_KEY', 'test-key')
+
+from voice_mcp import core
+from voice_mcp.core import (
+    AudioCache,
+    generate_chime,
+    get_http_client,
+    get_openai_clients,
+    PartialPlaybackError,
+    STREAM_JITTER_BYTES,
+    play_chime_start,
+    speak_sentences,
+    split_sentences,
+    stream_speech,
+    synthesize_speech,
+    text_to_speech,
+)
+
+
+@pytest.fixture
+def tts_client():
+    """Mock OpenAI client returning fake MP3 bytes"""
+    response = MagicMock()
+    response.read = AsyncMock(return_value=b"fake mp3")
+    response.__aenter__ = AsyncMock(return_value=response)
+    response.__aexit__ = AsyncMock(return_value=None)
+    client = MagicMock()
+    client.audio.speech.with_streaming_response.create = MagicMock(return_value=response)
+    return client
+
+
+@pytest.fixture
+def decoded_audio():
+    """Fake pydub segment returned by the MP3 decoder"""
+    audio = MagicMock()
+    audio.channels = 1
+    audio.frame_rate = 24000
+    audio.get_array_of_samples.return_value = np.arange(100, dtype=np.int16)
+    return audio
+
+
+class TestGenerateChime:
+    """Test chime sample generation"""
+
+    @pytest.mark.parametrize("frequencies,sample_rate", [
+        ([800, 1000], 44100),
+        ([1000, 800], 24000),
+        ([440], 16000),
+    ])
+    def test_tones_laid_out_in_sequence(self, frequencies, sample_rate):
+        """Each tone fills its own slice of the output"""
+        chime = generate_chime(frequencies, duration=0.1, sample_rate=sample_rate)
+        samples_per_tone = int(sample_rate * 0.1)
+
+        assert chime.dtype == np.int16
+        assert chime.shape == (samples_per_tone * len(frequencies),)
+        for i, freq in enumerate(frequencies):
+            tone = chime[i * samples_per_tone:(i + 1) * samples_per_tone].astype(float)
+            spectrum = np.abs(np.fft.rfft(tone))
+            peak = np.fft.rfftfreq(samples_per_tone, 1 / sample_rate)[spectrum.argmax()]
+            assert abs(peak - freq) <= 10
+
+    def test_tones_fade_in_and_out(self):
+        """Every tone starts and ends silent and stays within 0.3 amplitude"""
+        chime = generate_chime([800, 1000], duration=0.1, sample_rate=44100)
+        samples_per_tone = 4410
+
+        assert np.abs(chime).max() <= int(0.3 * 32767)
+        for start in (0, samples_per_tone):
+            assert chime[start] == 0
+            assert abs(int(chime[start + samples_per_tone - 1])) < 100
+
+
+class TestSharedHttpClient:
+    """Test the HTTP client shared by OpenAI-compatible clients"""
+
+    @pytest.fixture(autouse=True)
+    def fresh_http_client(self, monkeypatch):
+        """Start every test without a shared client"""
+        monkeypatch.setattr(core, '_http_client', None)
+
+    def test_openai_clients_share_http_client(self):
+        """STT and TTS clients reuse one pooled HTTP client"""
+        clients = get_openai_clients("test-key", "http://localhost:2022/v1", "http://localhost:8880/v1")
+
+        assert clients['stt']._client is clients['tts']._client
+        assert clients['stt']._client is get_http_client()
+
+    @pytest.mark.asyncio
+    async def test_closed_client_is_replaced(self):
+        """A closed shared client is recreated on next use"""
+        first = get_http_client()
+        await first.aclose()
+
+        second = get_http_client()
+
+        assert second is not first
+        assert not second.is_closed
+        await second.aclose()
+
+    def test_aiohttp_transport_used_when_installed(self):
+        """The httpx-aiohttp client is preferred when the package is available"""
+        class FakeAiohttpClient(httpx.AsyncClient):
+            pass
+
+        fake_module = types.ModuleType("httpx_aiohttp")
+        fake_module.HttpxAiohttpClient = FakeAiohttpClient
+
+        with patch.dict("sys.modules", {"httpx_aiohttp": fake_module}):
+            client = get_http_client()
+
+        assert isinstance(client, FakeAiohttpClient)
+
+    def test_default_transport_without_aiohttp(self):
+        """The plain httpx client is used when httpx-aiohttp is missing"""
+        with patch.dict("sys.modules", {"httpx_aiohttp": None}):
+            client = get_http_client()
+
+        assert type(client) is httpx.AsyncClient
+
+    @pytest.mark.parametrize("h2_module,http2", [(types.ModuleType("h2"), True), (None, False)])
+    def test_http2_enabled_when_h2_installed(self, h2_module, http2):
+        """The plain httpx client uses HTTP/2 only when h2 is available"""
+        client_class = MagicMock(wraps=httpx.AsyncClient)
+        with patch.dict("sys.modules", {"httpx_aiohttp": None, "h2": h2_module}), \
+             patch.object(core.httpx, 'AsyncClient', client_class):
+            get_http_client()
+
+        assert client_class.call_args.kwargs.get('http2', False) is http2
+
+
+class TestAudioCache:
+    """Test the LRU cache of decoded TTS audio"""
+
+    def test_least_recently_used_entry_evicted(self):
+        """Reading an entry protects it from eviction"""
+        cache = AudioCache(max_entries=2)
+        cache.put("a", np.zeros(4, dtype=np.float32), 24000)
+        cache.put("b", np.zeros(4, dtype=np.float32), 24000)
+        cache.get("a")
+        cache.put("c", np.zeros(4, dtype=np.float32), 24000)
+
+        assert len(cache) == 2
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+
+    def test_cached_samples_are_read_only(self):
+        """Shared sample arrays cannot be modified by a caller"""
+        cache = AudioCache()
+        cache.put("a", np.zeros(4, dtype=np.float32), 24000)
+        samples, _ = cache.get("a")
+
+        with pytest.raises(ValueError):
+            samples[0] = 1.0
+
+    def test_total_bytes_bounded(self):
+        """Old entries are evicted to stay under max_bytes"""
+        cache = AudioCache(max_entries=10, max_bytes=32)
+        cache.put("a", np.zeros(4, dtype=np.float32), 24000)
+        cache.put("b", np.zeros(4, dtype=np.float32), 24000)
+        cache.put("c", np.zeros(4, dtype=np.float32), 24000)
+
+        assert cache.get("a") is None
+        assert cache.get("b") is not None
+        assert cache.get("c") is not None
+
+    def test_oversized_entry_not_kept(self):
+        """An entry larger than max_bytes does not evict everything else"""
+        cache = AudioCache(max_entries=10, max_bytes=32)
+        cache.put("a", np.zeros(4, dtype=np.float32), 24000)
+        cache.put("big", np.zeros(64, dtype=np.float32), 24000)
+
+        assert cache.get("big") is None
+        assert cache.get("a") is not None
+
+
+class TestAudioCacheOnDisk:
+    """Test persisting cached TTS audio to disk"""
+
+    def test_entry_survives_new_cache_instance(self, tmp_path):
+        """A new cache over the same directory serves entries from disk"""
+        samples = np.linspace(-1.0, 1.0, 50, dtype=np.float32)
+        cache = AudioCache(cache_dir=tmp_path)
+        cache.put(("url", "tts-1", "nova", None, "hello"), samples, 24000)
+        cache.wait_for_writes()
+
+        loaded = AudioCache(cache_dir=tmp_path).get(("url", "tts-1", "nova", None, "hello"))
+
+        assert loaded is not None
+        np.testing.assert_allclose(loaded[0], samples, atol=1 / 32767)
+        assert loaded[1] == 24000
+        assert list(tmp_path.glob("*.tmp")) == []
+
+    def test_oldest_files_pruned(self, tmp_path):
+        """Files beyond max_files are removed, least recently used first"""
+        cache = AudioCache(cache_dir=tmp_path, max_files=2)
+        for i, text in enumerate(["a", "b", "c"]):
+            cache.put(text, np.zeros(4, dtype=np.float32), 24000)
+            cache.wait_for_writes()
+            os.utime(cache._path_for(text), (i, i))
+
+        cache.put("d", np.zeros(4, dtype=np.float32), 24000)
+        cache.wait_for_writes()
+
+        assert len(list(tmp_path.glob("*.npz"))) == 2
+        assert not cache._path_for("a").exists()
+        assert cache._path_for("d").exists()
+
+    def test_corrupt_file_is_a_miss(self, tmp_path):
+        """An unreadable cache file is treated as missing"""
+        cache = AudioCache(cache_dir=tmp_path)
+        cache._path_for("hello").write_bytes(b"not an npz file")
+
+        assert cache.get("hello") is None
+
+    def test_written_off_calling_thread(self, tmp_path):
+        """Disk writes run on the background writer, not the caller's thread"""
+        cache = AudioCache(cache_dir=tmp_path)
+        store = cache._store
+        threads = []
+
+        def record_thread(*args):
+            threads.append(threading.current_thread())
+            store(*args)
+
+        with patch.object(cache, '_store', side_effect=record_thread):
+            cache.put("hello", np.zeros(4, dtype=np.float32), 24000)
+            cache.wait_for_writes()
+
+        assert threads and threads[0] is not threading.current_thread()
+        assert cache._path_for("hello").exists()
+
+
+class TestTextToSpeechCache:
+    """Test text_to_speech playback from the decoded audio cache"""
+
+    async def speak(self, tts_client, cache, text="listening", voice="nova"):
+        return await text_to_speech(
+            text=text,
+            openai_clients={'tts': tts_client},
+            tts_model="gpt-4o-mini-tts",
+            tts_voice=voice,
+            tts_base_url="https://api.openai.com/v1",
+            instructions="Whisper this word",
+            cache=cache,
+        )
+
+    @pytest.mark.asyncio
+    async def test_repeat_request_played_from_cache(self, tts_client, decoded_audio):
+        """The second identical request skips the API and the decoder"""
+        cache = AudioCache()
+        with patch.object(core.AudioSegment, 'from_mp3', return_value=decoded_audio) as from_mp3, \
+             patch.object(core, 'play_audio_samples') as play:
+            first, _ = await self.speak(tts_client, cache)
+            second, metrics = await self.speak(tts_client, cache)
+
+        assert first and second
+        assert tts_client.audio.speech.with_streaming_response.create.call_count == 1
+        assert from_mp3.call_count == 1
+        assert play.call_count == 2
+        assert metrics['generation'] == 0.0
+        np.testing.assert_array_equal(play.call_args_list[0].args[0], play.call_args_list[1].args[0])
+
+    @pytest.mark.asyncio
+    async def test_different_voice_misses_cache(self, tts_client, decoded_audio):
+        """Requests differing in voice are synthesized separately"""
+        cache = AudioCache()
+        with patch.object(core.AudioSegment, 'from_mp3', return_value=decoded_audio), \
+             patch.object(core, 'play_audio_samples'):
+            await self.speak(tts_client, cache, voice="nova")
+            await self.speak(tts_client, cache, voice="alloy")
+
+        assert tts_client.audio.speech.with_streaming_response.create.call_count == 2
+        assert len(cache) == 2
+
+    @pytest.mark.asyncio
+    async def test_case_and_punctuation_share_entry(self, tts_client, decoded_audio):
+        """Messages differing only in case, spacing or punctuation hit the same entry"""
+        cache = AudioCache()
+        with patch.object(core.AudioSegment, 'from_mp3', return_value=decoded_audio), \
+             patch.object(core, 'play_audio_samples'):
+            await self.speak(tts_client, cache, text="Say hello")
+            await self.speak(tts_client, cache, text="say  hello!")
+            await self.speak(tts_client, cache, text="Say goodbye")
+
+        assert tts_client.audio.speech.with_streaming_response.create.call_count == 2
+        assert len(cache) == 2
+
+    @pytest.mark.parametrize("first,second", [
+        ("-5", "5"),
+        ("$5", "5"),
+        ("3.5", "3 5"),
+    ])
+    def test_differently_spoken_texts_do_not_collide(self, first, second):
+        """Symbols that change the spoken audio are part of the key"""
+        key = lambda text: core._speech_cache_key("url", "tts-1", "nova", None, text)
+        assert key(first) != key(second)
+
+
+class TestSynthesizeSpeech:
+    """Test synthesizing audio without playing it"""
+
+    @pytest.mark.asyncio
+    async def test_returns_samples_and_fills_cache(self, decoded_audio, tts_client):
+        """Decoded samples are returned and cached for the next request"""
+        cache = AudioCache()
+        with patch.object(core.AudioSegment, 'from_mp3', return_value=decoded_audio), \
+             patch.object(core, 'play_audio_samples') as play:
+            samples, sample_rate = await synthesize_speech(
+                "listening", {'tts': tts_client}, "tts-1", "nova", "https://api.openai.com/v1", cache=cache
+            )
+            cached = await synthesize_speech(
+                "listening", {'tts': tts_client}, "tts-1", "nova", "https://api.openai.com/v1", cache=cache
+            )
+
+        assert sample_rate == 24000
+        assert samples.dtype == np.float32
+        assert cached[0] is samples
+        assert tts_client.audio.speech.with_streaming_response.create.call_count == 1
+        play.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_requests_share_one_call(self, decoded_audio, tts_client):
+        """Identical requests made at the same time trigger a single API call"""
+        with patch.object(core.AudioSegment, 'from_mp3', return_value=decoded_audio):
+            results = await asyncio.gather(*[
+                synthesize_speech("listening", {'tts': tts_client}, "tts-1", "nova", "https://api.openai.com/v1")
+                for _ in range(3)
+            ])
+
+        assert tts_client.audio.speech.with_streaming_response.create.call_count == 1
+        assert all(result[0] is results[0][0] for result in results)
+        assert core._inflight_syntheses == {}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_failure_reaches_every_caller(self, tts_client):
+        """A failed shared synthesis raises in every waiting caller and is not remembered"""
+        with patch.object(core.AudioSegment, 'from_mp3', side_effect=ValueError("bad mp3")):
+            results = await asyncio.gather(*[
+                synthesize_speech("listening", {'tts': tts_client}, "tts-1", "nova", "https://api.openai.com/v1")
+                for _ in range(2)
+            ], return_exceptions=True)
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert core._inflight_syntheses == {}
+
+    @pytest.mark.asyncio
+    async def test_instructions_only_sent_to_supporting_model(self, decoded_audio, tts_client):
+        """Instructions are dropped for models that do not accept them"""
+        with patch.object(core.AudioSegment, 'from_mp3', return_value=decoded_audio):
+            await synthesize_speech(
+                "hi", {'tts': tts_client}, "tts-1", "nova", "https://api.openai.com/v1", instructions="Whisper"
+            )
+
+        create = tts_client.audio.speech.with_streaming_response.create
+        assert "instructions" not in create.call_args.kwargs
+
+
+class TestStreamSpeech:
+    """Test playing TTS audio while it downloads"""
+
+    @pytest.fixture
+    def fake_sounddevice(self):
+        """Install a sounddevice module whose output stream records writes"""
+        written = []
+        output_stream = MagicMock()
+        output_stream.write.side_effect = lambda block: written.append(block.copy())
+        module = types.ModuleType("sounddevice")
+        module.OutputStream = MagicMock(return_value=output_stream)
+        with patch.dict("sys.modules", {"sounddevice": module}):
+            yield output_stream, written
+
+    def pcm_client(self, *chunks):
+        """Mock OpenAI client streaming the given raw PCM chunks"""
+        async def iter_bytes(chunk_size):
+            for chunk in chunks:
+                yield chunk
+
+        response = MagicMock()
+        response.iter_bytes = iter_bytes
+        response.__aenter__ = AsyncMock(return_value=response)
+        response.__aexit__ = AsyncMock(return_value=None)
+        client = MagicMock()
+        client.audio.speech.with_streaming_response.create = MagicMock(return_value=response)
+        return client
+
+    @pytest.mark.asyncio
+    async def test_chunks_played_across_odd_boundaries(self, fake_sounddevice):
+        """Samples split between network chunks are reassembled before playback"""
+        output_stream, written = fake_sounddevice
+        pcm = np.arange(-2000, 2000, dtype=np.int16).tobytes()
+        client = self.pcm_client(pcm[:1001], pcm[1001:4001], pcm[4001:])
+
+        samples, _ = await stream_speech("hello", {'tts': client}, "tts-1", "nova")
+
+        played = np.concatenate([block.reshape(-1) for block in written[1:]])
+        np.testing.assert_array_equal(played, np.arange(-2000, 2000, dtype=np.int16))
+        assert not written[0].any()
+        assert samples.dtype == np.float32 and len(samples) == 4000
+        output_stream.stop.assert_called_once()
+        output_stream.close.assert_called_once()
+        create = client.audio.speech.with_streaming_response.create
+        assert create.call_args.kwargs["response_format"] == "pcm"
+
+    @pytest.mark.asyncio
+    async def test_empty_stream_raises(self, fake_sounddevice):
+        """A response without audio raises and never opens the device"""
+        with pytest.raises(RuntimeError, match="No audio data"):
+            await stream_speech("hello", {'tts': self.pcm_client()}, "tts-1", "nova")
+
+    @pytest.mark.asyncio
+    async def test_failure_after_playback_started(self, fake_sounddevice):
+        """A stream breaking after audio was played raises PartialPlaybackError"""
+        async def iter_bytes(chunk_size):
+            yield b"\x01\x00" * STREAM_JITTER_BYTES
+            raise httpx.ReadError("connection lost")
+
+        client = self.pcm_client()
+        client.audio.speech.with_streaming_response.create.return_value.iter_bytes = iter_bytes
+
+        with pytest.raises(PartialPlaybackError):
+            await stream_speech("hello", {'tts': client}, "tts-1", "nova")
+
+        fake_sounddevice[0].close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_partial_playback_not_replayed(self, tts_client):
+        """After partial playback the message is not downloaded and played again"""
+        with patch.object(core, 'stream_speech', AsyncMock(side_effect=PartialPlaybackError("boom"))), \
+             patch.object(core, 'play_audio_samples') as play:
+            success, _ = await text_to_speech(
+                "hello", {'tts': tts_client}, "tts-1", "nova",
+                "https://api.openai.com/v1", stream=True
+            )
+
+        assert not success
+        play.assert_not_called()
+        tts_client.audio.speech.with_streaming_response.create.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_text_to_speech_falls_back_to_download(self, tts_client, decoded_audio):
+        """A failed stream falls back to the full MP3 download"""
+        with patch.object(core, 'stream_speech', AsyncMock(side_effect=RuntimeError("boom"))), \
+             patch.object(core.AudioSegment, 'from_mp3', return_value=decoded_audio), \
+             patch.object(core, 'play_audio_samples') as play:
+            success, _ = await text_to_speech(
+                "hello", {'tts': tts_client}, "tts-1", "nova",
+                "https://api.openai.com/v1", stream=True
+            )
+
+        assert success
+        play.assert_called_once()
+
+
+class TestSpeakSentences:
+    """Test synthesizing sentences ahead of their playback"""
+
+    def test_split_sentences(self):
+        """Text is split after sentence punctuation followed by whitespace"""
+        assert split_sentences(" Hi there. How are you?  Fine!\nOK ") == [
+            "Hi there.", "How are you?", "Fine!", "OK"
+        ]
+        assert split_sentences("Version 2.1 is out") == ["Version 2.1 is out"]
+
+    @pytest.mark.asyncio
+    async def test_sentences_played_in_order(self):
+        """Sentences finishing synthesis out of order are still played in order"""
+        delays = {"One.": 0.03, "Two.": 0.0, "Three.": 0.01}
+
+        async def fake_synthesize(text, *args, **kwargs):
+            await asyncio.sleep(delays[text])
+            return np.full(4, len(text), dtype=np.float32), 24000
+
+        with patch.object(core, 'synthesize_speech', side_effect=fake_synthesize), \
+             patch.object(core, 'play_audio_samples') as play:
+            success, metrics = await speak_sentences(
+                ["One.", "Two.", "Three."], {}, "tts-1", "nova", "https://api.openai.com/v1"
+            )
+
+        assert success
+        assert [call.args[0][0] for call in play.call_args_list] == [4, 4, 6]
+        assert 'generation' in metrics and 'playback' in metrics
+
+    @pytest.mark.asyncio
+    async def test_failure_stops_playback(self):
+        """A failed sentence stops playback and reports failure"""
+        async def fake_synthesize(text, *args, **kwargs):
+            if text == "Two.":
+                raise RuntimeError("api down")
+            return np.zeros(4, dtype=np.float32), 24000
+
+        with patch.object(core, 'synthesize_speech', side_effect=fake_synthesize), \
+             patch.object(core, 'play_audio_samples') as play:
+            success, _ = await speak_sentences(
+                ["One.", "Two.", "Three."], {}, "tts-1", "nova", "https://api.openai.com/v1"
+            )
+
+        assert not success
+        assert play.call_count == 1
+
+
+class TestChimes:
+    """Test chime playback"""
+
+    @pytest.mark.asyncio
+    async def test_chime_played_off_event_loop(self):
+        """The blocking play-and-wait runs in a worker thread"""
+        with patch.object(core, '_play_and_wait') as play, \
+             patch.object(core.asyncio, 'to_thread', AsyncMock()) as to_thread:
+            assert await play_chime_start() is True
+
+        to_thread.assert_awaited_once()
+        assert to_thread.await_args.args[0] is play
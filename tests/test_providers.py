@@ -0,0 +1,325 @@
+#!/usr/bin/env python
+"""
+Tests for the provider registry and Gemini TTS provider.
+
+Tests cover:
+- WAV output written by GeminiTTSProvider.generate_speech
+- Gemini TTS result caching
+- Lazy google-genai client creation
+- Provider availability probing
+"""
+
+import os
+import time
+import wave
+from unittest.mock import AsyncMock, MagicMock, patch
+import pytest
+
+from voice_mcp import providers
+from voice_mcp.providers import GeminiTTSProvider
+
+
+def make_chunk(data: bytes) -> MagicMock:
+    """Build a fake Gemini stream chunk carrying inline audio data"""
+    chunk = MagicMock()
+    chunk.candidates[0].content.parts[0].inline_data.data = data
+    return chunk
+
+
+@pytest.fixture
+def gemini_provider(tmp_path):
+    """Create a GeminiTTSProvider without touching the real google-genai client"""
+    provider = GeminiTTSProvider.__new__(GeminiTTSProvider)
+    provider.api_key = "test-key"
+    provider.types = MagicMock()
+    provider.client = MagicMock()
+    provider.model = "gemini-2.5-flash-preview-tts"
+    provider.voice = "Zephyr"
+    provider.system_prompt = "Speak naturally and clearly."
+    provider.cache_dir = tmp_path / "tts_cache"
+    return provider
+
+
+class TestGeminiSpeechOutput:
+    """Test the WAV file produced from streamed Gemini audio"""
+
+    @pytest.mark.asyncio
+    async def test_streamed_chunks_form_valid_wav(self, gemini_provider):
+        """Chunks are written in order and the header sizes are patched"""
+        chunks = [b"\x01\x00" * 100, b"\x02\x00" * 50, b"\x03\x00" * 25]
+        gemini_provider.client.models.generate_content_stream.return_value = [
+            make_chunk(data) for data in chunks
+        ]
+
+        path = await gemini_provider.generate_speech("hello")
+        with wave.open(str(path), 'rb') as wav:
+            assert wav.getnchannels() == 1
+            assert wav.getsampwidth() == 2
+            assert wav.getframerate() == 24000
+            assert wav.getnframes() == 175
+            assert wav.readframes(175) == b"".join(chunks)
+
+    @pytest.mark.asyncio
+    async def test_no_audio_raises(self, gemini_provider):
+        """An empty stream raises instead of returning a header-only file"""
+        gemini_provider.client.models.generate_content_stream.return_value = []
+
+        with pytest.raises(RuntimeError, match="No audio data"):
+            await gemini_provider.generate_speech("hello")
+
+        assert list(gemini_provider.cache_dir.iterdir()) == []
+        staging_dir = providers._get_staging_dir(gemini_provider.cache_dir)
+        assert list(staging_dir.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_writes_staged_outside_cache(self, gemini_provider):
+        """Files are staged in one per-process directory beside the cache"""
+        gemini_provider.client.models.generate_content_stream.side_effect = (
+            lambda **kwargs: [make_chunk(b"\x01\x00" * 10)]
+        )
+
+        await gemini_provider.generate_speech("hello")
+        await gemini_provider.generate_speech("goodbye")
+
+        staging_dir = providers._get_staging_dir(gemini_provider.cache_dir)
+        assert staging_dir.parent == gemini_provider.cache_dir.parent
+        assert list(staging_dir.iterdir()) == []
+        assert len(list(gemini_provider.cache_dir.glob("*.wav"))) == 2
+        assert providers._get_staging_dir(gemini_provider.cache_dir) == staging_dir
+
+    def test_abandoned_staging_dirs_reaped(self, tmp_path):
+        """Staging dirs of dead processes or past the age limit are removed"""
+        cache_dir = tmp_path / "tts_cache"
+        dead = tmp_path / "staging_999999999_abc"
+        old = tmp_path / f"staging_{os.getppid()}_old"
+        unnamed = tmp_path / "staging_xyz"
+        live = tmp_path / f"staging_{os.getppid()}_live"
+        for path in (dead, old, unnamed, live):
+            path.mkdir()
+        age = providers.STAGING_MAX_AGE + 60
+        os.utime(old, (time.time() - age, time.time() - age))
+
+        staging_dir = providers._get_staging_dir(cache_dir)
+
+        assert not dead.exists()
+        assert not old.exists()
+        assert not unnamed.exists()
+        assert live.exists()
+        assert staging_dir.exists()
+
+    @pytest.mark.parametrize("data_size", [0, 1, 48000, 2**31])
+    def test_header_template_matches_generic_header(self, gemini_provider, data_size):
+        """The precomputed header equals the header built from parsed MIME parameters"""
+        fast = gemini_provider._build_wav_header(data_size, "audio/L16;rate=24000")
+        generic = gemini_provider._build_wav_header(data_size, "audio/L16; rate=24000")
+        assert len(fast) == 44
+        assert fast == generic
+
+    @pytest.mark.parametrize("mime_type,expected", [
+        ("audio/L16;rate=24000", {"bits_per_sample": 16, "rate": 24000}),
+        ("audio/L24; rate=48000", {"bits_per_sample": 24, "rate": 48000}),
+        ("audio/L16", {"bits_per_sample": 16, "rate": 24000}),
+        ("audio/L16;rate=bogus", {"bits_per_sample": 16, "rate": 24000}),
+    ])
+    def test_parse_audio_mime_type(self, mime_type, expected):
+        """MIME parameters are parsed with defaults for missing or invalid values"""
+        assert GeminiTTSProvider._parse_audio_mime_type(mime_type) == expected
+
+
+class TestGeminiSpeechCache:
+    """Test that repeated Gemini requests are served from the on-disk cache"""
+
+    @pytest.mark.asyncio
+    async def test_repeat_request_skips_api(self, gemini_provider):
+        """The second identical request returns the cached file without an API call"""
+        stream = gemini_provider.client.models.generate_content_stream
+        stream.return_value = [make_chunk(b"\x01\x00" * 10)]
+
+        first = await gemini_provider.generate_speech("hello", voice="Kore")
+        second = await gemini_provider.generate_speech("hello", voice="Kore")
+
+        assert first == second
+        assert first.parent == gemini_provider.cache_dir
+        assert stream.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_different_voice_misses_cache(self, gemini_provider):
+        """Changing the voice produces a separate cache entry"""
+        stream = gemini_provider.client.models.generate_content_stream
+        stream.side_effect = lambda **kwargs: [make_chunk(b"\x01\x00" * 10)]
+
+        first = await gemini_provider.generate_speech("hello", voice="Kore")
+        second = await gemini_provider.generate_speech("hello", voice="Puck")
+
+        assert first != second
+        assert stream.call_count == 2
+
+    def test_key_fields_not_ambiguous(self):
+        """Moving a separator between fields changes the key"""
+        assert providers._cache_key("m", "v", "p|x", "t") != providers._cache_key("m", "v", "p", "x|t")
+        assert providers._cache_key("ab", "c") != providers._cache_key("a", "bc")
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_does_not_create_client(self, gemini_provider):
+        """A cached request is served without importing google-genai"""
+        gemini_provider.client.models.generate_content_stream.return_value = [
+            make_chunk(b"\x01\x00" * 10)
+        ]
+        first = await gemini_provider.generate_speech("hello")
+
+        gemini_provider.client = None
+        with patch.object(GeminiTTSProvider, '_ensure_client') as ensure_client:
+            second = await gemini_provider.generate_speech("hello")
+
+        assert first == second
+        ensure_client.assert_not_called()
+
+
+class TestGeminiClient:
+    """Test lazy creation of the google-genai client"""
+
+    def test_constructor_does_not_create_client(self, monkeypatch):
+        """Creating a provider does not import google-genai"""
+        monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+        with patch.object(GeminiTTSProvider, '_ensure_client') as ensure_client:
+            provider = GeminiTTSProvider()
+
+        assert provider.client is None
+        ensure_client.assert_not_called()
+
+    def test_client_shared_between_instances(self, monkeypatch):
+        """Providers with the same API key reuse one google-genai client"""
+        monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+        monkeypatch.setattr(providers, '_genai_clients', {})
+        genai = MagicMock()
+        google = MagicMock(genai=genai)
+        modules = {"google": google, "google.genai": genai, "google.genai.types": genai.types}
+
+        with patch.dict("sys.modules", modules):
+            first = GeminiTTSProvider()
+            second = GeminiTTSProvider()
+            first._ensure_client()
+            second._ensure_client()
+
+        assert first.client is second.client
+        genai.Client.assert_called_once_with(api_key="test-key")
+
+
+class TestProviderAvailability:
+    """Test provider availability probing"""
+
+    @pytest.fixture(autouse=True)
+    def clear_availability_cache(self):
+        """Start every test without cached probe results"""
+        providers.invalidate_provider_cache()
+        yield
+        providers.invalidate_provider_cache()
+
+    @pytest.mark.asyncio
+    async def test_cloud_provider_skips_probe(self):
+        """Cloud providers are assumed available without an HTTP request"""
+        with patch.object(providers, '_get_http_client') as mock_client:
+            assert await providers.is_provider_available("openai") is True
+            mock_client.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_available_providers_filtered_by_type(self):
+        """Only reachable providers of the requested type are returned, in registry order"""
+        async def fake_probe(provider_id):
+            return provider_id != "kokoro"
+
+        with patch.object(providers, 'is_provider_available', side_effect=fake_probe):
+            available = await providers.get_available_providers("tts")
+
+        assert [p["id"] for p in available] == ["openai", "gemini"]
+
+    @pytest.mark.asyncio
+    async def test_local_provider_probe_uses_shared_client(self):
+        """Local providers are probed through the shared HTTP client"""
+        client = MagicMock()
+        client.get = AsyncMock(return_value=MagicMock(status_code=200))
+
+        with patch.object(providers, '_get_http_client', return_value=client):
+            assert await providers.is_provider_available("kokoro") is True
+
+        client.get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_probe_result_cached_within_ttl(self):
+        """A second check within the TTL reuses the first probe result"""
+        with patch.object(providers, '_probe_provider', AsyncMock(return_value=True)) as probe:
+            assert await providers.is_provider_available("kokoro") is True
+            assert await providers.is_provider_available("kokoro") is True
+
+        assert probe.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_probe_repeated_after_ttl_or_invalidation(self):
+        """Expired or invalidated results trigger a fresh probe"""
+        with patch.object(providers, '_probe_provider', AsyncMock(side_effect=[False, True, True])) as probe, \
+             patch.object(providers.time, 'monotonic', side_effect=[100.0, 110.0, 110.0, 111.0]):
+            assert await providers.is_provider_available("kokoro") is False
+            assert await providers.is_provider_available("kokoro") is True
+            providers.invalidate_provider_cache("kokoro")
+            assert await providers.is_provider_available("kokoro") is True
+
+        assert probe.await_count == 3
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("prefer_local,expected", [(True, "kokoro"), (False, "gemini")])
+    async def test_tts_selection_stops_at_first_available(self, prefer_local, expected):
+        """Providers are probed in preference order until one is available"""
+        probe = AsyncMock(return_value=True)
+        with patch.object(providers, 'is_provider_available', probe):
+            provider = await providers.get_tts_provider(prefer_local=prefer_local)
+
+        assert provider["id"] == expected
+        probe.assert_awaited_once_with(expected)
+
+    @pytest.mark.asyncio
+    async def test_stt_selection_falls_back_to_cloud(self):
+        """A local-first lookup falls back to the cloud when local STT is down"""
+        async def fake_probe(provider_id):
+            return provider_id != "whisper-local"
+
+        with patch.object(providers, 'is_provider_available', side_effect=fake_probe):
+            provider = await providers.get_stt_provider(prefer_local=True)
+
+        assert provider["id"] == "openai-whisper"
+
+    @pytest.mark.asyncio
+    async def test_selection_returns_none_when_nothing_available(self):
+        """No provider is returned when every probe fails"""
+        with patch.object(providers, 'is_provider_available', AsyncMock(return_value=False)):
+            assert await providers.get_tts_provider() is None
+            assert await providers.get_stt_provider() is None
+
+    @pytest.mark.asyncio
+    async def test_recorded_health_reused_by_availability_check(self):
+        """A health result recorded elsewhere is used instead of a new probe"""
+        providers.record_provider_health("kokoro", False)
+
+        with patch.object(providers, '_probe_provider', AsyncMock(return_value=True)) as probe:
+            assert await providers.is_provider_available("kokoro") is False
+
+        probe.assert_not_awaited()
+
+
+class TestProviderByVoice:
+    """Test provider lookup from a voice name"""
+
+    @pytest.mark.parametrize("voice,provider_id", [
+        ("af_sky", "kokoro"),
+        ("am_adam", "kokoro"),
+        ("Zephyr", "gemini"),
+        ("Kore", "gemini"),
+        ("nova", "openai"),
+        ("alloy", "openai"),
+    ])
+    def test_voice_maps_to_provider(self, voice, provider_id):
+        """Voices resolve to the provider that offers them"""
+        assert providers.get_provider_by_voice(voice)["id"] == provider_id
+
+    def test_gemini_registry_voices_match_lookup_set(self):
+        """The registry voice list and the lookup set contain the same voices"""
+        assert set(providers.PROVIDERS["gemini"]["voices"]) == providers.GEMINI_VOICES
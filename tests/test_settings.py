@@ -0,0 +1,269 @@
+#!/usr/bin/env python
+"""
+Tests for voice settings persistence.
+
+Tests cover:
+- Atomic settings writes
+- Debounced saving inside an event loop
+- Batched updates and resets
+- Reloading settings only when the file changes
+- JSON encoding with optional orjson
+- Applying settings to the environment
+"""
+
+import asyncio
+import json
+import os
+from unittest.mock import patch
+import pytest
+
+from voice_mcp import settings as settings_module
+from voice_mcp.settings import VoiceSettingsManager
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    """Create a settings manager backed by a temporary home directory"""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    with patch.dict(os.environ):
+        manager = VoiceSettingsManager()
+        yield manager
+        manager.flush()
+
+
+def read_settings_file(manager):
+    """Read the persisted settings as a dict"""
+    return json.loads(manager.settings_file.read_text())
+
+
+class TestSettingsPersistence:
+    """Test writing settings to disk"""
+
+    def test_save_without_loop_writes_immediately(self, manager):
+        """Outside an event loop each update is written right away"""
+        manager.update_setting('tts_voice', 'Kore')
+
+        assert read_settings_file(manager)['tts_voice'] == 'Kore'
+        assert not manager.settings_file.with_suffix('.tmp').exists()
+
+    def test_failed_write_keeps_previous_file(self, manager):
+        """A failing write leaves the existing settings file intact"""
+        manager.update_setting('tts_voice', 'Kore')
+        manager._settings.tts_voice = 'Puck'
+        manager._dirty = True
+
+        with patch.object(settings_module.os, 'replace', side_effect=OSError("disk full")):
+            manager.flush()
+
+        assert read_settings_file(manager)['tts_voice'] == 'Kore'
+        assert manager._dirty is True
+
+    @pytest.mark.asyncio
+    async def test_updates_in_loop_coalesce(self, manager, monkeypatch):
+        """A burst of updates inside the event loop produces one write"""
+        monkeypatch.setattr(settings_module, 'SAVE_DEBOUNCE_SECONDS', 0.01)
+        manager.load_settings()
+
+        with patch.object(settings_module.os, 'replace', wraps=os.replace) as replace:
+            manager.update_setting('tts_voice', 'Kore')
+            manager.update_setting('silence_timeout', 1.5)
+            manager.update_setting('audio_feedback', 'none')
+            assert replace.call_count == 0
+
+            await asyncio.sleep(0.05)
+
+        assert replace.call_count == 1
+        data = read_settings_file(manager)
+        assert data['tts_voice'] == 'Kore'
+        assert data['silence_timeout'] == 1.5
+        assert data['audio_feedback'] == 'none'
+
+    def test_save_rescheduled_after_loop_ends(self, manager, monkeypatch):
+        """A pending save from a finished loop doesn't block later saves"""
+        monkeypatch.setattr(settings_module, 'SAVE_DEBOUNCE_SECONDS', 0.01)
+        manager.load_settings()
+
+        async def update(voice, wait):
+            manager.update_setting('tts_voice', voice)
+            await asyncio.sleep(wait)
+
+        # The first loop ends before its debounced write fires
+        asyncio.run(update('Kore', 0))
+        asyncio.run(update('Puck', 0.05))
+
+        assert read_settings_file(manager)['tts_voice'] == 'Puck'
+        assert manager._dirty is False
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_pending_changes(self, manager):
+        """flush writes debounced changes without waiting for the timer"""
+        manager.load_settings()
+        manager.update_setting('tts_voice', 'Kore')
+
+        manager.flush()
+
+        assert read_settings_file(manager)['tts_voice'] == 'Kore'
+        assert manager._save_handle is None
+
+
+class TestBatchUpdates:
+    """Test updating several settings at once"""
+
+    def test_batch_update_writes_once(self, manager):
+        """All updates are applied with a single write"""
+        manager.load_settings()
+
+        with patch.object(settings_module.os, 'replace', wraps=os.replace) as replace:
+            assert manager.update_settings({'tts_provider': 'kokoro', 'tts_voice': 'af_sky'}) is True
+
+        assert replace.call_count == 1
+        data = read_settings_file(manager)
+        assert data['tts_provider'] == 'kokoro'
+        assert data['tts_voice'] == 'af_sky'
+        assert os.environ['TTS_BASE_URL'] == "http://localhost:8880/v1"
+
+    def test_unknown_key_rejects_whole_batch(self, manager):
+        """A batch containing an unknown setting changes nothing"""
+        voice = manager.get_setting('tts_voice')
+
+        assert manager.update_settings({'tts_voice': 'Kore', 'no_such_setting': 1}) is False
+        assert manager.get_setting('tts_voice') == voice
+
+    def test_reset_restores_defaults(self, manager):
+        """Resetting overwrites the saved file with default settings"""
+        manager.update_settings({'tts_voice': 'Kore', 'silence_timeout': 1.0})
+
+        manager.reset_settings()
+
+        data = read_settings_file(manager)
+        assert data['tts_voice'] == settings_module.VoiceSettings().tts_voice
+        assert data['silence_timeout'] == settings_module.VoiceSettings().silence_timeout
+
+    @pytest.mark.asyncio
+    async def test_reset_in_loop_writes_immediately(self, manager):
+        """A reset is not left waiting on the debounce timer"""
+        manager.update_setting('tts_voice', 'Kore')
+        assert manager._save_handle is not None
+
+        manager.reset_settings()
+
+        assert manager._save_handle is None
+        assert read_settings_file(manager)['tts_voice'] == settings_module.VoiceSettings().tts_voice
+
+
+class TestSettingsEncoding:
+    """Test the settings file encoding with and without orjson"""
+
+    def test_stdlib_fallback_round_trip(self):
+        """Without orjson the settings are written as indented JSON"""
+        data = {'tts_voice': 'Kore', 'silence_timeout': 2.5, 'prefer_local': True}
+        with patch.object(settings_module, "orjson", None):
+            raw = settings_module._encode_settings(data)
+            assert settings_module._decode_settings(raw) == data
+
+        assert raw == json.dumps(data, indent=2).encode()
+
+    def test_orjson_used_when_installed(self):
+        """orjson is preferred for both directions when it is available"""
+        orjson = pytest.importorskip("orjson")
+        data = {'tts_voice': 'Kore'}
+
+        assert settings_module._encode_settings(data) == orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        assert settings_module._decode_settings(b'{"tts_voice": "Kore"}') == data
+
+
+class TestSettingsCache:
+    """Test serving loaded settings from memory"""
+
+    def test_unchanged_file_not_reread(self, manager):
+        """Repeated loads of an unchanged file skip reading it"""
+        manager.update_setting('tts_voice', 'Kore')
+
+        with patch.object(settings_module, '_decode_settings') as decode:
+            assert manager.load_settings().tts_voice == 'Kore'
+            assert manager.load_settings().tts_voice == 'Kore'
+
+        decode.assert_not_called()
+
+    def test_external_edit_is_reloaded(self, manager):
+        """A change to the file made elsewhere is picked up on the next load"""
+        manager.update_setting('tts_voice', 'Kore')
+        data = read_settings_file(manager)
+        data['tts_voice'] = 'Puck'
+        manager.settings_file.write_text(json.dumps(data))
+        stat = manager.settings_file.stat()
+        os.utime(manager.settings_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert manager.load_settings().tts_voice == 'Puck'
+
+    def test_version_tracks_changes(self, manager):
+        """The version changes on updates and reloads but not on cached loads"""
+        manager.update_setting('tts_voice', 'Kore')
+        version = manager.version
+
+        manager.load_settings()
+        assert manager.version == version
+
+        manager.update_setting('tts_voice', 'Puck')
+        assert manager.version != version
+
+        version = manager.version
+        stat = manager.settings_file.stat()
+        os.utime(manager.settings_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        manager.load_settings()
+        assert manager.version != version
+
+    def test_settings_property_sees_external_edit(self, manager):
+        """The settings property used by converse reloads an edited file"""
+        manager.update_setting('tts_voice', 'Kore')
+        data = read_settings_file(manager)
+        data['tts_voice'] = 'Puck'
+        manager.settings_file.write_text(json.dumps(data))
+        stat = manager.settings_file.stat()
+        os.utime(manager.settings_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert manager.settings.tts_voice == 'Puck'
+        assert manager.get_setting('tts_voice') == 'Puck'
+
+    @pytest.mark.asyncio
+    async def test_pending_changes_win_over_file(self, manager):
+        """Unsaved changes are not replaced by the file contents"""
+        manager.update_setting('tts_voice', 'Kore')
+        manager.settings_file.write_text(json.dumps({'tts_voice': 'Puck'}))
+
+        assert manager.load_settings().tts_voice == 'Kore'
+
+
+class TestApplyToEnvironment:
+    """Test exporting settings as environment variables"""
+
+    def test_unchanged_settings_skip_environment_writes(self, manager):
+        """Re-applying the same settings does not write to os.environ"""
+        manager.apply_to_environment()
+
+        with patch.object(settings_module.os, 'environ', wraps=os.environ) as environ:
+            manager.apply_to_environment()
+
+        environ.__setitem__.assert_not_called()
+        environ.__delitem__.assert_not_called()
+
+    def test_provider_switch_updates_environment(self, manager):
+        """Switching providers sets and unsets the base URLs"""
+        manager.update_setting('tts_provider', 'kokoro')
+        manager.update_setting('stt_provider', 'local')
+        assert os.environ['TTS_BASE_URL'] == "http://localhost:8880/v1"
+        assert os.environ['STT_BASE_URL'] == "http://localhost:2022/v1"
+
+        manager.update_setting('tts_provider', 'openai')
+        manager.update_setting('stt_provider', 'openai')
+        assert 'TTS_BASE_URL' not in os.environ
+        assert 'STT_BASE_URL' not in os.environ
+
+    def test_external_change_is_reapplied(self, manager):
+        """Variables changed outside the manager are restored on the next apply"""
+        manager.apply_to_environment()
+        os.environ['TTS_VOICE'] = 'other'
+
+        manager.apply_to_environment()
+
+        assert os.environ['TTS_VOICE'] == manager.get_setting('tts_voice')
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+"""
+Tests for the voice settings MCP tools.
+
+Tests cover:
+- Validation of choice and duration settings
+- Switching TTS provider and voice
+- Reusing the rendered get_voice_settings output until settings change
+"""
+
+import os
+import sys
+from unittest.mock import MagicMock, patch
+import pytest
+
+# Set required environment variables before imports
+os.environ['OPENAI_API_KEY'] = os.environ.get('OPENAI_API_KEY', 'test-key')
+
+# The tools package also loads the conversation tools, which need
+# sounddevice; only that entry is swapped while importing
+real_sounddevice = sys.modules.get("sounddevice")
+sys.modules["sounddevice"] = MagicMock()
+try:
+    from voice_mcp.tools import settings as settings_tools
+finally:
+    if real_sounddevice is None:
+        del sys.modules["sounddevice"]
+    else:
+        sys.modules["sounddevice"] = real_sounddevice
+
+from voice_mcp.settings import VoiceSettingsManager
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    """Point the settings tools at a manager backed by a temporary home"""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    with patch.dict(os.environ):
+        manager = VoiceSettingsManager()
+        monkeypatch.setattr(settings_tools, "settings_manager", manager)
+        monkeypatch.setattr(settings_tools, "_rendered_settings", None)
+        yield manager
+        manager.flush()
+
+
+class TestChoiceSettings:
+    """Test settings restricted to a fixed set of values"""
+
+    @pytest.mark.asyncio
+    async def test_valid_choice_saved(self, manager):
+        """An accepted value is saved and confirmed"""
+        result = await settings_tools.set_audio_feedback("both")
+
+        assert result == "✅ Audio feedback set to: both"
+        assert manager.load_settings().audio_feedback == "both"
+
+    @pytest.mark.asyncio
+    async def test_invalid_choice_rejected(self, manager):
+        """An unknown value is reported and nothing is saved"""
+        result = await settings_tools.set_stt_provider("bogus")
+
+        assert result.startswith("❌")
+        assert manager.load_settings().stt_provider == "openai"
+
+    @pytest.mark.asyncio
+    async def test_gemini_provider_switches_model(self, manager):
+        """Switching to Gemini replaces an OpenAI TTS model in the same save"""
+        result = await settings_tools.set_tts_provider("gemini")
+
+        settings = manager.load_settings()
+        assert result.startswith("✅")
+        assert settings.tts_provider == "gemini"
+        assert settings.tts_model == settings.gemini_model
+
+
+class TestDurationSettings:
+    """Test the bounds table shared by the duration settings"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("tool,key,value", [
+        ("set_silence_timeout", "silence_timeout", 3.0),
+        ("set_listen_duration", "listen_duration", 90.0),
+    ])
+    async def test_value_within_bounds_saved(self, manager, tool, key, value):
+        """Durations inside their bounds are saved"""
+        result = await getattr(settings_tools, tool)(value)
+
+        assert result.startswith("✅")
+        assert getattr(manager.load_settings(), key) == value
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("tool,value,message", [
+        ("set_silence_timeout", 0, "❌ Silence timeout must be between 0.1 and 60 seconds."),
+        ("set_listen_duration", 601, "❌ Listen duration must be between 5 and 600 seconds."),
+    ])
+    async def test_value_out_of_bounds_rejected(self, manager, tool, value, message):
+        """Durations outside their bounds are rejected with the range"""
+        assert await getattr(settings_tools, tool)(value) == message
+
+
+class TestTtsVoice:
+    """Test setting the TTS voice"""
+
+    @pytest.mark.asyncio
+    async def test_listed_voice_saved(self, manager):
+        """A voice from the provider lists is saved without a warning"""
+        assert await settings_tools.set_tts_voice("nova") == "✅ TTS voice set to: nova"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("voice", ["zf_xiaobei", "jf_alpha", "my-custom-voice"])
+    async def test_unlisted_voice_saved_with_warning(self, manager, voice):
+        """Voices missing from the lists are saved, with a note to check them"""
+        result = await settings_tools.set_tts_voice(voice)
+
+        assert result.startswith(f"✅ TTS voice set to: {voice} (")
+        assert manager.load_settings().tts_voice == voice
+
+
+class TestRenderedSettings:
+    """Test reuse of the get_voice_settings output"""
+
+    @pytest.mark.asyncio
+    async def test_output_reused_until_settings_change(self, manager):
+        """Unchanged settings return the same rendering; an update re-renders"""
+        first = await settings_tools.get_voice_settings()
+        second = await settings_tools.get_voice_settings()
+        await settings_tools.set_tts_voice("onyx")
+        third = await settings_tools.get_voice_settings()
+
+        assert second is first
+        assert third is not first
+        assert "Voice: onyx" in third
+
+    @pytest.mark.asyncio
+    async def test_gemini_section_only_for_gemini(self, manager):
+        """The Gemini settings are shown only while Gemini is the TTS provider"""
+        assert "GEMINI SETTINGS" not in await settings_tools.get_voice_settings()
+
+        await settings_tools.set_tts_provider("gemini")
+
+        assert "GEMINI SETTINGS" in await settings_tools.get_voice_settings()
@@ -19,11 +19,17 @@ from datetime import datetime
 DEBUG = os.getenv("VOICE_MCP_DEBUG", "").lower() in ("true", "1", "yes", "on")
 TRACE_DEBUG = os.getenv("VOICE_MCP_DEBUG", "").lower() == "trace"
 DEBUG_DIR = Path.home() / "voice-mcp_recordings"
+# Log per-call memory usage in converse (debug mode only)
+PROFILE_MEMORY = DEBUG and os.getenv("VOICE_MCP_PROFILE_MEM", "").lower() in ("true", "1", "yes", "on")
 
 # Audio saving configuration
 SAVE_AUDIO = os.getenv("VOICE_MCP_SAVE_AUDIO", "").lower() in ("true", "1", "yes", "on")
 AUDIO_DIR = Path.home() / "voice-mcp_audio"
 
+# On-disk cache of synthesized audio feedback phrases ("listening", "finished")
+SPEECH_CACHE_ENABLED = os.getenv("VOICE_MCP_SPEECH_CACHE", "true").lower() in ("true", "1", "yes", "on")
+SPEECH_CACHE_DIR = Path.home() / ".voice-mcp" / "speech_cache"
+
 # Audio feedback configuration
 audio_feedback_raw = os.getenv("VOICE_MCP_AUDIO_FEEDBACK", "chime").lower()
 
@@ -72,6 +78,9 @@ TTS_BASE_URL = os.getenv("TTS_BASE_URL", "https://api.openai.com/v1")
 TTS_VOICE = os.getenv("TTS_VOICE", "alloy")
 TTS_MODEL = os.getenv("TTS_MODEL", "tts-1")
 
+# Stream TTS audio and start playback before synthesis has finished (opt-in)
+TTS_STREAMING = os.getenv("VOICE_MCP_TTS_STREAMING", "false").lower() in ("true", "1", "yes", "on")
+
 # Provider-specific TTS configuration
 OPENAI_TTS_BASE_URL = os.getenv("OPENAI_TTS_BASE_URL", "https://api.openai.com/v1")
 KOKORO_TTS_BASE_URL = os.getenv("KOKORO_TTS_BASE_URL", os.getenv("TTS_BASE_URL", "http://localhost:8880/v1"))
@@ -6,13 +6,18 @@ extracted to allow for easier testing and reuse.
 """
 
 import asyncio
+import hashlib
+import io
 import logging
 import os
+import re
 import tempfile
 import gc
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Hashable, Optional, Tuple
 
 import numpy as np
 from pydub import AudioSegment
@@ -47,26 +52,469 @@ def save_debug_file(data: bytes, prefix: str, extension: str, debug_dir: Path, d
         return None
 
 
+# Shared HTTP client behind every OpenAI-compatible client and service
+# probe, so requests reuse pooled keep-alive connections
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it if needed.
+    
+    When the optional httpx-aiohttp package is installed, requests are sent
+    through its aiohttp transport, which has lower overhead than the default
+    httpx transport under concurrent load. Otherwise HTTP/2 is enabled when
+    the h2 package is installed, so concurrent TTS and STT requests to the
+    same host are multiplexed over one connection.
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        client_config = {
+            'timeout': httpx.Timeout(30.0, connect=5.0),
+            'limits': httpx.Limits(
+                max_keepalive_connections=32,
+                max_connections=64,
+                keepalive_expiry=60.0
+            ),
+        }
+        try:
+            from httpx_aiohttp import HttpxAiohttpClient
+            _http_client = HttpxAiohttpClient(**client_config)
+            logger.debug("Using aiohttp transport for HTTP requests")
+        except ImportError:
+            try:
+                import h2  # noqa: F401
+                client_config['http2'] = True
+            except ImportError:
+                pass
+            _http_client = httpx.AsyncClient(**client_config)
+    return _http_client
+
+
 def get_openai_clients(api_key: str, stt_base_url: str, tts_base_url: str) -> dict:
     """Initialize OpenAI clients for STT and TTS with connection pooling"""
-    # Configure timeouts and connection pooling
-    http_client_config = {
-        'timeout': httpx.Timeout(30.0, connect=5.0),
-        'limits': httpx.Limits(max_keepalive_connections=5, max_connections=10),
-    }
+    http_client = get_http_client()
     
     return {
         'stt': AsyncOpenAI(
             api_key=api_key,
             base_url=stt_base_url,
-            http_client=httpx.AsyncClient(**http_client_config)
+            http_client=http_client
         ),
         'tts': AsyncOpenAI(
             api_key=api_key,
             base_url=tts_base_url,
-            http_client=httpx.AsyncClient(**http_client_config)
+            http_client=http_client
+        )
+    }
+
+
+# Single worker so cache files are written one at a time and in order
+_cache_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="speech-cache")
+
+
+class AudioCache:
+    """Small in-memory LRU cache of decoded TTS audio.
+    
+    Entries are (samples, sample_rate) tuples holding float32 samples ready
+    for playback. The sample arrays are marked read-only because they are
+    shared between every playback of the same entry. Besides max_entries,
+    an optional max_bytes bounds the total size of the in-memory samples;
+    a single entry larger than max_bytes is not kept in memory.
+    
+    With a cache_dir, entries are also stored on disk as 16-bit PCM named by
+    a hash of their key, so repeated phrases survive a restart. Files are
+    written and pruned on a background thread, keeping disk I/O off the
+    event loop. The oldest files beyond max_files are pruned by
+    modification time, which is refreshed on every disk hit.
+    """
+    
+    def __init__(self, max_entries: int = 32, cache_dir: Optional[Path] = None, max_files: int = 256,
+                 max_bytes: Optional[int] = None):
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict = OrderedDict()
+        self._bytes = 0
+        self._last_write: Optional[Future] = None
+    
+    def get(self, key: Hashable) -> Optional[Tuple[np.ndarray, int]]:
+        """Return the cached entry for key, marking it most recently used"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        elif self.cache_dir is not None:
+            entry = self._load(key)
+            if entry is not None:
+                self._remember(key, *entry)
+        return entry
+    
+    def put(self, key: Hashable, samples: np.ndarray, sample_rate: int) -> None:
+        """Store decoded samples, evicting the least recently used entries"""
+        self._remember(key, samples, sample_rate)
+        if self.cache_dir is not None:
+            self._last_write = _cache_writer.submit(self._store, key, samples, sample_rate)
+    
+    def wait_for_writes(self) -> None:
+        """Block until queued disk writes have finished"""
+        if self._last_write is not None:
+            self._last_write.result()
+    
+    def clear(self) -> None:
+        """Remove all in-memory entries"""
+        self._entries.clear()
+        self._bytes = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def _remember(self, key: Hashable, samples: np.ndarray, sample_rate: int) -> None:
+        samples.flags.writeable = False
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= previous[0].nbytes
+        if self.max_bytes is not None and samples.nbytes > self.max_bytes:
+            return
+        self._entries[key] = (samples, sample_rate)
+        self._bytes += samples.nbytes
+        while len(self._entries) > self.max_entries or (
+            self.max_bytes is not None and self._bytes > self.max_bytes
+        ):
+            _, (evicted, _) = self._entries.popitem(last=False)
+            self._bytes -= evicted.nbytes
+    
+    def _path_for(self, key: Hashable) -> Path:
+        digest = hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+        return self.cache_dir / f"{digest}.npz"
+    
+    def _load(self, key: Hashable) -> Optional[Tuple[np.ndarray, int]]:
+        """Read an entry from disk, or None if it is missing or unreadable"""
+        path = self._path_for(key)
+        try:
+            with np.load(path) as data:
+                samples = data['samples'].astype(np.float32) / 32767.0
+                sample_rate = int(data['rate'])
+            os.utime(path)  # Refresh mtime for LRU pruning
+            return samples, sample_rate
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logger.debug(f"Ignoring unreadable speech cache file {path}: {e}")
+            return None
+    
+    def _store(self, key: Hashable, samples: np.ndarray, sample_rate: int) -> None:
+        """Write an entry to disk atomically and prune old files"""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            pcm = np.clip(np.round(samples * 32767.0), -32768, 32767).astype(np.int16)
+            fd, temp_name = tempfile.mkstemp(suffix=".tmp", dir=self.cache_dir)
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    np.savez(f, samples=pcm, rate=sample_rate)
+                os.replace(temp_name, self._path_for(key))
+            except BaseException:
+                os.unlink(temp_name)
+                raise
+            
+            files = list(self.cache_dir.glob("*.npz"))
+            if len(files) > self.max_files:
+                files.sort(key=lambda f: f.stat().st_mtime)
+                for stale in files[:len(files) - self.max_files]:
+                    stale.unlink(missing_ok=True)
+        except OSError as e:
+            logger.debug(f"Could not write speech cache file: {e}")
+
+
+def play_audio_samples(samples: np.ndarray, sample_rate: int) -> None:
+    """Play float32 samples through sounddevice and wait for completion.
+    
+    A short silence is prepended to prevent the start of the audio from
+    being clipped. Raises if sounddevice fails.
+    """
+    import sounddevice as sd
+    
+    channels = 1 if samples.ndim == 1 else samples.shape[1]
+    
+    # Force initialization before playing
+    sd.default.samplerate = sample_rate
+    sd.default.channels = channels
+    
+    # Add 100ms of silence at the beginning to prevent clipping
+    silence_samples = int(sample_rate * 0.1)
+    samples_with_buffer = np.zeros(
+        (silence_samples + len(samples),) + samples.shape[1:], dtype=np.float32
+    )
+    samples_with_buffer[silence_samples:] = samples
+    
+    sd.play(samples_with_buffer, sample_rate)
+    sd.wait()
+
+
+_WHITESPACE = re.compile(r'\s+')
+_TRAILING_PUNCTUATION = re.compile(r'[\s.,;:!?…]+$')
+
+
+def _speech_cache_key(tts_base_url: str, tts_model: str, tts_voice: str, instructions: Optional[str], text: str) -> tuple:
+    """Key identifying a TTS request in an AudioCache.
+    
+    Only differences that don't change the spoken audio are normalized:
+    case, runs of whitespace and trailing punctuation, so "Say  hello" and
+    "say hello!" share one entry while "-5" and "5" do not.
+    """
+    normalized = _TRAILING_PUNCTUATION.sub('', _WHITESPACE.sub(' ', text.lower()).strip())
+    return (tts_base_url, tts_model, tts_voice, instructions, normalized)
+
+
+def _segment_to_samples(audio: AudioSegment) -> np.ndarray:
+    """Convert a decoded pydub segment to float32 samples for sounddevice"""
+    samples = np.array(audio.get_array_of_samples())
+    if audio.channels == 2:
+        samples = samples.reshape((-1, 2))
+    return samples.astype(np.float32) / 32767.0
+
+
+# Syntheses currently running, keyed like the AudioCache, so concurrent
+# identical requests share one API call
+_inflight_syntheses: dict = {}
+
+
+async def synthesize_speech(
+    text: str,
+    openai_clients: dict,
+    tts_model: str,
+    tts_voice: str,
+    tts_base_url: str,
+    client_key: str = 'tts',
+    instructions: Optional[str] = None,
+    cache: Optional[AudioCache] = None
+) -> Tuple[np.ndarray, int]:
+    """Synthesize text with an OpenAI-compatible TTS API without playing it.
+    
+    Concurrent calls for the same request wait for the first one instead of
+    calling the API again.
+    
+    Args:
+        cache: Optional cache of decoded audio, checked before calling the
+            API and filled afterwards
+    
+    Returns:
+        Tuple of float32 samples and their sample rate
+    """
+    cache_key = _speech_cache_key(tts_base_url, tts_model, tts_voice, instructions, text)
+    if cache is not None:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+    
+    pending = _inflight_syntheses.get(cache_key)
+    if pending is not None:
+        logger.debug("Joining in-flight TTS synthesis")
+        return await asyncio.shield(pending)
+    
+    future = asyncio.get_running_loop().create_future()
+    # Mark failures as retrieved when nobody else joined
+    future.add_done_callback(lambda f: f.cancelled() or f.exception())
+    _inflight_syntheses[cache_key] = future
+    try:
+        samples, sample_rate = await _fetch_speech(
+            text, openai_clients, tts_model, tts_voice, client_key, instructions
         )
+        if cache is not None:
+            cache.put(cache_key, samples, sample_rate)
+        future.set_result((samples, sample_rate))
+        return samples, sample_rate
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    finally:
+        _inflight_syntheses.pop(cache_key, None)
+
+
+async def _fetch_speech(
+    text: str,
+    openai_clients: dict,
+    tts_model: str,
+    tts_voice: str,
+    client_key: str,
+    instructions: Optional[str]
+) -> Tuple[np.ndarray, int]:
+    """Request MP3 speech from the TTS API and decode it to float32 samples"""
+    request_params = {
+        "model": tts_model,
+        "input": text,
+        "voice": tts_voice,
+        "response_format": "mp3"
     }
+    if instructions and tts_model == "gpt-4o-mini-tts":
+        request_params["instructions"] = instructions
+    
+    async with openai_clients[client_key].audio.speech.with_streaming_response.create(
+        **request_params
+    ) as response:
+        response_content = await response.read()
+    
+    # Decoding spawns ffmpeg, so keep it off the event loop
+    audio = await asyncio.to_thread(AudioSegment.from_mp3, io.BytesIO(response_content))
+    samples = _segment_to_samples(audio)
+    return samples, audio.frame_rate
+
+
+_SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+')
+
+
+def split_sentences(text: str) -> list:
+    """Split text at sentence boundaries, dropping empty pieces"""
+    return [sentence for sentence in _SENTENCE_BOUNDARY.split(text.strip()) if sentence]
+
+
+async def speak_sentences(
+    sentences: list,
+    openai_clients: dict,
+    tts_model: str,
+    tts_voice: str,
+    tts_base_url: str,
+    client_key: str = 'tts',
+    instructions: Optional[str] = None,
+    cache: Optional[AudioCache] = None,
+    max_ahead: int = 2
+) -> tuple[bool, dict]:
+    """Synthesize sentences ahead of playback and play them in order.
+    
+    While one sentence plays, up to max_ahead following sentences are being
+    synthesized, so only the first sentence's synthesis is heard as delay.
+    
+    Returns:
+        tuple: (success: bool, metrics: dict) where 'generation' is the time
+        until the first sentence was ready
+    """
+    import time
+    
+    semaphore = asyncio.Semaphore(max_ahead)
+    
+    async def synthesize(sentence: str) -> Tuple[np.ndarray, int]:
+        async with semaphore:
+            return await synthesize_speech(
+                sentence, openai_clients, tts_model, tts_voice, tts_base_url,
+                client_key=client_key, instructions=instructions, cache=cache
+            )
+    
+    metrics = {}
+    start = time.perf_counter()
+    tasks = [asyncio.create_task(synthesize(sentence)) for sentence in sentences]
+    try:
+        for index, task in enumerate(tasks):
+            samples, sample_rate = await task
+            if index == 0:
+                metrics['generation'] = time.perf_counter() - start
+            await asyncio.to_thread(play_audio_samples, samples, sample_rate)
+        metrics['playback'] = time.perf_counter() - start - metrics.get('generation', 0.0)
+        logger.info(f"✓ TTS played {len(sentences)} sentences")
+        return True, metrics
+    except Exception as e:
+        logger.error(f"Sentence TTS failed: {e}")
+        return False, metrics
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+
+# OpenAI's "pcm" response format is raw 24kHz 16-bit little-endian mono
+PCM_SAMPLE_RATE = 24000
+# Audio buffered before playback starts, to ride out network jitter
+STREAM_JITTER_BYTES = int(PCM_SAMPLE_RATE * 0.04) * 2
+
+
+class PartialPlaybackError(RuntimeError):
+    """A TTS stream failed after some of its audio was already played."""
+
+
+async def stream_speech(
+    text: str,
+    openai_clients: dict,
+    tts_model: str,
+    tts_voice: str,
+    client_key: str = 'tts',
+    instructions: Optional[str] = None
+) -> Tuple[np.ndarray, float]:
+    """Synthesize text as raw PCM and play it while it downloads.
+    
+    Playback starts once STREAM_JITTER_BYTES have arrived instead of after
+    the whole response, so the first audio is heard after roughly one
+    network round trip.
+    
+    Returns:
+        Tuple of the played float32 samples (at PCM_SAMPLE_RATE) and the
+        seconds until playback started
+    
+    Raises:
+        PartialPlaybackError: If the stream fails after playback started,
+            so callers don't replay the message from the beginning
+    """
+    import time
+    import sounddevice as sd
+    
+    request_params = {
+        "model": tts_model,
+        "input": text,
+        "voice": tts_voice,
+        "response_format": "pcm"
+    }
+    if instructions and tts_model == "gpt-4o-mini-tts":
+        request_params["instructions"] = instructions
+    
+    start = time.perf_counter()
+    first_audio = 0.0
+    blocks = []
+    pending = b""
+    stream = None
+    
+    async def play(block: np.ndarray) -> None:
+        nonlocal stream, first_audio
+        if stream is None:
+            stream = sd.OutputStream(samplerate=PCM_SAMPLE_RATE, channels=1, dtype='int16')
+            stream.start()
+            first_audio = time.perf_counter() - start
+            # Same 100ms lead-in as play_audio_samples to avoid clipping
+            await asyncio.to_thread(stream.write, np.zeros((int(PCM_SAMPLE_RATE * 0.1), 1), dtype=np.int16))
+        blocks.append(block)
+        await asyncio.to_thread(stream.write, block.reshape(-1, 1))
+    
+    try:
+        async with openai_clients[client_key].audio.speech.with_streaming_response.create(
+            **request_params
+        ) as response:
+            async for data in response.iter_bytes(4096):
+                pending += data
+                if stream is None and len(pending) < STREAM_JITTER_BYTES:
+                    continue
+                # Keep an odd trailing byte until its partner sample arrives
+                usable = len(pending) - len(pending) % 2
+                if usable:
+                    await play(np.frombuffer(pending[:usable], dtype='<i2'))
+                    pending = pending[usable:]
+        
+        usable = len(pending) - len(pending) % 2
+        if usable:
+            await play(np.frombuffer(pending[:usable], dtype='<i2'))
+        if stream is None:
+            raise RuntimeError("No audio data received from TTS stream")
+        
+        # Stopping lets the queued buffers finish playing
+        await asyncio.to_thread(stream.stop)
+    except Exception as e:
+        if stream is not None:
+            raise PartialPlaybackError(f"TTS stream failed after playback started: {e}") from e
+        raise
+    finally:
+        if stream is not None:
+            stream.close()
+    
+    samples = np.concatenate(blocks).astype(np.float32) / 32767.0
+    return samples, first_audio
 
 
 async def text_to_speech_gemini(
@@ -110,11 +558,14 @@ async def text_to_speech_gemini(
         )
         
         metrics['generation'] = time.perf_counter() - generation_start
+        # The audio file belongs to the provider's TTS cache, so it is not deleted after playback
         logger.debug(f"Gemini TTS generated audio file: {audio_file_path}")
         
-        # Read the generated audio file
-        with open(audio_file_path, 'rb') as f:
-            response_content = f.read()
+        # Read the generated audio only when a copy of it has to be saved
+        response_content = None
+        if (debug and debug_dir) or (save_audio and audio_dir):
+            with open(audio_file_path, 'rb') as f:
+                response_content = f.read()
         
         # Save debug file if enabled
         if debug and debug_dir:
@@ -132,9 +583,11 @@ async def text_to_speech_gemini(
         playback_start = time.perf_counter()
         
         try:
-            # Load WAV audio directly
+            # Load WAV audio, reusing the bytes if they were already read
             logger.debug("Loading Gemini WAV audio...")
-            audio = AudioSegment.from_wav(audio_file_path)
+            audio = AudioSegment.from_wav(
+                io.BytesIO(response_content) if response_content is not None else audio_file_path
+            )
             logger.debug(f"Audio loaded - Duration: {len(audio)}ms, Channels: {audio.channels}, Frame rate: {audio.frame_rate}")
             
             # Convert to numpy array
@@ -148,49 +601,12 @@ async def text_to_speech_gemini(
             samples = samples.astype(np.float32) / 32767.0
             logger.debug(f"Audio converted to float32, shape: {samples.shape}")
             
-            # Try to ensure sounddevice doesn't interfere with stdout/stderr
             try:
-                import sounddevice as sd
-                import sys
-                
-                # Save current stdio state
-                original_stdin = sys.stdin
-                original_stdout = sys.stdout
-                original_stderr = sys.stderr
+                play_audio_samples(samples, audio.frame_rate)
                 
-                try:
-                    # Force initialization before playing
-                    sd.default.samplerate = audio.frame_rate
-                    sd.default.channels = audio.channels
-                    
-                    # Add 100ms of silence at the beginning to prevent clipping
-                    silence_duration = 0.1  # seconds
-                    silence_samples = int(audio.frame_rate * silence_duration)
-                    # Match the shape of the samples array exactly
-                    if samples.ndim == 1:
-                        silence = np.zeros(silence_samples, dtype=np.float32)
-                        samples_with_buffer = np.concatenate([silence, samples])
-                    else:
-                        silence = np.zeros((silence_samples, samples.shape[1]), dtype=np.float32)
-                        samples_with_buffer = np.vstack([silence, samples])
-                    
-                    sd.play(samples_with_buffer, audio.frame_rate)
-                    sd.wait()
-                    
-                    logger.info("✓ Gemini TTS played successfully")
-                    metrics['playback'] = time.perf_counter() - playback_start
-                    
-                    # Clean up the temporary file
-                    os.unlink(audio_file_path)
-                    return True, metrics
-                finally:
-                    # Restore stdio if it was changed
-                    if sys.stdin != original_stdin:
-                        sys.stdin = original_stdin
-                    if sys.stdout != original_stdout:
-                        sys.stdout = original_stdout
-                    if sys.stderr != original_stderr:
-                        sys.stderr = original_stderr
+                logger.info("✓ Gemini TTS played successfully")
+                metrics['playback'] = time.perf_counter() - playback_start
+                return True, metrics
             except Exception as sd_error:
                 logger.error(f"Gemini TTS Sounddevice playback failed: {sd_error}")
                 
@@ -204,7 +620,6 @@ async def text_to_speech_gemini(
                     pydub_play(audio)
                     logger.info("✓ Gemini TTS played successfully with PyDub")
                     metrics['playback'] = time.perf_counter() - playback_start
-                    os.unlink(audio_file_path)
                     return True, metrics
                 except Exception as pydub_error:
                     logger.error(f"PyDub playback failed: {pydub_error}")
@@ -215,12 +630,10 @@ async def text_to_speech_gemini(
                     import shutil
                     shutil.copy(audio_file_path, fallback_path)
                     logger.warning(f"Gemini audio saved to {fallback_path} for manual playback")
-                    os.unlink(audio_file_path)
                     metrics['playback'] = time.perf_counter() - playback_start
                     return False, metrics
                 except Exception as save_error:
                     logger.error(f"Failed to save Gemini audio file: {save_error}")
-                    os.unlink(audio_file_path)
                     metrics['playback'] = time.perf_counter() - playback_start
                     return False, metrics
             
@@ -228,10 +641,6 @@ async def text_to_speech_gemini(
             logger.error(f"Error playing Gemini audio: {e}")
             logger.error(f"Audio format - Channels: {audio.channels if 'audio' in locals() else 'unknown'}, Frame rate: {audio.frame_rate if 'audio' in locals() else 'unknown'}")
             logger.error(f"Samples shape: {samples.shape if 'samples' in locals() else 'unknown'}")
-            
-            # Clean up the temporary file
-            if audio_file_path and os.path.exists(audio_file_path):
-                os.unlink(audio_file_path)
             metrics['playback'] = time.perf_counter() - playback_start
             return False, metrics
                     
@@ -253,10 +662,20 @@ async def text_to_speech(
     audio_dir: Optional[Path] = None,
     client_key: str = 'tts',
     instructions: Optional[str] = None,
-    provider: Optional[str] = None
+    provider: Optional[str] = None,
+    cache: Optional[AudioCache] = None,
+    stream: bool = False
 ) -> tuple[bool, Optional[dict]]:
     """Convert text to speech and play it.
     
+    Args:
+        cache: Optional cache of decoded audio. Repeated requests with the
+            same normalized text, voice, model and instructions are played
+            from it without calling the TTS API.
+        stream: Request raw PCM and start playback as it arrives. Ignored
+            when debug or audio saving needs the encoded file, and falls
+            back to a full MP3 download if streaming fails.
+    
     Returns:
         tuple: (success: bool, metrics: dict) where metrics contains 'generation' and 'playback' times
     """
@@ -284,6 +703,47 @@ async def text_to_speech(
     
     metrics = {}
     
+    # Play straight from the cache when this exact request was decoded before
+    cache_key = None
+    if cache is not None:
+        cache_key = _speech_cache_key(tts_base_url, tts_model, tts_voice, instructions, text)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            samples, sample_rate = cached
+            logger.debug("TTS cache hit, skipping synthesis")
+            metrics['generation'] = 0.0
+            playback_start = time.perf_counter()
+            try:
+                play_audio_samples(samples, sample_rate)
+                logger.info("✓ TTS played successfully from cache")
+                return True, metrics
+            except Exception as sd_error:
+                logger.error(f"Sounddevice playback failed: {sd_error}")
+                return False, metrics
+            finally:
+                metrics['playback'] = time.perf_counter() - playback_start
+    
+    if stream and not debug and not save_audio:
+        stream_start = time.perf_counter()
+        try:
+            samples, first_audio = await stream_speech(
+                text, openai_clients, tts_model, tts_voice, client_key, instructions
+            )
+            metrics['generation'] = first_audio
+            metrics['playback'] = time.perf_counter() - stream_start - first_audio
+            if cache_key is not None:
+                cache.put(cache_key, samples, PCM_SAMPLE_RATE)
+            logger.info("✓ TTS streamed successfully")
+            return True, metrics
+        except PartialPlaybackError as stream_error:
+            # Part of the message was heard, so downloading and playing it
+            # again would repeat its beginning
+            logger.error(f"Streaming TTS failed: {stream_error}")
+            metrics['playback'] = time.perf_counter() - stream_start
+            return False, metrics
+        except Exception as stream_error:
+            logger.warning(f"Streaming TTS failed, falling back to full download: {stream_error}")
+    
     try:
         # Use MP3 format for bandwidth efficiency
         audio_format = "mp3"
@@ -342,15 +802,8 @@ async def text_to_speech(
                 audio = AudioSegment.from_mp3(tmp_file.name)
                 logger.debug(f"Audio loaded - Duration: {len(audio)}ms, Channels: {audio.channels}, Frame rate: {audio.frame_rate}")
                 
-                # Convert to numpy array
-                logger.debug("Converting to numpy array...")
-                samples = np.array(audio.get_array_of_samples())
-                if audio.channels == 2:
-                    samples = samples.reshape((-1, 2))
-                    logger.debug("Reshaped for stereo")
-                
-                # Convert to float32 for sounddevice
-                samples = samples.astype(np.float32) / 32767.0
+                # Convert to float32 numpy array for sounddevice
+                samples = _segment_to_samples(audio)
                 logger.debug(f"Audio converted to float32, shape: {samples.shape}")
                 
                 # Check audio devices
@@ -365,47 +818,15 @@ async def text_to_speech(
                 
                 logger.debug(f"Playing audio with sounddevice at {audio.frame_rate}Hz...")
                 
-                # Try to ensure sounddevice doesn't interfere with stdout/stderr
                 try:
-                    import sounddevice as sd
-                    import sys
-                    
-                    # Save current stdio state
-                    original_stdin = sys.stdin
-                    original_stdout = sys.stdout
-                    original_stderr = sys.stderr
+                    play_audio_samples(samples, audio.frame_rate)
+                    if cache_key is not None:
+                        cache.put(cache_key, samples, audio.frame_rate)
                     
-                    try:
-                        # Force initialization before playing
-                        sd.default.samplerate = audio.frame_rate
-                        sd.default.channels = audio.channels
-                        
-                        # Add 100ms of silence at the beginning to prevent clipping
-                        silence_duration = 0.1  # seconds
-                        silence_samples = int(audio.frame_rate * silence_duration)
-                        # Match the shape of the samples array exactly
-                        if samples.ndim == 1:
-                            silence = np.zeros(silence_samples, dtype=np.float32)
-                            samples_with_buffer = np.concatenate([silence, samples])
-                        else:
-                            silence = np.zeros((silence_samples, samples.shape[1]), dtype=np.float32)
-                            samples_with_buffer = np.vstack([silence, samples])
-                        
-                        sd.play(samples_with_buffer, audio.frame_rate)
-                        sd.wait()
-                        
-                        logger.info("✓ TTS played successfully")
-                        os.unlink(tmp_file.name)
-                        metrics['playback'] = time.perf_counter() - playback_start
-                        return True, metrics
-                    finally:
-                        # Restore stdio if it was changed
-                        if sys.stdin != original_stdin:
-                            sys.stdin = original_stdin
-                        if sys.stdout != original_stdout:
-                            sys.stdout = original_stdout
-                        if sys.stderr != original_stderr:
-                            sys.stderr = original_stderr
+                    logger.info("✓ TTS played successfully")
+                    os.unlink(tmp_file.name)
+                    metrics['playback'] = time.perf_counter() - playback_start
+                    return True, metrics
                 except Exception as sd_error:
                     logger.error(f"Sounddevice playback failed: {sd_error}")
                     
@@ -487,29 +908,31 @@ def generate_chime(frequencies: list, duration: float = 0.1, sample_rate: int =
     samples_per_tone = int(sample_rate * duration)
     fade_samples = int(sample_rate * 0.01)  # 10ms fade
     
-    all_samples = []
+    t = np.linspace(0, duration, samples_per_tone, False)
     
-    for freq in frequencies:
-        # Generate sine wave
-        t = np.linspace(0, duration, samples_per_tone, False)
-        tone = 0.3 * np.sin(2 * np.pi * freq * t)  # 0.3 amplitude for comfortable volume
-        
-        # Apply fade in/out to prevent clicks
-        fade_in = np.linspace(0, 1, fade_samples)
-        fade_out = np.linspace(1, 0, fade_samples)
-        
-        tone[:fade_samples] *= fade_in
-        tone[-fade_samples:] *= fade_out
-        
-        all_samples.append(tone)
+    # Fade in/out envelope shared by every tone to prevent clicks
+    envelope = np.ones(samples_per_tone)
+    envelope[:fade_samples] = np.linspace(0, 1, fade_samples)
+    envelope[-fade_samples:] = np.linspace(1, 0, fade_samples)
     
-    # Concatenate all tones
-    chime = np.concatenate(all_samples)
+    # Write each tone straight into its slice of a single buffer
+    chime = np.empty(samples_per_tone * len(frequencies))
+    for i, freq in enumerate(frequencies):
+        tone = chime[i * samples_per_tone:(i + 1) * samples_per_tone]
+        np.sin(2 * np.pi * freq * t, out=tone)
+        tone *= 0.3  # 0.3 amplitude for comfortable volume
+        tone *= envelope
     
     # Convert to 16-bit integer
-    chime_int16 = (chime * 32767).astype(np.int16)
-    
-    return chime_int16
+    chime *= 32767
+    return chime.astype(np.int16)
+
+
+def _play_and_wait(samples: np.ndarray, sample_rate: int) -> None:
+    """Play samples and block until playback finishes"""
+    import sounddevice as sd
+    sd.play(samples, sample_rate)
+    sd.wait()
 
 
 async def play_chime_start(sample_rate: int = 44100) -> bool:
@@ -519,10 +942,8 @@ async def play_chime_start(sample_rate: int = 44100) -> bool:
         True if chime played successfully, False otherwise
     """
     try:
-        import sounddevice as sd
         chime = generate_chime([800, 1000], duration=0.1, sample_rate=sample_rate)
-        sd.play(chime, sample_rate)
-        sd.wait()
+        await asyncio.to_thread(_play_and_wait, chime, sample_rate)
         return True
     except Exception as e:
         logger.debug(f"Could not play start chime: {e}")
@@ -536,10 +957,8 @@ async def play_chime_end(sample_rate: int = 44100) -> bool:
         True if chime played successfully, False otherwise
     """
     try:
-        import sounddevice as sd
         chime = generate_chime([1000, 800], duration=0.1, sample_rate=sample_rate)
-        sd.play(chime, sample_rate)
-        sd.wait()
+        await asyncio.to_thread(_play_and_wait, chime, sample_rate)
         return True
     except Exception as e:
         logger.debug(f"Could not play end chime: {e}")
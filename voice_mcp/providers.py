@@ -5,39 +5,176 @@ This module manages the configuration and selection of voice service providers,
 supporting both cloud and local STT/TTS services with transparent fallback.
 """
 
+import atexit
+import functools
+import hashlib
 import logging
 import os
+import shutil
 import tempfile
 import struct
-from typing import Dict, Optional, List, Any
+import time
+from typing import Dict, Optional, List, Any, Tuple
 from pathlib import Path
 import httpx
 import asyncio
 
 logger = logging.getLogger("voice-mcp")
 
+# On-disk cache of synthesized Gemini audio, keyed by request content
+TTS_CACHE_DIR = Path.home() / ".voice-mcp" / "tts_cache"
+TTS_CACHE_MAX_FILES = 512
+
+# Per-process staging directories for in-progress TTS writes, keyed by
+# cache directory and removed at exit so interrupted writes never linger
+_staging_dirs: Dict[Path, Path] = {}
+
+# Staging directories left by killed processes (atexit never ran) are
+# removed when their owner is gone or they are older than this
+STAGING_MAX_AGE = 24 * 60 * 60
+
+# How long a local provider probe result is trusted before re-probing
+PROVIDER_CACHE_TTL = 5.0
+
+# Gemini voices (named after celestial bodies and mythological names)
+GEMINI_VOICES = frozenset({
+    "Aoede", "Callisto", "Charon", "Deimos", "Echo", "Europa",
+    "Fenrir", "Ganymede", "Hera", "Io", "Kore", "Lunara",
+    "Minerva", "Naia", "Nova", "Oberon", "Phobos", "Quorra",
+    "Rhea", "Selene", "Titan", "Umbra", "Vega", "Whisper",
+    "Xara", "Yuki", "Zephyr", "Astra", "Cypher", "Delta"
+})
+GEMINI_VOICE_LIST = sorted(GEMINI_VOICES)
+
+# Gemini TTS models, shared by the registry and GeminiTTSProvider
+GEMINI_FLASH_MODEL = "gemini-2.5-flash-preview-tts"
+GEMINI_PRO_MODEL = "gemini-2.5-pro-preview-tts"
+GEMINI_MODELS = [GEMINI_FLASH_MODEL, GEMINI_PRO_MODEL]
+GEMINI_DEFAULT_MODEL = GEMINI_FLASH_MODEL
+GEMINI_DEFAULT_VOICE = "Zephyr"
+
+# Raw PCM format returned by Gemini TTS
+GEMINI_AUDIO_MIME_TYPE = "audio/L16;rate=24000"
+_DEFAULT_AUDIO_PARAMS = {"bits_per_sample": 16, "rate": 24000}
+
+# google-genai clients keyed by API key, shared across provider instances
+_genai_clients: Dict[str, Any] = {}
+
+
+def _process_exists(pid: int) -> bool:
+    """Check whether a process with this PID is running"""
+    if os.name == "nt":
+        # Signal 0 would terminate the process on Windows; rely on age there
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _reap_staging_dirs(parent: Path) -> None:
+    """
+    Remove staging directories abandoned by processes that were killed.
+    
+    Directories are named staging_<pid>_*; one is removed when its PID no
+    longer exists or it is older than STAGING_MAX_AGE, which also covers
+    PID reuse and directories without a PID in their name.
+    
+    Args:
+        parent: Directory holding the staging directories
+    """
+    now = time.time()
+    try:
+        candidates = list(parent.glob("staging_*"))
+    except OSError:
+        return
+    for path in candidates:
+        try:
+            pid_text = path.name.split("_")[1]
+            owner = int(pid_text) if pid_text.isdigit() else None
+            if owner == os.getpid():
+                continue
+            stale = now - path.stat().st_mtime > STAGING_MAX_AGE
+            if stale or owner is None or not _process_exists(owner):
+                logger.debug(f"Removing abandoned staging directory {path}")
+                shutil.rmtree(path, ignore_errors=True)
+        except (OSError, IndexError):
+            continue
+
+
+def _cache_key(*parts: str) -> str:
+    """
+    Hash request fields into a cache file name.
+    
+    Each field is length-prefixed, so a separator inside a prompt or text
+    can never make two different requests hash the same.
+    
+    Args:
+        parts: Fields identifying the request
+        
+    Returns:
+        Hex digest usable as a file name
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        data = part.encode()
+        digest.update(struct.pack("<Q", len(data)))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def _get_staging_dir(cache_dir: Path) -> Path:
+    """
+    Get this process's staging directory for writes into cache_dir.
+    
+    The directory sits next to the cache so finished files can be moved
+    into place with an atomic rename. The first call for a cache directory
+    also reaps directories left behind by processes that did not exit
+    cleanly.
+    
+    Args:
+        cache_dir: Cache directory the staged files are destined for
+        
+    Returns:
+        Path to the staging directory
+    """
+    staging_dir = _staging_dirs.get(cache_dir)
+    if staging_dir is None or not staging_dir.is_dir():
+        if staging_dir is None:
+            _reap_staging_dirs(cache_dir.parent)
+        staging_dir = Path(tempfile.mkdtemp(prefix=f"staging_{os.getpid()}_", dir=cache_dir.parent))
+        _staging_dirs[cache_dir] = staging_dir
+        atexit.register(shutil.rmtree, staging_dir, ignore_errors=True)
+    return staging_dir
+
 
 class GeminiTTSProvider:
     """Gemini TTS provider using Google AI Studio API."""
     
+    # WAV header for GEMINI_AUDIO_MIME_TYPE (16-bit, 24kHz, mono) with zero
+    # sizes; only ChunkSize and Subchunk2Size change between responses
+    _WAV_HEADER_TEMPLATE = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36, b"WAVE", b"fmt ", 16, 1, 1, 24000, 48000, 2, 16, b"data", 0
+    )
+    
     def __init__(self):
         self.api_key = os.environ.get("GEMINI_API_KEY")
         if not self.api_key:
             raise ValueError("GEMINI_API_KEY environment variable is required")
         
-        # Import here to avoid dependency issues if not using Gemini
-        try:
-            from google import genai
-            from google.genai import types
-            self.genai = genai
-            self.types = types
-        except ImportError:
-            raise ImportError("google-genai package is required for Gemini TTS. Install with: pip install google-genai")
-        
-        self.client = genai.Client(api_key=self.api_key)
-        self.model = os.environ.get("TTS_MODEL", "gemini-2.5-flash-preview-tts")
-        self.voice = os.environ.get("TTS_VOICE", "Zephyr")
+        # google-genai is imported and its client created on the first cache
+        # miss, so cache hits and metadata lookups never pay for it
+        self.genai = None
+        self.types = None
+        self.client = None
+        self.model = os.environ.get("TTS_MODEL", GEMINI_DEFAULT_MODEL)
+        self.voice = os.environ.get("TTS_VOICE", GEMINI_DEFAULT_VOICE)
         self.system_prompt = os.environ.get("GEMINI_SYSTEM_PROMPT", "Speak naturally and clearly.")
+        self.cache_dir = TTS_CACHE_DIR
     
     async def generate_speech(
         self, 
@@ -56,7 +193,8 @@ class GeminiTTSProvider:
             system_prompt: Custom system prompt (overrides default)
             
         Returns:
-            Path to generated audio file
+            Path to generated audio file. The file lives in the TTS cache
+            and must not be deleted by the caller.
         """
         try:
             # Use provided parameters or defaults
@@ -64,6 +202,19 @@ class GeminiTTSProvider:
             model_name = model or self.model
             prompt = system_prompt or self.system_prompt
             
+            # Serve repeated requests straight from the cache
+            cache_path = self.cache_dir / f"{_cache_key(model_name, voice_name, prompt, text)}.wav"
+            try:
+                # Refreshing the mtime for LRU pruning doubles as the existence
+                # check, so a file pruned in between is simply a miss
+                os.utime(cache_path)
+                logger.info(f"Gemini TTS cache hit: {cache_path}")
+                return cache_path
+            except FileNotFoundError:
+                pass
+            
+            self._ensure_client()
+            
             # Construct the full prompt with system instructions
             full_text = f"{prompt} {text}" if prompt else text
             
@@ -90,8 +241,67 @@ class GeminiTTSProvider:
                 ),
             )
             
-            # Generate audio stream
-            audio_chunks = []
+            # The google-genai stream is synchronous, so consume it in a
+            # worker thread to keep the event loop free for other requests
+            await asyncio.to_thread(
+                self._stream_to_wav, model_name, contents, config, cache_path
+            )
+            self._prune_cache()
+            
+            logger.info(f"Generated Gemini TTS audio: {cache_path}")
+            return cache_path
+            
+        except Exception as e:
+            logger.error(f"Gemini TTS generation failed: {e}")
+            raise
+    
+    def _ensure_client(self) -> None:
+        """Import google-genai and attach a shared client on first use."""
+        if self.client is not None:
+            return
+        
+        # Import here to avoid dependency issues if not using Gemini
+        try:
+            from google import genai
+            from google.genai import types
+        except ImportError:
+            raise ImportError("google-genai package is required for Gemini TTS. Install with: pip install google-genai")
+        
+        self.genai = genai
+        self.types = types
+        client = _genai_clients.get(self.api_key)
+        if client is None:
+            client = genai.Client(api_key=self.api_key)
+            _genai_clients[self.api_key] = client
+        self.client = client
+    
+    def _stream_to_wav(self, model_name: str, contents: list, config: Any, output_path: Path) -> None:
+        """
+        Consume the Gemini audio stream and write it to a WAV file.
+        
+        Audio chunks are streamed to a file in the process staging directory
+        behind a placeholder WAV header, which is patched once the total size
+        is known. The finished file is atomically moved to output_path.
+        
+        Args:
+            model_name: Gemini model to use
+            contents: Request contents
+            config: Generation config
+            output_path: Where to place the finished WAV file
+        """
+        mime_type = GEMINI_AUDIO_MIME_TYPE
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(
+            suffix='.tmp',
+            prefix='gemini_tts_',
+            dir=_get_staging_dir(output_path.parent)
+        )
+        temp_file = os.fdopen(fd, 'wb')
+        
+        try:
+            temp_file.write(self._build_wav_header(0, mime_type))
+            total_bytes = 0
+            
             for chunk in self.client.models.generate_content_stream(
                 model=model_name,
                 contents=contents,
@@ -106,56 +316,66 @@ class GeminiTTSProvider:
                 
                 part = chunk.candidates[0].content.parts[0]
                 if part.inline_data and part.inline_data.data:
-                    audio_chunks.append(part.inline_data.data)
+                    temp_file.write(part.inline_data.data)
+                    total_bytes += len(part.inline_data.data)
             
-            if not audio_chunks:
+            if not total_bytes:
                 raise RuntimeError("No audio data received from Gemini API")
             
-            # Combine all audio chunks
-            combined_audio = b''.join(audio_chunks)
-            
-            # Create temporary file for audio
-            temp_file = tempfile.NamedTemporaryFile(
-                delete=False, 
-                suffix='.wav',
-                prefix='gemini_tts_'
-            )
-            
-            # Convert to WAV format if needed
-            wav_data = self._convert_to_wav(combined_audio, "audio/L16;rate=24000")
-            temp_file.write(wav_data)
+            # Patch ChunkSize and Subchunk2Size
+            temp_file.seek(4)
+            temp_file.write(struct.pack("<I", 36 + total_bytes))
+            temp_file.seek(40)
+            temp_file.write(struct.pack("<I", total_bytes))
             temp_file.close()
-            
-            logger.info(f"Generated Gemini TTS audio: {temp_file.name}")
-            return Path(temp_file.name)
-            
-        except Exception as e:
-            logger.error(f"Gemini TTS generation failed: {e}")
+            os.replace(temp_name, output_path)
+        except BaseException:
+            temp_file.close()
+            os.unlink(temp_name)
             raise
     
-    def _convert_to_wav(self, audio_data: bytes, mime_type: str) -> bytes:
+    def _prune_cache(self) -> None:
+        """Delete the least recently used cache files beyond TTS_CACHE_MAX_FILES."""
+        try:
+            files = list(self.cache_dir.glob("*.wav"))
+            if len(files) <= TTS_CACHE_MAX_FILES:
+                return
+            
+            files.sort(key=lambda f: f.stat().st_mtime)
+            for stale in files[:len(files) - TTS_CACHE_MAX_FILES]:
+                stale.unlink(missing_ok=True)
+            logger.debug(f"Pruned {len(files) - TTS_CACHE_MAX_FILES} Gemini TTS cache files")
+        except OSError as e:
+            logger.debug(f"Gemini TTS cache pruning failed: {e}")
+    
+    def _build_wav_header(self, data_size: int, mime_type: str) -> bytes:
         """
-        Convert audio data to WAV format.
+        Build a 44-byte WAV header for raw PCM audio.
         
         Args:
-            audio_data: Raw audio data
+            data_size: Size of the audio data in bytes
             mime_type: MIME type of the audio data
             
         Returns:
-            WAV-formatted audio data
+            WAV header bytes
         """
+        # Fast path: patch the two size fields of the precomputed header
+        if mime_type == GEMINI_AUDIO_MIME_TYPE:
+            header = bytearray(self._WAV_HEADER_TEMPLATE)
+            struct.pack_into("<I", header, 4, 36 + data_size)
+            struct.pack_into("<I", header, 40, data_size)
+            return bytes(header)
+        
         parameters = self._parse_audio_mime_type(mime_type)
         bits_per_sample = parameters["bits_per_sample"]
         sample_rate = parameters["rate"]
         num_channels = 1
-        data_size = len(audio_data)
         bytes_per_sample = bits_per_sample // 8
         block_align = num_channels * bytes_per_sample
         byte_rate = sample_rate * block_align
         chunk_size = 36 + data_size  # 36 bytes for header fields before data chunk size
 
-        # Create WAV header
-        header = struct.pack(
+        return struct.pack(
             "<4sI4s4sIHHIIHH4sI",
             b"RIFF",          # ChunkID
             chunk_size,       # ChunkSize (total file size - 8 bytes)
@@ -171,18 +391,25 @@ class GeminiTTSProvider:
             b"data",          # Subchunk2ID
             data_size         # Subchunk2Size (size of audio data)
         )
-        return header + audio_data
 
-    def _parse_audio_mime_type(self, mime_type: str) -> Dict[str, int]:
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _parse_audio_mime_type(mime_type: str) -> Dict[str, int]:
         """
         Parse audio parameters from MIME type.
         
+        Results are memoized and shared between callers, so the returned
+        dictionary must not be modified.
+        
         Args:
             mime_type: Audio MIME type string
             
         Returns:
             Dictionary with bits_per_sample and rate
         """
+        if mime_type == GEMINI_AUDIO_MIME_TYPE:
+            return _DEFAULT_AUDIO_PARAMS
+        
         bits_per_sample = 16
         rate = 24000
 
@@ -206,20 +433,11 @@ class GeminiTTSProvider:
     
     def get_available_voices(self) -> list[str]:
         """Get list of available Gemini voices."""
-        return [
-            "Aoede", "Callisto", "Charon", "Deimos", "Echo", "Europa",
-            "Fenrir", "Ganymede", "Hera", "Io", "Kore", "Lunara",
-            "Minerva", "Naia", "Nova", "Oberon", "Phobos", "Quorra",
-            "Rhea", "Selene", "Titan", "Umbra", "Vega", "Whisper",
-            "Xara", "Yuki", "Zephyr", "Astra", "Cypher", "Delta"
-        ]
+        return GEMINI_VOICE_LIST
     
     def get_available_models(self) -> list[str]:
         """Get list of available Gemini models."""
-        return [
-            "gemini-2.5-flash-preview-tts",
-            "gemini-2.5-pro-preview-tts"
-        ]
+        return GEMINI_MODELS
     
     def is_available(self) -> bool:
         """Check if Gemini TTS is available."""
@@ -276,62 +494,113 @@ PROVIDERS = {
         "base_url": "https://generativelanguage.googleapis.com/v1beta",
         "local": False,
         "features": ["cloud", "multi-speaker", "emotions", "multi-language", "custom-prompts"],
-        "default_voice": "Zephyr",
-        "voices": [
-            "Aoede", "Callisto", "Charon", "Deimos", "Echo", "Europa",
-            "Fenrir", "Ganymede", "Hera", "Io", "Kore", "Lunara",
-            "Minerva", "Naia", "Nova", "Oberon", "Phobos", "Quorra",
-            "Rhea", "Selene", "Titan", "Umbra", "Vega", "Whisper",
-            "Xara", "Yuki", "Zephyr", "Astra", "Cypher", "Delta"
-        ],
-        "models": ["gemini-2.5-flash-preview-tts", "gemini-2.5-pro-preview-tts"],
-        "default_model": "gemini-2.5-flash-preview-tts",
+        "default_voice": GEMINI_DEFAULT_VOICE,
+        "voices": GEMINI_VOICE_LIST,
+        "models": GEMINI_MODELS,
+        "default_model": GEMINI_DEFAULT_MODEL,
     }
 }
 
 
+def _sorted_providers(provider_type: str, prefer_local: bool) -> List[Dict[str, Any]]:
+    """Order providers of a type by locality preference, then by id."""
+    candidates = [p for p in PROVIDERS.values() if p["type"] == provider_type]
+    return sorted(candidates, key=lambda p: (p.get("local", False) != prefer_local, p["id"]))
+
+
+# Provider preference orders are static, so compute them once
+_TTS_LOCAL_FIRST = _sorted_providers("tts", prefer_local=True)
+_TTS_CLOUD_FIRST = _sorted_providers("tts", prefer_local=False)
+_STT_LOCAL_FIRST = _sorted_providers("stt", prefer_local=True)
+_STT_CLOUD_FIRST = _sorted_providers("stt", prefer_local=False)
+
+
+# Shared HTTP client for provider probes, created on first use so that
+# repeated checks reuse keep-alive connections
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client used for provider availability probes."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=2.0,
+            limits=httpx.Limits(max_keepalive_connections=16)
+        )
+    return _http_client
+
+
+# Recent probe results: provider_id -> (checked_at, available)
+_availability_cache: Dict[str, Tuple[float, bool]] = {}
+
+
+def invalidate_provider_cache(provider_id: Optional[str] = None) -> None:
+    """Forget cached availability for one provider, or all if none given."""
+    if provider_id is None:
+        _availability_cache.clear()
+    else:
+        _availability_cache.pop(provider_id, None)
+
+
+def record_provider_health(provider_id: str, available: bool) -> None:
+    """Store a health check made elsewhere so the next availability check can reuse it."""
+    _availability_cache[provider_id] = (time.monotonic(), available)
+
+
 async def is_provider_available(provider_id: str, timeout: float = 2.0) -> bool:
     """Check if a provider is reachable via health check or basic connectivity."""
     provider = PROVIDERS.get(provider_id)
     if not provider:
         return False
     
-    base_url = provider["base_url"]
-    
     # Skip health check for cloud providers
     if not provider.get("local", False):
         # For cloud providers, we assume they're available
         # Real availability will be checked during actual API calls
         return True
     
+    # Reuse a recent probe result
+    cached = _availability_cache.get(provider_id)
+    if cached and time.monotonic() - cached[0] < PROVIDER_CACHE_TTL:
+        return cached[1]
+    
+    available = await _probe_provider(provider_id, provider["base_url"], timeout)
+    _availability_cache[provider_id] = (time.monotonic(), available)
+    return available
+
+
+async def _probe_provider(provider_id: str, base_url: str, timeout: float) -> bool:
+    """Probe a local provider's endpoints over HTTP."""
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            # Try OpenAI-compatible models endpoint first
-            try:
-                response = await client.get(f"{base_url}/models")
-                if response.status_code == 200:
-                    logger.debug(f"Provider {provider_id} is available (models endpoint)")
-                    return True
-            except:
-                pass
-            
-            # Try health endpoint as fallback
-            try:
-                response = await client.get(f"{base_url}/health")
-                if response.status_code == 200:
-                    logger.debug(f"Provider {provider_id} is available (health endpoint)")
-                    return True
-            except:
-                pass
-            
-            # Try base URL
-            try:
-                response = await client.get(base_url)
-                if response.status_code < 500:  # Any non-server-error response
-                    logger.debug(f"Provider {provider_id} is available (base URL)")
-                    return True
-            except:
-                pass
+        client = _get_http_client()
+        
+        # Try OpenAI-compatible models endpoint first
+        try:
+            response = await client.get(f"{base_url}/models", timeout=timeout)
+            if response.status_code == 200:
+                logger.debug(f"Provider {provider_id} is available (models endpoint)")
+                return True
+        except:
+            pass
+        
+        # Try health endpoint as fallback
+        try:
+            response = await client.get(f"{base_url}/health", timeout=timeout)
+            if response.status_code == 200:
+                logger.debug(f"Provider {provider_id} is available (health endpoint)")
+                return True
+        except:
+            pass
+        
+        # Try base URL
+        try:
+            response = await client.get(base_url, timeout=timeout)
+            if response.status_code < 500:  # Any non-server-error response
+                logger.debug(f"Provider {provider_id} is available (base URL)")
+                return True
+        except:
+            pass
                 
     except Exception as e:
         logger.debug(f"Provider {provider_id} not available: {e}")
@@ -341,18 +610,26 @@ async def is_provider_available(provider_id: str, timeout: float = 2.0) -> bool:
 
 async def get_available_providers(provider_type: Optional[str] = None) -> List[Dict[str, Any]]:
     """Get all available providers of a specific type."""
-    providers = []
+    # Filter by type if specified
+    candidates = [
+        provider for provider in PROVIDERS.values()
+        if not provider_type or provider["type"] == provider_type
+    ]
     
-    for provider_id, provider in PROVIDERS.items():
-        # Filter by type if specified
-        if provider_type and provider["type"] != provider_type:
-            continue
-            
-        # Check availability
-        if await is_provider_available(provider_id):
-            providers.append(provider)
+    # Probe all candidates concurrently
+    results = await asyncio.gather(
+        *(is_provider_available(provider["id"]) for provider in candidates)
+    )
     
-    return providers
+    return [provider for provider, available in zip(candidates, results) if available]
+
+
+async def _first_available(order: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Return the first provider in order that is available, probing lazily."""
+    for provider in order:
+        if await is_provider_available(provider["id"]):
+            return provider
+    return None
 
 
 async def get_tts_provider(prefer_local: bool = True, require_emotions: bool = False) -> Optional[Dict[str, Any]]:
@@ -372,21 +649,9 @@ async def get_tts_provider(prefer_local: bool = True, require_emotions: bool = F
             return PROVIDERS["openai"]
         return None
     
-    # Get available TTS providers
-    available = await get_available_providers("tts")
-    
-    if not available:
-        return None
-    
-    # Sort by preference
-    if prefer_local:
-        # Prefer local providers
-        available.sort(key=lambda p: (not p.get("local", False), p["id"]))
-    else:
-        # Prefer cloud providers
-        available.sort(key=lambda p: (p.get("local", False), p["id"]))
-    
-    return available[0]
+    # Return the first available provider in preference order
+    order = _TTS_LOCAL_FIRST if prefer_local else _TTS_CLOUD_FIRST
+    return await _first_available(order)
 
 
 async def get_stt_provider(prefer_local: bool = True) -> Optional[Dict[str, Any]]:
@@ -399,21 +664,9 @@ async def get_stt_provider(prefer_local: bool = True) -> Optional[Dict[str, Any]
     Returns:
         Provider configuration dict or None if no suitable provider found
     """
-    # Get available STT providers
-    available = await get_available_providers("stt")
-    
-    if not available:
-        return None
-    
-    # Sort by preference
-    if prefer_local:
-        # Prefer local providers
-        available.sort(key=lambda p: (not p.get("local", False), p["id"]))
-    else:
-        # Prefer cloud providers
-        available.sort(key=lambda p: (p.get("local", False), p["id"]))
-    
-    return available[0]
+    # Return the first available provider in preference order
+    order = _STT_LOCAL_FIRST if prefer_local else _STT_CLOUD_FIRST
+    return await _first_available(order)
 
 
 def get_provider_by_voice(voice: str) -> Optional[Dict[str, Any]]:
@@ -423,14 +676,7 @@ def get_provider_by_voice(voice: str) -> Optional[Dict[str, Any]]:
         return PROVIDERS.get("kokoro")
     
     # Gemini voices (named after celestial bodies and mythological names)
-    gemini_voices = [
-        "Aoede", "Callisto", "Charon", "Deimos", "Echo", "Europa",
-        "Fenrir", "Ganymede", "Hera", "Io", "Kore", "Lunara",
-        "Minerva", "Naia", "Nova", "Oberon", "Phobos", "Quorra",
-        "Rhea", "Selene", "Titan", "Umbra", "Vega", "Whisper",
-        "Xara", "Yuki", "Zephyr", "Astra", "Cypher", "Delta"
-    ]
-    if voice in gemini_voices:
+    if voice in GEMINI_VOICES:
         return PROVIDERS.get("gemini")
     
     # Default to OpenAI for standard voices
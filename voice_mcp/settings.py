@@ -3,6 +3,8 @@ Settings management for Voice MCP Server.
 Provides flexible configuration with granular control over individual parameters.
 """
 
+import asyncio
+import atexit
 import json
 import logging
 import os
@@ -11,9 +13,31 @@ from typing import Dict, Any, Optional, List
 from dataclasses import dataclass, asdict
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from voice_mcp.providers import GEMINI_DEFAULT_MODEL
+
 logger = logging.getLogger("voice-mcp")
 
-@dataclass
+# Delay before writing settings, so bursts of updates coalesce into one write
+SAVE_DEBOUNCE_SECONDS = 0.25
+
+def _encode_settings(data: Dict[str, Any]) -> bytes:
+    """Serialize settings as indented JSON, using orjson when installed."""
+    if orjson is None:
+        return json.dumps(data, indent=2).encode()
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+def _decode_settings(raw: bytes) -> Dict[str, Any]:
+    """Parse a settings file, using orjson when installed."""
+    if orjson is None:
+        return json.loads(raw)
+    return orjson.loads(raw)
+
+@dataclass(slots=True)
 class VoiceSettings:
     """User voice settings with granular control."""
     # TTS Settings
@@ -39,7 +63,7 @@ class VoiceSettings:
     
     # Gemini-specific Settings
     gemini_system_prompt: str = "Speak naturally and clearly."  # Custom prompt for Gemini TTS style
-    gemini_model: str = "gemini-2.5-flash-preview-tts"  # Gemini model (flash or pro)
+    gemini_model: str = GEMINI_DEFAULT_MODEL  # Gemini model (flash or pro)
     
     # Metadata
     last_updated: str = ""
@@ -52,44 +76,106 @@ class VoiceSettingsManager:
         self.settings_file = self.config_dir / "user_settings.json"
         self._ensure_config_dir()
         self._settings: Optional[VoiceSettings] = None
+        self._settings_mtime: Optional[int] = None
+        self._version = 0
+        self._dirty = False
+        self._save_handle: Optional[asyncio.TimerHandle] = None
+        self._save_loop: Optional[asyncio.AbstractEventLoop] = None
     
     def _ensure_config_dir(self):
         """Create config directory if it doesn't exist."""
         self.config_dir.mkdir(exist_ok=True)
     
+    def _file_mtime(self) -> Optional[int]:
+        """Modification time of the settings file in ns, or None if missing."""
+        try:
+            return self.settings_file.stat().st_mtime_ns
+        except OSError:
+            return None
+    
     def load_settings(self) -> VoiceSettings:
-        """Load user settings from disk."""
-        if self._settings:
+        """
+        Load user settings from disk.
+        
+        The parsed settings are kept in memory and the file is only read
+        again when its modification time changes, e.g. after a manual edit.
+        Pending unsaved changes always take precedence over the file.
+        """
+        mtime = self._file_mtime()
+        if self._settings and (self._dirty or mtime == self._settings_mtime):
             return self._settings
             
-        if not self.settings_file.exists():
+        if mtime is None:
             # Create default settings
             self._settings = VoiceSettings()
             self.save_settings()
             return self._settings
         
         try:
-            with open(self.settings_file, 'r') as f:
-                data = json.load(f)
+            data = _decode_settings(self.settings_file.read_bytes())
             
             self._settings = VoiceSettings(**data)
+            self._settings_mtime = mtime
+            self._version += 1
             return self._settings
             
         except Exception as e:
             logger.error(f"Failed to load settings: {e}, using defaults")
             self._settings = VoiceSettings()
+            # Don't parse the same broken file again on every call
+            self._settings_mtime = mtime
+            self._version += 1
             return self._settings
     
     def save_settings(self):
-        """Save current settings to disk."""
+        """
+        Save current settings to disk.
+        
+        Inside a running event loop the write is debounced by
+        SAVE_DEBOUNCE_SECONDS so that consecutive updates produce a single
+        write. Without a loop the settings are written immediately.
+        """
         if not self._settings:
             return
-            
+        
+        self._settings.last_updated = datetime.now().isoformat()
+        self._version += 1
+        self._dirty = True
+        
         try:
-            self._settings.last_updated = datetime.now().isoformat()
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()
+            return
+        
+        # A handle from a loop that has since ended (e.g. an earlier
+        # asyncio.run) will never fire, so schedule the write again
+        if self._save_handle is not None and self._save_loop is not loop:
+            self._save_handle.cancel()
+            self._save_handle = None
+        
+        if self._save_handle is None:
+            self._save_handle = loop.call_later(SAVE_DEBOUNCE_SECONDS, self.flush)
+            self._save_loop = loop
+    
+    def flush(self):
+        """Write pending settings changes to disk now."""
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+            self._save_handle = None
+            self._save_loop = None
+        
+        if not self._dirty or not self._settings:
+            return
             
-            with open(self.settings_file, 'w') as f:
-                json.dump(asdict(self._settings), f, indent=2)
+        try:
+            # Write to a temporary file and rename it into place so a crash
+            # mid-write never leaves a truncated settings file
+            tmp_file = self.settings_file.with_suffix('.tmp')
+            tmp_file.write_bytes(_encode_settings(asdict(self._settings)))
+            os.replace(tmp_file, self.settings_file)
+            self._settings_mtime = self._file_mtime()
+            self._dirty = False
                 
             logger.info("Settings saved successfully")
                 
@@ -109,54 +195,126 @@ class VoiceSettingsManager:
         self.apply_to_environment()
         return True
     
+    def update_settings(self, updates: Dict[str, Any]) -> bool:
+        """
+        Update several settings with a single save and environment apply.
+        
+        Nothing is changed if any key is not a known setting.
+        """
+        settings = self.load_settings()
+        
+        if not all(hasattr(settings, key) for key in updates):
+            return False
+        
+        for key, value in updates.items():
+            setattr(settings, key, value)
+        self._settings = settings
+        self.save_settings()
+        self.apply_to_environment()
+        return True
+    
+    def reset_settings(self):
+        """
+        Replace all settings with their defaults, saved and applied once.
+        
+        Unlike regular updates, a reset is written to disk immediately
+        rather than waiting for the debounce timer.
+        """
+        self._settings = VoiceSettings()
+        self.save_settings()
+        self.flush()
+        self.apply_to_environment()
+    
     def get_setting(self, key: str) -> Any:
         """Get a single setting value."""
-        settings = self.load_settings()
-        return getattr(settings, key, None)
+        return getattr(self.settings, key, None)
     
-    def apply_to_environment(self):
-        """Apply current settings to environment variables."""
-        settings = self.load_settings()
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever the current settings change."""
+        return self._version
+    
+    @property
+    def settings(self) -> VoiceSettings:
+        """
+        Current settings.
+        
+        Goes through load_settings, so the file is re-read after it was
+        edited by hand but not while a debounced save is pending.
+        """
+        return self.load_settings()
+    
+    def _environment_for(self, settings: VoiceSettings) -> Dict[str, Optional[str]]:
+        """
+        Build the environment variables implied by the given settings.
+        
+        Args:
+            settings: Settings to translate
+            
+        Returns:
+            Mapping of variable name to value, where None means unset
+        """
+        env: Dict[str, Optional[str]] = {}
         
         # TTS Configuration
         if settings.tts_provider == "kokoro":
-            os.environ['TTS_BASE_URL'] = "http://localhost:8880/v1"
-            os.environ['TTS_VOICE'] = settings.tts_voice
+            env['TTS_BASE_URL'] = "http://localhost:8880/v1"
         elif settings.tts_provider == "openai":
             # Unset local URL to use OpenAI
-            if 'TTS_BASE_URL' in os.environ:
-                del os.environ['TTS_BASE_URL']
-            os.environ['TTS_VOICE'] = settings.tts_voice
+            env['TTS_BASE_URL'] = None
         elif settings.tts_provider == "gemini":
             # Set Gemini-specific configuration
-            os.environ['TTS_BASE_URL'] = "https://generativelanguage.googleapis.com/v1beta"
-            os.environ['TTS_VOICE'] = settings.tts_voice
-            os.environ['TTS_MODEL'] = settings.gemini_model
-            os.environ['GEMINI_SYSTEM_PROMPT'] = settings.gemini_system_prompt
+            env['TTS_BASE_URL'] = "https://generativelanguage.googleapis.com/v1beta"
+            env['GEMINI_SYSTEM_PROMPT'] = settings.gemini_system_prompt
         
-        os.environ['TTS_MODEL'] = settings.tts_model
+        if settings.tts_provider in ("kokoro", "openai", "gemini"):
+            env['TTS_VOICE'] = settings.tts_voice
+        env['TTS_MODEL'] = settings.tts_model
         
         # STT Configuration
         if settings.stt_provider == "local":
-            os.environ['STT_BASE_URL'] = "http://localhost:2022/v1"
+            env['STT_BASE_URL'] = "http://localhost:2022/v1"
         elif settings.stt_provider == "openai":
             # Unset local URL to use OpenAI
-            if 'STT_BASE_URL' in os.environ:
-                del os.environ['STT_BASE_URL']
+            env['STT_BASE_URL'] = None
         
-        os.environ['STT_MODEL'] = settings.stt_model
+        env['STT_MODEL'] = settings.stt_model
         
         # Other settings
-        os.environ['VOICE_MCP_SILENCE_TIMEOUT'] = str(settings.silence_timeout)
-        os.environ['VOICE_MCP_AUDIO_FEEDBACK'] = settings.audio_feedback
-        os.environ['VOICE_ALLOW_EMOTIONS'] = str(settings.allow_emotions).lower()
-        os.environ['VOICE_MCP_AUTO_START_KOKORO'] = str(settings.auto_start_kokoro).lower()
-        os.environ['VOICE_MCP_PREFER_LOCAL'] = str(settings.prefer_local).lower()
+        env['VOICE_MCP_SILENCE_TIMEOUT'] = str(settings.silence_timeout)
+        env['VOICE_MCP_AUDIO_FEEDBACK'] = settings.audio_feedback
+        env['VOICE_ALLOW_EMOTIONS'] = str(settings.allow_emotions).lower()
+        env['VOICE_MCP_AUTO_START_KOKORO'] = str(settings.auto_start_kokoro).lower()
+        env['VOICE_MCP_PREFER_LOCAL'] = str(settings.prefer_local).lower()
+        
+        return env
+    
+    def apply_to_environment(self):
+        """Apply current settings to environment variables."""
+        settings = self.settings
+        
+        # Only touch variables whose value actually differs
+        changed = []
+        for key, value in self._environment_for(settings).items():
+            if os.environ.get(key) == value:
+                continue
+            if value is None:
+                del os.environ[key]
+            else:
+                os.environ[key] = value
+            changed.append(key)
+        
+        if not changed:
+            logger.debug("Settings already applied to environment")
+            return
         
         logger.info(f"Applied settings to environment: TTS={settings.tts_provider}, STT={settings.stt_provider}, Silence={settings.silence_timeout}s")
 
 # Global instance
 settings_manager = VoiceSettingsManager()
 
+# Write any debounced changes that are still pending at shutdown
+atexit.register(settings_manager.flush)
+
 # Auto-apply settings on import
 settings_manager.apply_to_environment()
\ No newline at end of file
@@ -1,19 +1,21 @@
 """Conversation tools for interactive voice interactions."""
 
 import asyncio
+import functools
+import io
 import logging
 import os
+import re
+import threading
 import time
-import traceback
-from typing import Optional, Literal
+import wave
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional, Literal
 from pathlib import Path
 
 import numpy as np
 import sounddevice as sd
-from scipy.io.wavfile import write
-from pydub import AudioSegment
 from openai import AsyncOpenAI
-import httpx
 
 from voice_mcp.server_new import mcp
 from voice_mcp.config import (
@@ -22,13 +24,17 @@ from voice_mcp.config import (
     CHANNELS,
     DEBUG,
     DEBUG_DIR,
+    PROFILE_MEMORY,
     SAVE_AUDIO,
     AUDIO_DIR,
+    SPEECH_CACHE_DIR,
+    SPEECH_CACHE_ENABLED,
     OPENAI_API_KEY,
     STT_BASE_URL,
     TTS_BASE_URL,
     TTS_VOICE,
     TTS_MODEL,
+    TTS_STREAMING,
     STT_MODEL,
     OPENAI_TTS_BASE_URL,
     KOKORO_TTS_BASE_URL,
@@ -47,16 +53,25 @@ from voice_mcp.config import (
     HTTP_CLIENT_CONFIG
 )
 import voice_mcp.config
+from voice_mcp.settings import settings_manager
 from voice_mcp.providers import (
     PROVIDERS,
     get_provider_by_voice,
     get_tts_provider,
     get_stt_provider,
     is_provider_available,
-    get_provider_display_status
+    get_provider_display_status,
+    invalidate_provider_cache,
+    record_provider_health
 )
 from voice_mcp.core import (
+    AudioCache,
+    get_http_client,
     get_openai_clients,
+    play_audio_samples,
+    speak_sentences,
+    split_sentences,
+    synthesize_speech,
     text_to_speech,
     cleanup as cleanup_clients,
     save_debug_file,
@@ -65,8 +80,26 @@ from voice_mcp.core import (
     play_chime_end
 )
 
+# resource is Unix-only, so it is imported only when memory profiling is on
+if PROFILE_MEMORY:
+    import resource
+
 logger = logging.getLogger("voice-mcp")
 
+# Decoded audio for the spoken "listening"/"finished" feedback, which is the
+# same handful of phrases on every turn. These persist to disk so they are
+# not synthesized again after a restart.
+_feedback_cache = AudioCache(
+    max_entries=32,
+    cache_dir=SPEECH_CACHE_DIR if SPEECH_CACHE_ENABLED else None
+)
+
+# Decoded audio for messages spoken by converse. Agents often repeat the
+# same short prompts; the byte bound (about three minutes of 24kHz float32
+# audio) keeps a few long messages from pinning a lot of memory. Messages
+# can be private, so they are only kept in memory.
+_speech_cache = AudioCache(max_entries=40, max_bytes=16 * 1024 * 1024)
+
 # Initialize OpenAI clients with provider-specific TTS clients
 openai_clients = get_openai_clients(OPENAI_API_KEY, STT_BASE_URL, TTS_BASE_URL)
 
@@ -75,10 +108,7 @@ openai_clients = get_openai_clients(OPENAI_API_KEY, STT_BASE_URL, TTS_BASE_URL)
 openai_clients['tts_openai'] = AsyncOpenAI(
     api_key=OPENAI_API_KEY,
     base_url=OPENAI_TTS_BASE_URL,
-    http_client=httpx.AsyncClient(
-        timeout=httpx.Timeout(30.0, connect=5.0),
-        limits=httpx.Limits(max_keepalive_connections=5, max_connections=10)
-    )
+    http_client=get_http_client()
 )
 
 # Create Kokoro TTS client if different from default
@@ -86,13 +116,81 @@ if KOKORO_TTS_BASE_URL != TTS_BASE_URL:
     openai_clients['tts_kokoro'] = AsyncOpenAI(
         api_key=OPENAI_API_KEY,
         base_url=KOKORO_TTS_BASE_URL,
-        http_client=httpx.AsyncClient(
-            timeout=httpx.Timeout(30.0, connect=5.0),
-            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10)
-        )
+        http_client=get_http_client()
     )
 
 
+# The user's words in a converse result, and the phrases that end voice_chat
+_VOICE_RESPONSE_RE = re.compile(r"Voice response:\s*([^|]*)")
+_EXIT_PHRASE_RE = re.compile(r"goodbye|exit|end chat|stop|quit", re.IGNORECASE)
+
+
+@dataclass(slots=True)
+class TurnTimings:
+    """Stage durations of one local converse turn, in seconds"""
+    tts_total: float = 0.0
+    record: float = 0.0
+    stt: float = 0.0
+    # Only reported when the TTS path returned sub-metrics
+    tts_gen: Optional[float] = None
+    tts_play: Optional[float] = None
+    
+    def summary(self) -> str:
+        """Format the timings for the converse result"""
+        total = self.tts_total + self.record + self.stt
+        prefix = ""
+        if self.tts_gen is not None:
+            prefix = f"tts_gen {self.tts_gen:.1f}s, tts_play {self.tts_play:.1f}s, "
+        return (
+            f"{prefix}tts_total {self.tts_total:.1f}s, record {self.record:.1f}s, "
+            f"stt {self.stt:.1f}s, total {total:.1f}s"
+        )
+
+
+# Strong references to fire-and-forget tasks so they are not garbage collected
+_background_tasks: set = set()
+
+
+def _run_in_background(coro) -> asyncio.Task:
+    """Schedule a fire-and-forget coroutine, keeping it referenced until done"""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+async def _warm_connection(name: str, client: AsyncOpenAI) -> None:
+    """
+    Open a keep-alive connection to a client's API with a cheap request.
+    
+    A HEAD request through the shared HTTP client leaves a pooled connection
+    for the OpenAI client to reuse. It skips the OpenAI client's retries and
+    response parsing, and any status (even 401 or 404) means the connection
+    is up.
+    """
+    url = f"{str(client.base_url).rstrip('/')}/models"
+    try:
+        await get_http_client().head(url, timeout=5.0)
+        logger.debug(f"Warmed {name} connection to {client.base_url}")
+    except Exception as e:
+        logger.debug(f"Could not warm {name} connection: {e}")
+
+
+def warm_connections() -> None:
+    """Warm one connection per distinct host in the background.
+    
+    The first TTS or STT request then reuses a pooled connection instead of
+    paying for the TCP and TLS handshake.
+    """
+    seen_hosts = set()
+    for name, client in openai_clients.items():
+        host = (client.base_url.scheme, client.base_url.host, client.base_url.port)
+        if host in seen_hosts:
+            continue
+        seen_hosts.add(host)
+        _run_in_background(_warm_connection(name, client))
+
+
 async def startup_initialization():
     """Initialize services on startup based on configuration"""
     if voice_mcp.config._startup_initialized:
@@ -101,21 +199,26 @@ async def startup_initialization():
     voice_mcp.config._startup_initialized = True
     logger.info("Running startup initialization...")
     
+    warm_connections()
+    
     # Check if we should auto-start Kokoro
     auto_start_kokoro = os.getenv("VOICE_MCP_AUTO_START_KOKORO", "").lower() in ("true", "1", "yes", "on")
     if auto_start_kokoro:
         try:
             # Check if Kokoro is already running
-            async with httpx.AsyncClient(timeout=3.0) as client:
-                base_url = KOKORO_TTS_BASE_URL.rstrip('/').removesuffix('/v1')
-                health_url = f"{base_url}/health"
-                response = await client.get(health_url)
-                
-                if response.status_code == 200:
-                    logger.info("Kokoro TTS is already running externally")
-                else:
-                    raise Exception("Not running")
-        except:
+            base_url = KOKORO_TTS_BASE_URL.rstrip('/').removesuffix('/v1')
+            health_url = f"{base_url}/health"
+            response = await get_http_client().get(health_url, timeout=3.0)
+            kokoro_running = response.status_code == 200
+        except Exception:
+            kokoro_running = False
+        
+        # Share the result so the first TTS config lookup skips its own probe
+        record_provider_health("kokoro", kokoro_running)
+        
+        if kokoro_running:
+            logger.info("Kokoro TTS is already running externally")
+        else:
             # Kokoro is not running, start it
             logger.info("Auto-starting Kokoro TTS service...")
             try:
@@ -137,6 +240,7 @@ async def startup_initialization():
                     # Verify it started
                     if process.poll() is None:
                         logger.info(f"✓ Kokoro TTS started successfully (PID: {process.pid})")
+                        invalidate_provider_cache("kokoro")
                     else:
                         logger.error("Failed to start Kokoro TTS")
             except Exception as e:
@@ -150,9 +254,7 @@ async def get_tts_config(provider: Optional[str] = None, voice: Optional[str] =
     """Get TTS configuration based on provider selection"""
     # Load user settings if parameters not provided
     if provider is None or voice is None or model is None:
-        from voice_mcp.settings import VoiceSettingsManager
-        settings_manager = VoiceSettingsManager()
-        user_settings = settings_manager.load_settings()
+        user_settings = settings_manager.settings
         
         # Use saved settings as defaults
         if provider is None:
@@ -190,15 +292,35 @@ async def get_tts_config(provider: Optional[str] = None, voice: Optional[str] =
         else:
             provider = "openai"
     
-    # Validate instructions usage
+    # Warnings are logged here rather than in the memoized resolver, so a
+    # misconfiguration is reported on every turn and not just the first
     if instructions and model not in ["gpt-4o-mini-tts"]:
         logger.warning(f"Instructions parameter is only supported with gpt-4o-mini-tts model, ignoring for model: {model}")
+    if provider not in PROVIDERS:
+        logger.warning(f"Unknown provider: {provider}, falling back to OpenAI")
+    
+    config = dict(_resolve_tts_config(provider, voice, model, instructions))
+    if config['provider'] == 'openai':
+        logger.debug(f"OpenAI TTS config: client_key={config['client_key']}, available_clients={list(openai_clients.keys())}")
+    return config
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_tts_config(provider: str, voice: Optional[str], model: Optional[str], instructions: Optional[str]) -> dict:
+    """Build the TTS configuration for a chosen provider.
+    
+    The result only depends on the arguments and on configuration fixed at
+    startup, so it is memoized; it logs nothing, and get_tts_config reports
+    ignored instructions and unknown providers. Callers receive a copy from
+    get_tts_config.
+    """
+    # Instructions are only supported by gpt-4o-mini-tts
+    if instructions and model not in ["gpt-4o-mini-tts"]:
         instructions = None
     
     # Get provider info from registry
     provider_info = PROVIDERS.get(provider)
     if not provider_info:
-        logger.warning(f"Unknown provider: {provider}, falling back to OpenAI")
         provider = "openai"
         provider_info = PROVIDERS["openai"]
     
@@ -226,7 +348,6 @@ async def get_tts_config(provider: Optional[str] = None, voice: Optional[str] =
     else:  # openai
         # Use openai-specific client if available, otherwise use default
         client_key = 'tts_openai' if 'tts_openai' in openai_clients else 'tts'
-        logger.debug(f"OpenAI TTS config: client_key={client_key}, available_clients={list(openai_clients.keys())}")
         return {
             'client_key': client_key,
             'base_url': provider_info.get("base_url", OPENAI_TTS_BASE_URL),
@@ -271,6 +392,24 @@ async def get_stt_config(provider: Optional[str] = None):
     }
 
 
+@functools.lru_cache(maxsize=32)
+def _emotion_decision(tts_model: Optional[str], tts_provider: Optional[str]) -> tuple:
+    """
+    Decide how an emotion request is handled, without logging.
+    
+    The decision depends only on the arguments and ALLOW_EMOTIONS, which is
+    read at startup, so it is memoized across turns.
+    
+    Returns:
+        Tuple of (keep the instructions, switching to OpenAI for them)
+    """
+    if tts_model != "gpt-4o-mini-tts":
+        return True, False
+    if not ALLOW_EMOTIONS:
+        return False, False
+    return True, tts_provider != "openai"
+
+
 def validate_emotion_request(tts_model: Optional[str], tts_instructions: Optional[str], tts_provider: Optional[str]) -> Optional[str]:
     """
     Validate if emotional TTS is allowed and appropriate.
@@ -280,121 +419,162 @@ def validate_emotion_request(tts_model: Optional[str], tts_instructions: Optiona
     if not tts_instructions:
         return tts_instructions
     
-    # Check if this is an emotion-capable model request
-    if tts_model == "gpt-4o-mini-tts":
-        if not ALLOW_EMOTIONS:
-            logger.warning("Emotional TTS requested but VOICE_ALLOW_EMOTIONS not enabled")
-            return None  # Strip emotion instructions
-        
-        # Log provider switch if needed
-        if tts_provider != "openai":
-            logger.info("Switching to OpenAI for emotional speech support")
+    keep, switch_provider = _emotion_decision(tts_model, tts_provider)
+    if not keep:
+        logger.warning("Emotional TTS requested but VOICE_ALLOW_EMOTIONS not enabled")
+        return None  # Strip emotion instructions
+    
+    # Log provider switch if needed
+    if switch_provider:
+        logger.info("Switching to OpenAI for emotional speech support")
     
     return tts_instructions
 
 
-async def speech_to_text(audio_data: np.ndarray, save_audio: bool = False, audio_dir: Optional[Path] = None) -> Optional[str]:
-    """Convert audio to text"""
+def encode_stt_upload(audio_data: np.ndarray, wav_bytes: bytes) -> tuple:
+    """
+    Pick the upload encoding for a recording.
+    
+    OpenAI accepts FLAC, which is roughly half the size of WAV and is encoded
+    in-process by libsndfile. Local Whisper servers may only accept WAV, and
+    the WAV bytes are also used when soundfile is not installed.
+    
+    Args:
+        audio_data: int16 mono samples at SAMPLE_RATE
+        wav_bytes: The same recording already encoded as WAV
+        
+    Returns:
+        Tuple of (filename, encoded bytes)
+    """
+    if "openai.com" not in STT_BASE_URL:
+        return "audio.wav", wav_bytes
+    
+    try:
+        import soundfile
+    except (ImportError, OSError):
+        return "audio.wav", wav_bytes
+    
+    flac_buffer = io.BytesIO()
+    soundfile.write(flac_buffer, audio_data, SAMPLE_RATE, format='FLAC', subtype='PCM_16')
+    return "audio.flac", flac_buffer.getvalue()
+
+
+async def speech_to_text(audio_data: np.ndarray, save_audio: bool = False, audio_dir: Optional[Path] = None,
+                         speculative: bool = False) -> Optional[str]:
+    """Convert audio to text
+    
+    Args:
+        audio_data: Recorded int16 samples
+        save_audio: Save the uploaded audio to audio_dir
+        audio_dir: Directory for saved audio
+        speculative: The recording may still continue, so the debug and
+            saved audio files are not written for this attempt
+    """
     logger.info(f"STT: Converting speech to text, audio data shape: {audio_data.shape}")
     if DEBUG:
         logger.debug(f"STT config - Model: {STT_MODEL}, Base URL: {STT_BASE_URL}")
         logger.debug(f"Audio stats - Min: {audio_data.min()}, Max: {audio_data.max()}, Mean: {audio_data.mean():.2f}")
     
-    wav_file = None
-    mp3_file = None
+    # Encode the recording as WAV in memory. The STT endpoints accept WAV
+    # directly, so there is no temp file and no ffmpeg transcode to MP3.
+    wav_buffer = io.BytesIO()
+    with wave.open(wav_buffer, 'wb') as wav:
+        wav.setnchannels(CHANNELS)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        wav.writeframes(audio_data.astype(np.int16, copy=False).tobytes())
+    wav_bytes = wav_buffer.getvalue()
+    
+    # Save debug file for original recording
+    if DEBUG and not speculative:
+        debug_path = save_debug_file(wav_bytes, "stt-input", "wav", DEBUG_DIR, DEBUG)
+        if debug_path:
+            logger.info(f"STT debug recording saved to: {debug_path}")
+    
+    # Save audio file if audio saving is enabled
+    if save_audio and audio_dir and not speculative:
+        audio_path = save_debug_file(wav_bytes, "stt", "wav", audio_dir, True)
+        if audio_path:
+            logger.info(f"STT audio saved to: {audio_path}")
+    
+    upload_name, upload_bytes = encode_stt_upload(audio_data, wav_bytes)
+    logger.debug(f"Uploading {len(upload_bytes)} bytes ({upload_name}) to STT API...")
+    
     try:
-        import tempfile
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as wav_file_obj:
-            wav_file = wav_file_obj.name
-            logger.debug(f"Writing audio to WAV file: {wav_file}")
-            write(wav_file, SAMPLE_RATE, audio_data)
-        
-            # Save debug file for original recording
-            if DEBUG:
-                try:
-                    with open(wav_file, 'rb') as f:
-                        debug_path = save_debug_file(f.read(), "stt-input", "wav", DEBUG_DIR, DEBUG)
-                        if debug_path:
-                            logger.info(f"STT debug recording saved to: {debug_path}")
-                except Exception as e:
-                    logger.error(f"Failed to save debug WAV: {e}")
-            
-            # Save audio file if audio saving is enabled
-            if save_audio and audio_dir:
-                try:
-                    with open(wav_file, 'rb') as f:
-                        audio_path = save_debug_file(f.read(), "stt", "wav", audio_dir, True)
-                        if audio_path:
-                            logger.info(f"STT audio saved to: {audio_path}")
-                except Exception as e:
-                    logger.error(f"Failed to save audio WAV: {e}")
+        transcription = await openai_clients['stt'].audio.transcriptions.create(
+            model=STT_MODEL,
+            file=(upload_name, upload_bytes),
+            response_format="text"
+        )
         
-        try:
-            # Convert WAV to MP3 for smaller upload
-            logger.debug("Converting WAV to MP3 for upload...")
-            audio = AudioSegment.from_wav(wav_file)
-            logger.debug(f"Audio loaded - Duration: {len(audio)}ms, Channels: {audio.channels}, Frame rate: {audio.frame_rate}")
-            
-            with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as mp3_file_obj:
-                mp3_file = mp3_file_obj.name
-                audio.export(mp3_file, format="mp3", bitrate="64k")
-                upload_file = mp3_file
-                logger.debug(f"MP3 created for STT upload: {upload_file}")
-            
-            # Save debug file for upload version
-            if DEBUG:
-                try:
-                    with open(upload_file, 'rb') as f:
-                        debug_path = save_debug_file(f.read(), "stt-upload", "mp3", DEBUG_DIR, DEBUG)
-                        if debug_path:
-                            logger.info(f"Upload audio saved to: {debug_path}")
-                except Exception as e:
-                    logger.error(f"Failed to save debug MP3: {e}")
-            
-            # Get file size for logging
-            file_size = os.path.getsize(upload_file)
-            logger.debug(f"Uploading {file_size} bytes to STT API...")
-            
-            with open(upload_file, 'rb') as audio_file:
-                # Use async context manager if available, otherwise use regular create
-                transcription = await openai_clients['stt'].audio.transcriptions.create(
-                    model=STT_MODEL,
-                    file=audio_file,
-                    response_format="text"
-                )
-                
-                logger.debug(f"STT API response type: {type(transcription)}")
-                text = transcription.strip() if isinstance(transcription, str) else transcription.text.strip()
+        logger.debug(f"STT API response type: {type(transcription)}")
+        text = transcription.strip() if isinstance(transcription, str) else transcription.text.strip()
+        
+        if text:
+            logger.info(f"✓ STT result: '{text}'")
+            return text
+        else:
+            logger.warning("STT returned empty text")
+            return None
                 
-                if text:
-                    logger.info(f"✓ STT result: '{text}'")
-                    return text
-                else:
-                    logger.warning("STT returned empty text")
-                    return None
-                        
+    except Exception as e:
+        logger.error(f"STT failed: {e}")
+        logger.error(f"STT config when error occurred - Model: {STT_MODEL}, Base URL: {STT_BASE_URL}")
+        if hasattr(e, 'response'):
+            logger.error(f"HTTP status: {e.response.status_code if hasattr(e.response, 'status_code') else 'unknown'}")
+            logger.error(f"Response text: {e.response.text if hasattr(e.response, 'text') else 'unknown'}")
+        return None
+
+
+async def _synthesize_feedback(text: str, openai_clients: dict, style: str = "whisper"):
+    """Synthesize a spoken feedback word, served from the feedback cache when possible"""
+    # Determine text and instructions based on style
+    if style == "shout":
+        feedback_text = text.upper()  # Convert to uppercase for emphasis
+        instructions = "SHOUT this word loudly and enthusiastically!" if text == "listening" else "SHOUT this word loudly and triumphantly!"
+    else:  # whisper is default
+        feedback_text = text.lower()
+        instructions = "Whisper this word very softly and gently, almost inaudibly"
+    
+    # Use OpenAI's TTS with style-specific instructions
+    return await synthesize_speech(
+        text=feedback_text,
+        openai_clients=openai_clients,
+        tts_model=AUDIO_FEEDBACK_MODEL,
+        tts_voice=AUDIO_FEEDBACK_VOICE,
+        tts_base_url=TTS_BASE_URL,
+        client_key='tts',
+        instructions=instructions,
+        cache=_feedback_cache
+    )
+
+
+def prewarm_feedback(openai_clients: dict, enabled: Optional[bool] = None, style: str = "whisper", feedback_type: Optional[str] = None) -> None:
+    """
+    Synthesize the spoken "listening" and "finished" feedback in the background.
+    
+    Called while the message is being spoken, so the feedback is already in
+    the cache (or joins the running synthesis) when it is played.
+    
+    Args:
+        openai_clients: OpenAI client instances
+        enabled: Override global audio feedback setting
+        style: Audio style - "whisper" (default) or "shout"
+        feedback_type: Override global feedback type ("chime", "voice", "both", "none")
+    """
+    if enabled is False or (enabled is None and not AUDIO_FEEDBACK_ENABLED):
+        return
+    if (feedback_type or AUDIO_FEEDBACK_TYPE) not in ("voice", "both"):
+        return
+    
+    async def warm(text: str) -> None:
+        try:
+            await _synthesize_feedback(text, openai_clients, style)
         except Exception as e:
-            logger.error(f"STT failed: {e}")
-            logger.error(f"STT config when error occurred - Model: {STT_MODEL}, Base URL: {STT_BASE_URL}")
-            if hasattr(e, 'response'):
-                logger.error(f"HTTP status: {e.response.status_code if hasattr(e.response, 'status_code') else 'unknown'}")
-                logger.error(f"Response text: {e.response.text if hasattr(e.response, 'text') else 'unknown'}")
-            return None
-    finally:
-        # Clean up temporary files
-        if wav_file and os.path.exists(wav_file):
-            try:
-                os.unlink(wav_file)
-                logger.debug(f"Cleaned up WAV file: {wav_file}")
-            except Exception as e:
-                logger.error(f"Failed to clean up WAV file: {e}")
-        
-        if mp3_file and os.path.exists(mp3_file):
-            try:
-                os.unlink(mp3_file)
-                logger.debug(f"Cleaned up MP3 file: {mp3_file}")
-            except Exception as e:
-                logger.error(f"Failed to clean up MP3 file: {e}")
+            logger.debug(f"Could not prewarm {text} feedback: {e}")
+    
+    for text in ("listening", "finished"):
+        _run_in_background(warm(text))
 
 
 async def play_audio_feedback(text: str, openai_clients: dict, enabled: Optional[bool] = None, style: str = "whisper", feedback_type: Optional[str] = None) -> None:
@@ -417,7 +597,12 @@ async def play_audio_feedback(text: str, openai_clients: dict, enabled: Optional
     if feedback_type == "none":
         return
     
+    voice_task = None
     try:
+        # Start synthesizing the voice feedback first so it overlaps the chime
+        if feedback_type in ("voice", "both"):
+            voice_task = asyncio.create_task(_synthesize_feedback(text, openai_clients, style))
+        
         # Play chime if requested
         if feedback_type in ("chime", "both"):
             if text == "listening":
@@ -425,38 +610,74 @@ async def play_audio_feedback(text: str, openai_clients: dict, enabled: Optional
             elif text == "finished":
                 await play_chime_end()
         
-        # Play voice if requested
-        if feedback_type in ("voice", "both"):
-            # Determine text and instructions based on style
-            if style == "shout":
-                feedback_text = text.upper()  # Convert to uppercase for emphasis
-                instructions = "SHOUT this word loudly and enthusiastically!" if text == "listening" else "SHOUT this word loudly and triumphantly!"
-            else:  # whisper is default
-                feedback_text = text.lower()
-                instructions = "Whisper this word very softly and gently, almost inaudibly"
-            
-            # Use OpenAI's TTS with style-specific instructions
-            await text_to_speech(
-                text=feedback_text,
-                openai_clients=openai_clients,
-                tts_model=AUDIO_FEEDBACK_MODEL,
-                tts_voice=AUDIO_FEEDBACK_VOICE,
-                tts_base_url=TTS_BASE_URL,
-                debug=DEBUG,
-                debug_dir=DEBUG_DIR if DEBUG else None,
-                save_audio=False,  # Don't save feedback sounds
-                audio_dir=None,
-                client_key='tts',
-                instructions=instructions,
-                provider='openai'  # Audio feedback uses OpenAI for consistency
-            )
+        # Play voice once the chime has finished, as both share the output device
+        if voice_task is not None:
+            samples, sample_rate = await voice_task
+            await asyncio.to_thread(play_audio_samples, samples, sample_rate)
     except Exception as e:
         logger.debug(f"Audio feedback failed: {e}")
         # Don't interrupt the main flow if feedback fails
+        if voice_task is not None and not voice_task.done():
+            voice_task.cancel()
+
+
+async def _play_feedback_after_turn(text: str, openai_clients: dict, enabled: Optional[bool], style: str) -> None:
+    """Play audio feedback once the audio devices are free again.
+    
+    Used for the "finished" feedback, which is detached from converse so the
+    transcription is returned without waiting for it to play out.
+    """
+    async with audio_operation_lock:
+        await play_audio_feedback(text, openai_clients, enabled, style)
+
+
+def _sum_squares(samples):
+    """Sum of squared int16 samples, accumulated in int64"""
+    total = 0
+    for i in range(samples.size):
+        value = np.int64(samples[i])
+        total += value * value
+    return total
+
+
+@functools.lru_cache(maxsize=1)
+def _load_energy_kernel():
+    """
+    Compile _sum_squares with numba when the optional accelerator is installed.
+    
+    The compiled kernel measures a chunk's energy in one pass without the
+    int64 scratch copy. Compilation is cached on disk, so only the first
+    recording after installing numba pays for it.
+    
+    Returns:
+        The compiled kernel, or None to use the numpy path
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    
+    try:
+        return njit("int64(int16[::1])", cache=True, nogil=True)(_sum_squares)
+    except Exception as e:
+        logger.debug(f"numba energy kernel unavailable: {e}")
+        return None
 
 
-def record_audio(duration: float) -> np.ndarray:
-    """Record audio from microphone with intelligent silence detection"""
+def record_audio(duration: float, on_pause: Optional[Callable[[Optional[np.ndarray]], None]] = None) -> np.ndarray:
+    """
+    Record audio from microphone with intelligent silence detection.
+    
+    Args:
+        duration: Maximum recording length in seconds
+        on_pause: Optional callback, run on the recording thread. It receives
+            the audio recorded so far, without leading silence, once the
+            speaker has been silent for 0.6s after speaking, and None if
+            they start speaking again.
+    
+    Returns:
+        The recorded int16 samples, or an empty array on failure
+    """
     logger.info(f"🎤 Recording audio with silence detection (max {duration}s)...")
     if DEBUG:
         try:
@@ -467,22 +688,69 @@ def record_audio(duration: float) -> np.ndarray:
         except Exception as dev_e:
             logger.error(f"Error querying audio devices: {dev_e}")
     
-    # Save current stdio state
-    import sys
-    original_stdin = sys.stdin
-    original_stdout = sys.stdout
-    original_stderr = sys.stderr
-    
     try:
         # Configuration for silence detection
         silence_threshold = 100  # RMS level below which we consider silence
         silence_duration = 2.5   # Seconds of silence before stopping
+        speech_silence_duration = 0.9  # Shorter tail once speech has been heard
+        # Silence after speech reported to on_pause. Most of the 0.9s tail,
+        # so ordinary phrase breaks don't each start a billed STT request
+        pause_duration = 0.6
+        trim_margin = 0.2  # Silence kept around the detected audio for STT
         chunk_size = int(SAMPLE_RATE * 0.1)  # 100ms chunks for real-time processing
         
-        recording_data = []
-        silence_start = None
+        # The first chunks estimate the room's noise floor, and the threshold
+        # is raised to 3x that level (capped so early speech cannot swallow
+        # the whole utterance). Speech counts as started after two
+        # consecutive loud chunks, which then shortens the silence tail.
+        calibration_chunks = 2
+        max_silence_threshold = 1000
+        speech_open_chunks = 2
+        
+        # The PortAudio callback copies each block straight into the
+        # preallocated recording, and silence detection runs on this thread,
+        # so slow Python work here can no longer overflow the device buffer
+        max_samples = int(np.ceil(duration * SAMPLE_RATE)) * CHANNELS
+        recording = np.empty(max_samples, dtype=np.int16)
         total_recorded = 0
-        start_time = time.time()
+        overflowed = False
+        data_ready = threading.Event()
+        
+        def on_audio(indata, frames, time_info, status):
+            nonlocal total_recorded, overflowed
+            if status.input_overflow:
+                overflowed = True
+            count = min(indata.size, max_samples - total_recorded)
+            recording[total_recorded:total_recorded + count] = indata.reshape(-1)[:count]
+            total_recorded += count
+            data_ready.set()
+            if total_recorded >= max_samples:
+                raise sd.CallbackStop
+        
+        # Silence is detected on the integer sum of squares, compared against
+        # threshold² * n, which avoids a float copy and sqrt per chunk. The
+        # int64 scratch buffer is reused so the squares cannot overflow int16.
+        threshold_sq = silence_threshold * silence_threshold
+        chunk_samples = chunk_size * CHANNELS
+        energy_scratch = np.empty(chunk_samples, dtype=np.int64)
+        energy_kernel = _load_energy_kernel()
+        
+        # Silence is timed in samples rather than wall-clock time
+        silence_limit = int(silence_duration * SAMPLE_RATE) * CHANNELS
+        pause_limit = int(pause_duration * SAMPLE_RATE) * CHANNELS
+        margin_samples = int(trim_margin * SAMPLE_RATE) * CHANNELS
+        # Span of chunks classified as audio, used to trim leading and
+        # trailing silence so less is uploaded to STT
+        first_audio = None
+        audio_end = 0
+        silent_samples = 0
+        pause_reported = False
+        noise_energy = 0
+        loud_run = 0
+        speech_started = False
+        processed = 0
+        chunk_count = 0
+        stopped_on_silence = False
         
         logger.debug(f"Starting real-time recording with {chunk_size} samples per chunk...")
         
@@ -491,49 +759,103 @@ def record_audio(duration: float) -> np.ndarray:
             samplerate=SAMPLE_RATE,
             channels=CHANNELS,
             dtype=np.int16,
-            blocksize=chunk_size
+            blocksize=chunk_size,
+            callback=on_audio
         ) as stream:
             
-            while total_recorded < duration * SAMPLE_RATE:
-                # Read next chunk
-                chunk, overflowed = stream.read(chunk_size)
+            while not stopped_on_silence:
+                data_ready.wait(timeout=0.5)
+                data_ready.clear()
                 if overflowed:
                     logger.warning("Audio buffer overflowed")
+                    overflowed = False
                 
-                chunk_flat = chunk.flatten()
-                recording_data.append(chunk_flat)
-                total_recorded += len(chunk_flat)
-                
-                # Calculate RMS for this chunk
-                rms = np.sqrt(np.mean(chunk_flat.astype(float) ** 2))
-                current_time = time.time()
-                
-                if DEBUG and len(recording_data) % 10 == 0:  # Log every second
-                    logger.debug(f"Chunk RMS: {rms:.2f} ({'silence' if rms < silence_threshold else 'audio'})")
+                # Analyze every complete chunk captured so far
+                while total_recorded - processed >= chunk_samples:
+                    chunk = recording[processed:processed + chunk_samples]
+                    processed += chunk_samples
+                    chunk_count += 1
+                    
+                    # The numba kernel measures energy in a single pass.
+                    # Without it, a chunk whose samples all lie within the
+                    # threshold is silent without any energy math, since
+                    # RMS <= peak; otherwise its energy is compared.
+                    log_chunk = DEBUG and chunk_count % 10 == 0  # Log every second
+                    calibrating = chunk_count <= calibration_chunks
+                    if energy_kernel is not None:
+                        sum_sq = int(energy_kernel(chunk))
+                        is_silent = sum_sq < threshold_sq * chunk_samples
+                    else:
+                        is_silent = -silence_threshold < chunk.min() and chunk.max() < silence_threshold
+                        if not is_silent or log_chunk or calibrating:
+                            np.copyto(energy_scratch, chunk)
+                            sum_sq = int(np.dot(energy_scratch, energy_scratch))
+                            is_silent = sum_sq < threshold_sq * chunk_samples
+                    
+                    if log_chunk:
+                        rms = np.sqrt(sum_sq / chunk_samples)
+                        logger.debug(f"Chunk RMS: {rms:.2f} ({'silence' if is_silent else 'audio'})")
+                    
+                    if calibrating:
+                        noise_energy += sum_sq
+                        if chunk_count == calibration_chunks:
+                            noise_floor = np.sqrt(noise_energy / (calibration_chunks * chunk_samples))
+                            silence_threshold = int(min(max(silence_threshold, 3 * noise_floor), max_silence_threshold))
+                            threshold_sq = silence_threshold * silence_threshold
+                            logger.debug(f"Noise floor RMS {noise_floor:.1f}, silence threshold {silence_threshold}")
+                    
+                    # Shorten the silence tail once speech has clearly started
+                    loud_run = 0 if is_silent else loud_run + 1
+                    if not is_silent:
+                        if first_audio is None:
+                            first_audio = processed - chunk_samples
+                        audio_end = processed
+                    if not speech_started and loud_run >= speech_open_chunks:
+                        speech_started = True
+                        silence_duration = speech_silence_duration
+                        silence_limit = int(silence_duration * SAMPLE_RATE) * CHANNELS
+                        logger.debug("Speech detected, shortening silence timeout")
+                    
+                    # Check for silence
+                    if is_silent:
+                        if silent_samples == 0:
+                            logger.debug("Silence detected, starting timer...")
+                        silent_samples += chunk_samples
+                        if on_pause and speech_started and not pause_reported and silent_samples >= pause_limit:
+                            pause_reported = True
+                            on_pause(recording[max(0, first_audio - margin_samples):processed])
+                        if silent_samples >= silence_limit:
+                            logger.info(f"✓ Stopping after {silence_duration}s of silence")
+                            stopped_on_silence = True
+                            break
+                    else:
+                        # Audio detected, reset silence timer
+                        if silent_samples:
+                            logger.debug("Audio resumed, resetting silence timer")
+                        silent_samples = 0
+                        if pause_reported:
+                            pause_reported = False
+                            on_pause(None)
                 
-                # Check for silence
-                if rms < silence_threshold:
-                    if silence_start is None:
-                        silence_start = current_time
-                        logger.debug("Silence detected, starting timer...")
-                    elif current_time - silence_start >= silence_duration:
-                        logger.info(f"✓ Stopping after {silence_duration}s of silence")
-                        break
-                else:
-                    # Audio detected, reset silence timer
-                    if silence_start is not None:
-                        logger.debug("Audio resumed, resetting silence timer")
-                    silence_start = None
+                # The callback stops the stream once the duration is reached
+                if not stream.active:
+                    break
         
-        # Combine all chunks
-        flattened = np.concatenate(recording_data) if recording_data else np.array([])
+        # Trim the buffer to what was actually recorded, dropping silence
+        # before the first and after the last audible chunk
+        start = 0
+        if stopped_on_silence:
+            total_recorded = min(processed, audio_end + margin_samples)
+        if first_audio is not None:
+            start = max(0, first_audio - margin_samples)
+        flattened = recording[start:total_recorded]
         actual_duration = len(flattened) / SAMPLE_RATE
         logger.info(f"✓ Recorded {len(flattened)} samples ({actual_duration:.1f}s)")
         
         if DEBUG:
             logger.debug(f"Recording stats - Min: {flattened.min()}, Max: {flattened.max()}, Mean: {flattened.mean():.2f}")
             # Final RMS check
-            final_rms = np.sqrt(np.mean(flattened.astype(float) ** 2))
+            final_rms = np.sqrt(np.dot(flattened, flattened.astype(np.int64)) / max(flattened.size, 1))
             logger.debug(f"Final RMS level: {final_rms:.2f}")
         
         return flattened
@@ -553,14 +875,110 @@ def record_audio(duration: float) -> np.ndarray:
             logger.error(f"Cannot query audio devices: {dev_e}")
         
         return np.array([])
-    finally:
-        # Restore stdio if it was changed
-        if sys.stdin != original_stdin:
-            sys.stdin = original_stdin
-        if sys.stdout != original_stdout:
-            sys.stdout = original_stdout
-        if sys.stderr != original_stderr:
-            sys.stderr = original_stderr
+
+
+def _speech_pieces(message: str, tts_config: dict) -> list:
+    """Split a message into the pieces speak_message synthesizes separately"""
+    if TTS_STREAMING or DEBUG or SAVE_AUDIO or tts_config.get('provider') == 'gemini':
+        return [message]
+    return split_sentences(message) or [message]
+
+
+async def prefetch_speech(message: str, tts_config: dict) -> None:
+    """
+    Synthesize a message into the speech cache ahead of playback.
+    
+    Used while another call holds the audio devices: rather than waiting
+    idle and then synthesizing, the audio is ready to play from the cache
+    as soon as the devices are free. Failures are left for speak_message
+    to retry and report.
+    """
+    if DEBUG or SAVE_AUDIO or tts_config.get('provider') == 'gemini':
+        return
+    
+    try:
+        await asyncio.gather(*(
+            synthesize_speech(
+                piece,
+                openai_clients,
+                tts_model=tts_config['model'],
+                tts_voice=tts_config['voice'],
+                tts_base_url=tts_config['base_url'],
+                client_key=tts_config['client_key'],
+                instructions=tts_config.get('instructions'),
+                cache=_speech_cache
+            )
+            for piece in _speech_pieces(message, tts_config)
+        ))
+    except Exception as e:
+        logger.debug(f"Could not prefetch speech: {e}")
+
+
+async def speak_message(message: str, tts_config: dict) -> tuple:
+    """
+    Speak a converse message with the resolved TTS configuration.
+    
+    Without streaming playback, a multi-sentence message is pipelined
+    sentence by sentence so playback starts after the first sentence is
+    synthesized rather than the whole message. Debug and audio saving keep
+    the single request, since they save the complete encoded response.
+    
+    Returns:
+        tuple: (success: bool, metrics: dict) as returned by text_to_speech
+    """
+    sentences = _speech_pieces(message, tts_config)
+    if len(sentences) > 1:
+        return await speak_sentences(
+            sentences,
+            openai_clients,
+            tts_model=tts_config['model'],
+            tts_voice=tts_config['voice'],
+            tts_base_url=tts_config['base_url'],
+            client_key=tts_config['client_key'],
+            instructions=tts_config.get('instructions'),
+            cache=_speech_cache
+        )
+    
+    return await text_to_speech(
+        text=message,
+        openai_clients=openai_clients,
+        tts_model=tts_config['model'],
+        tts_base_url=tts_config['base_url'],
+        tts_voice=tts_config['voice'],
+        debug=DEBUG,
+        debug_dir=DEBUG_DIR if DEBUG else None,
+        save_audio=SAVE_AUDIO,
+        audio_dir=AUDIO_DIR if SAVE_AUDIO else None,
+        client_key=tts_config['client_key'],
+        instructions=tts_config.get('instructions'),
+        provider=tts_config.get('provider'),
+        cache=_speech_cache,
+        stream=TTS_STREAMING
+    )
+
+
+class SpeculativeTranscription:
+    """
+    Transcribe a recording while its final silence is still being recorded.
+    
+    record_audio reports a pause once it covers most of the silence tail;
+    the audio up to the pause is sent to STT straight away. If the speaker
+    carries on, the transcription is cancelled, although a request the
+    server already received is still billed, which is why short phrase
+    breaks are not reported. If the pause turns out to end the recording,
+    the result is ready (or nearly) by the time the silence timeout expires.
+    """
+    
+    def __init__(self):
+        self.task: Optional[asyncio.Task] = None
+    
+    def update(self, prefix: Optional[np.ndarray]) -> None:
+        """Start transcribing a paused recording, or cancel when speech resumes"""
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+        if prefix is not None and len(prefix) > 0:
+            self.task = asyncio.create_task(speech_to_text(prefix, speculative=True))
 
 
 async def check_livekit_available() -> bool:
@@ -648,9 +1066,10 @@ async def livekit_ask_voice_question(question: str, room_name: str = "", timeout
         session = AgentSession(vad=vad)
         await session.start(room=room, agent=agent)
         
-        # Wait for response
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+        # Wait for response, measured on the monotonic clock so a wall
+        # clock adjustment cannot shorten or extend the timeout
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
             if agent.response:
                 await room.disconnect()
                 return agent.response
@@ -664,6 +1083,162 @@ async def livekit_ask_voice_question(question: str, room_name: str = "", timeout
         return f"LiveKit error: {str(e)}"
 
 
+async def _speak_only(message: str, tts_config: Awaitable[dict]) -> str:
+    """
+    Speak a message without listening for a response.
+    
+    Args:
+        message: The message to speak
+        tts_config: Awaitable resolving to the TTS configuration
+        
+    Returns:
+        Confirmation that the message was spoken, or an error message
+    """
+    try:
+        tts_config = await tts_config
+        
+        # Synthesize while another call is using the audio devices
+        if audio_operation_lock.locked():
+            await prefetch_speech(message, tts_config)
+        
+        async with audio_operation_lock:
+            success, tts_metrics = await speak_message(message, tts_config)
+            
+        # Include timing info if available
+        timing_info = ""
+        if success and tts_metrics:
+            generation, playback = tts_metrics.get('generation', 0.0), tts_metrics.get('playback', 0.0)
+            timing_info = f" (gen: {generation:.1f}s, play: {playback:.1f}s)"
+        
+        result = f"✓ Message spoken successfully{timing_info}" if success else "✗ Failed to speak message"
+        logger.info(f"Speak-only result: {result}")
+        return result
+    except Exception as e:
+        logger.error(f"Speak error: {e}")
+        error_msg = f"Error: {str(e)}"
+        logger.error(f"Returning error: {error_msg}")
+        return error_msg
+
+
+async def _converse_local(
+    message: str,
+    tts_config: Awaitable[dict],
+    listen_duration: float,
+    audio_feedback: Optional[bool],
+    audio_feedback_style: Optional[str]
+) -> str:
+    """
+    Speak a message and listen for the response on the local audio devices.
+    
+    Args:
+        message: The message to speak
+        tts_config: Awaitable resolving to the TTS configuration, which may
+            already be running while the transport is selected
+        listen_duration: Maximum recording duration in seconds
+        audio_feedback: Override global audio feedback setting
+        audio_feedback_style: Audio feedback style - "whisper" or "shout"
+        
+    Returns:
+        The transcribed response with stage timings, or an error message
+    """
+    # Local microphone approach with timing
+    timings = TurnTimings()
+    try:
+        # Resolve the TTS provider before taking the audio lock, as it
+        # may probe a local service over the network
+        tts_start = time.perf_counter()
+        tts_config = await tts_config
+        
+        # Prepare the listening side while the message is spoken: the
+        # spoken feedback is synthesized ahead of time, and the STT
+        # connection is reopened unless TTS is already using that host
+        prewarm_feedback(openai_clients, audio_feedback, audio_feedback_style or AUDIO_FEEDBACK_STYLE)
+        stt_client = openai_clients['stt']
+        if str(stt_client.base_url).rstrip('/') != (tts_config['base_url'] or '').rstrip('/'):
+            _run_in_background(_warm_connection('stt', stt_client))
+        
+        # Synthesize while another call is using the audio devices
+        if audio_operation_lock.locked():
+            await prefetch_speech(message, tts_config)
+        
+        async with audio_operation_lock:
+            # Speak the message
+            tts_success, tts_metrics = await speak_message(message, tts_config)
+            
+            timings.tts_total = time.perf_counter() - tts_start
+            if not tts_success:
+                return "Error: Could not speak message"
+            
+            # Add TTS sub-metrics
+            if tts_metrics:
+                timings.tts_gen, timings.tts_play = tts_metrics.get('generation', 0.0), tts_metrics.get('playback', 0.0)
+            
+            # Brief pause before listening
+            await asyncio.sleep(0.5)
+            
+            # Play "listening" feedback sound
+            await play_audio_feedback("listening", openai_clients, audio_feedback, audio_feedback_style or AUDIO_FEEDBACK_STYLE)
+            
+            # Record response
+            logger.info(f"🎤 Listening for {listen_duration} seconds...")
+            record_start = time.perf_counter()
+            loop = asyncio.get_running_loop()
+            # Saved recordings must be complete, so skip speculation
+            speculation = None if SAVE_AUDIO else SpeculativeTranscription()
+            on_pause = None
+            if speculation is not None:
+                on_pause = lambda prefix: loop.call_soon_threadsafe(speculation.update, prefix)
+            audio_data = await loop.run_in_executor(
+                None, functools.partial(record_audio, listen_duration, on_pause)
+            )
+            timings.record = time.perf_counter() - record_start
+            
+            # Start the STT upload right away so it overlaps the
+            # "finished" feedback. When the recording ended in the
+            # pause already being transcribed, that transcription is
+            # used instead.
+            stt_start = time.perf_counter()
+            stt_task = speculation.task if speculation is not None else None
+            if len(audio_data) == 0 and stt_task is not None:
+                stt_task.cancel()
+                stt_task = None
+            elif len(audio_data) > 0:
+                if stt_task is None:
+                    stt_task = asyncio.create_task(
+                        speech_to_text(audio_data, SAVE_AUDIO, AUDIO_DIR if SAVE_AUDIO else None)
+                    )
+                else:
+                    logger.debug("Using transcription started during the final pause")
+            
+            # Play "finished" feedback without waiting for it. The
+            # task queues on the audio lock before it is released, so
+            # it keeps the devices to itself but no longer delays the
+            # transcription result.
+            _run_in_background(_play_feedback_after_turn(
+                "finished", openai_clients, audio_feedback, audio_feedback_style or AUDIO_FEEDBACK_STYLE
+            ))
+            await asyncio.sleep(0)
+            
+            if stt_task is None:
+                return "Error: Could not record audio"
+        
+        # The transcription only waits on the network, so the audio
+        # devices are released before awaiting it
+        response_text = await stt_task
+        timings.stt = time.perf_counter() - stt_start
+        timing_str = timings.summary()
+        
+        if response_text:
+            return f"Voice response: {response_text} | Timing: {timing_str}"
+        else:
+            return f"No speech detected | Timing: {timing_str}"
+            
+    except Exception as e:
+        # The traceback is formatted by the log handler, only in debug mode
+        logger.error(f"Local voice error: {e}", exc_info=DEBUG)
+        return f"Error: {str(e)}"
+
+
 @mcp.tool()
 async def converse(
     message: str,
@@ -723,52 +1298,31 @@ async def converse(
     await startup_initialization()
     
     # Track execution time and resources
-    start_time = time.time()
-    if DEBUG:
-        import resource
+    start_time = time.perf_counter()
+    if PROFILE_MEMORY:
         start_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
         logger.debug(f"Starting converse - Memory: {start_memory} KB")
     
     try:
+        # Most turns carry no emotion instructions, which need no validation
+        validated_instructions = tts_instructions
+        if tts_instructions:
+            validated_instructions = validate_emotion_request(tts_model, tts_instructions, tts_provider)
+        
         # If not waiting for response, just speak and return
         if not wait_for_response:
-            try:
-                async with audio_operation_lock:
-                    # Validate emotion request
-                    validated_instructions = validate_emotion_request(tts_model, tts_instructions, tts_provider)
-                    tts_config = await get_tts_config(tts_provider, voice, tts_model, validated_instructions)
-                    success, tts_metrics = await text_to_speech(
-                        text=message,
-                        openai_clients=openai_clients,
-                        tts_model=tts_config['model'],
-                        tts_base_url=tts_config['base_url'],
-                        tts_voice=tts_config['voice'],
-                        debug=DEBUG,
-                        debug_dir=DEBUG_DIR if DEBUG else None,
-                        save_audio=SAVE_AUDIO,
-                        audio_dir=AUDIO_DIR if SAVE_AUDIO else None,
-                        client_key=tts_config['client_key'],
-                        instructions=tts_config.get('instructions'),
-                        provider=tts_config.get('provider')
-                    )
-                    
-                # Include timing info if available
-                timing_info = ""
-                if success and tts_metrics:
-                    timing_info = f" (gen: {tts_metrics.get('generation', 0):.1f}s, play: {tts_metrics.get('playback', 0):.1f}s)"
-                
-                result = f"✓ Message spoken successfully{timing_info}" if success else "✗ Failed to speak message"
-                logger.info(f"Speak-only result: {result}")
-                return result
-            except Exception as e:
-                logger.error(f"Speak error: {e}")
-                error_msg = f"Error: {str(e)}"
-                logger.error(f"Returning error: {error_msg}")
-                return error_msg
+            return await _speak_only(
+                message, get_tts_config(tts_provider, voice, tts_model, validated_instructions)
+            )
         
         # Otherwise, speak and then listen for response
-        # Determine transport method
+        # Determine transport method. The TTS config needed by the local
+        # transport is resolved while LiveKit is being probed.
+        tts_config = None
         if transport == "auto":
+            tts_config = asyncio.create_task(
+                get_tts_config(tts_provider, voice, tts_model, validated_instructions)
+            )
             if await check_livekit_available():
                 transport = "livekit"
                 logger.info("Auto-selected LiveKit transport")
@@ -777,123 +1331,34 @@ async def converse(
                 logger.info("Auto-selected local transport")
         
         if transport == "livekit":
+            if tts_config is not None:
+                tts_config.cancel()
+                # Mark a failure as retrieved, as nobody awaits the task
+                tts_config.add_done_callback(lambda t: t.cancelled() or t.exception())
             # For LiveKit, use the existing function but with the message parameter
             return await livekit_ask_voice_question(message, room_name, timeout)
         
         elif transport == "local":
-            # Local microphone approach with timing
-            timings = {}
-            try:
-                async with audio_operation_lock:
-                    # Speak the message
-                    tts_start = time.perf_counter()
-                    # Validate emotion request
-                    validated_instructions = validate_emotion_request(tts_model, tts_instructions, tts_provider)
-                    tts_config = await get_tts_config(tts_provider, voice, tts_model, validated_instructions)
-                    tts_success, tts_metrics = await text_to_speech(
-                        text=message,
-                        openai_clients=openai_clients,
-                        tts_model=tts_config['model'],
-                        tts_base_url=tts_config['base_url'],
-                        tts_voice=tts_config['voice'],
-                        debug=DEBUG,
-                        debug_dir=DEBUG_DIR if DEBUG else None,
-                        save_audio=SAVE_AUDIO,
-                        audio_dir=AUDIO_DIR if SAVE_AUDIO else None,
-                        client_key=tts_config['client_key'],
-                        instructions=tts_config.get('instructions'),
-                        provider=tts_config.get('provider')
-                    )
-                    
-                    # Add TTS sub-metrics
-                    if tts_metrics:
-                        timings['tts_gen'] = tts_metrics.get('generation', 0)
-                        timings['tts_play'] = tts_metrics.get('playback', 0)
-                    timings['tts_total'] = time.perf_counter() - tts_start
-                    
-                    if not tts_success:
-                        return "Error: Could not speak message"
-                    
-                    # Brief pause before listening
-                    await asyncio.sleep(0.5)
-                    
-                    # Play "listening" feedback sound
-                    await play_audio_feedback("listening", openai_clients, audio_feedback, audio_feedback_style or AUDIO_FEEDBACK_STYLE)
-                    
-                    # Record response
-                    logger.info(f"🎤 Listening for {listen_duration} seconds...")
-                    record_start = time.perf_counter()
-                    audio_data = await asyncio.get_event_loop().run_in_executor(
-                        None, record_audio, listen_duration
-                    )
-                    timings['record'] = time.perf_counter() - record_start
-                    
-                    # Play "finished" feedback sound
-                    await play_audio_feedback("finished", openai_clients, audio_feedback, audio_feedback_style or AUDIO_FEEDBACK_STYLE)
-                    
-                    if len(audio_data) == 0:
-                        return "Error: Could not record audio"
-                    
-                    # Convert to text
-                    stt_start = time.perf_counter()
-                    response_text = await speech_to_text(audio_data, SAVE_AUDIO, AUDIO_DIR if SAVE_AUDIO else None)
-                    timings['stt'] = time.perf_counter() - stt_start
-                
-                # Calculate total time (use tts_total instead of sub-metrics)
-                main_timings = {k: v for k, v in timings.items() if k in ['tts_total', 'record', 'stt']}
-                total_time = sum(main_timings.values())
-                
-                # Format timing string with sub-metrics
-                timing_parts = []
-                if 'tts_gen' in timings:
-                    timing_parts.append(f"tts_gen {timings['tts_gen']:.1f}s")
-                if 'tts_play' in timings:
-                    timing_parts.append(f"tts_play {timings['tts_play']:.1f}s")
-                if 'tts_total' in timings:
-                    timing_parts.append(f"tts_total {timings['tts_total']:.1f}s")
-                if 'record' in timings:
-                    timing_parts.append(f"record {timings['record']:.1f}s")
-                if 'stt' in timings:
-                    timing_parts.append(f"stt {timings['stt']:.1f}s")
-                
-                timing_str = ", ".join(timing_parts)
-                timing_str += f", total {total_time:.1f}s"
-                
-                if response_text:
-                    return f"Voice response: {response_text} | Timing: {timing_str}"
-                else:
-                    return f"No speech detected | Timing: {timing_str}"
-                    
-            except Exception as e:
-                logger.error(f"Local voice error: {e}")
-                if DEBUG:
-                    logger.error(f"Traceback: {traceback.format_exc()}")
-                return f"Error: {str(e)}"
-            
+            if tts_config is None:
+                tts_config = get_tts_config(tts_provider, voice, tts_model, validated_instructions)
+            return await _converse_local(message, tts_config, listen_duration, audio_feedback, audio_feedback_style)
+        
         else:
             return f"Unknown transport: {transport}"
             
     except Exception as e:
-        logger.error(f"Unexpected error in converse: {e}")
-        if DEBUG:
-            logger.error(f"Full traceback: {traceback.format_exc()}")
+        logger.error(f"Unexpected error in converse: {e}", exc_info=DEBUG)
         return f"Unexpected error: {str(e)}"
         
     finally:
         # Log execution metrics
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
         logger.info(f"Converse completed in {elapsed:.2f}s")
         
-        if DEBUG:
-            import resource
-            import gc
+        if PROFILE_MEMORY:
             end_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
             memory_delta = end_memory - start_memory
             logger.debug(f"Memory delta: {memory_delta} KB (start: {start_memory}, end: {end_memory})")
-            
-            # Force garbage collection
-            collected = gc.collect()
-            logger.debug(f"Garbage collected {collected} objects")
 
 
 @mcp.tool()
@@ -973,13 +1438,13 @@ async def voice_chat(
             tts_provider=tts_provider
         )
         transcript.append(f"Assistant: {initial_message}")
-        if "Voice response:" in result:
-            user_response = result.split("Voice response:")[1].split("|")[0].strip()
+        match = _VOICE_RESPONSE_RE.search(result)
+        if match:
+            user_response = match.group(1).strip()
             transcript.append(f"User: {user_response}")
             
             # Check for exit phrases
-            exit_phrases = ["goodbye", "exit", "end chat", "stop", "quit"]
-            if any(phrase in user_response.lower() for phrase in exit_phrases):
+            if _EXIT_PHRASE_RE.search(user_response):
                 return "\n".join(transcript) + "\n\nChat ended by user."
     
     # Continue conversation for remaining turns
@@ -3,12 +3,117 @@ Settings management tools for Voice MCP.
 """
 
 import logging
-from typing import Optional, List
+from typing import Any, Dict, Optional, List, Tuple
 from voice_mcp.server_new import mcp
 from voice_mcp.settings import settings_manager
+from voice_mcp.providers import (
+    PROVIDERS,
+    GEMINI_DEFAULT_MODEL,
+    GEMINI_DEFAULT_VOICE,
+    GEMINI_FLASH_MODEL,
+    GEMINI_PRO_MODEL
+)
 
 logger = logging.getLogger("voice-mcp")
 
+# Accepted values for the setting tools
+_TTS_PROVIDERS = frozenset({"openai", "kokoro", "gemini"})
+_STT_PROVIDERS = frozenset({"openai", "local"})
+_FEEDBACK_MODES = frozenset({"chime", "voice", "both", "none"})
+_OPENAI_TTS_MODELS = frozenset({"tts-1", "tts-1-hd", "gpt-4o-mini-tts"})
+_GEMINI_MODELS = {
+    "flash": GEMINI_FLASH_MODEL,
+    "pro": GEMINI_PRO_MODEL
+}
+_GEMINI_MODEL_NAMES = frozenset(_GEMINI_MODELS.values())
+
+# Accepted range and display label of the duration settings, in seconds
+_DURATION_BOUNDS = {
+    'silence_timeout': (0.1, 60.0, "Silence timeout"),
+    'listen_duration': (5.0, 600.0, "Listen duration"),
+}
+
+# Voices offered by each TTS provider, shared by the voice list and validation
+_OPENAI_VOICES = tuple(PROVIDERS["openai"]["voices"])
+_KOKORO_VOICES = tuple(PROVIDERS["kokoro"]["voices"])
+_GEMINI_VOICES = tuple(PROVIDERS["gemini"]["voices"])
+# The registry lists only a sample of some providers' voices (Kokoro ships
+# voices for many languages, OpenAI adds new ones), so this is used to warn
+# about likely typos rather than to reject voices
+_KNOWN_VOICES = frozenset(_OPENAI_VOICES + _KOKORO_VOICES + _GEMINI_VOICES)
+
+# Confirmations for settings restricted to the values above
+_TTS_PROVIDER_SET = {p: f"✅ TTS provider set to: {p}" for p in _TTS_PROVIDERS}
+_STT_PROVIDER_SET = {p: f"✅ STT provider set to: {p}" for p in _STT_PROVIDERS}
+_FEEDBACK_SET = {f: f"✅ Audio feedback set to: {f}" for f in _FEEDBACK_MODES}
+
+# Confirmations and error of the settings that take one of a fixed set of values
+_CHOICE_SETTINGS = {
+    'stt_provider': (_STT_PROVIDER_SET, "❌ Invalid STT provider. Use 'openai' or 'local'."),
+    'audio_feedback': (_FEEDBACK_SET, "❌ Invalid audio feedback. Use 'chime', 'voice', 'both', or 'none'."),
+}
+
+_SETTINGS_TEMPLATE = """🎙️ CURRENT VOICE SETTINGS
+==================================================
+
+🔊 TEXT-TO-SPEECH:
+  Provider: {s.tts_provider}
+  Voice: {s.tts_voice}
+  Model: {s.tts_model}
+
+🗣️ SPEECH-TO-TEXT:
+  Provider: {s.stt_provider}
+  Model: {s.stt_model}
+
+⏱️ CONVERSATION:
+  Silence timeout: {s.silence_timeout}s
+  Max listen duration: {s.listen_duration}s
+
+🔧 AUDIO & OPTIONS:
+  Audio feedback: {s.audio_feedback}
+  Allow emotions: {s.allow_emotions}
+  Auto-start Kokoro: {s.auto_start_kokoro}
+  Prefer local: {s.prefer_local}"""
+
+_GEMINI_SETTINGS_TEMPLATE = """
+
+🤖 GEMINI SETTINGS:
+  Model: {s.gemini_model}
+  System prompt: {s.gemini_system_prompt}"""
+
+_LAST_UPDATED_TEMPLATE = """
+
+📅 Last updated: {s.last_updated:.19}"""
+
+# Output of get_voice_settings with the settings version it was rendered from
+_rendered_settings: Optional[Tuple[int, str]] = None
+
+def _apply(updates: Dict[str, Any], message: str) -> str:
+    """
+    Save setting updates and return the confirmation for the calling tool.
+    
+    update_settings only rejects unknown keys, so failure means a tool
+    passed a setting name that does not exist.
+    """
+    if not settings_manager.update_settings(updates):
+        return f"❌ Failed to update {', '.join(updates)}."
+    return message
+
+def _apply_duration(key: str, seconds: float) -> str:
+    """Save a duration setting if it is within its bounds."""
+    low, high, label = _DURATION_BOUNDS[key]
+    if not low <= seconds <= high:
+        return f"❌ {label} must be between {low:g} and {high:g} seconds."
+    return _apply({key: seconds}, f"✅ {label} set to: {seconds}s")
+
+def _apply_choice(key: str, value: str) -> str:
+    """Save a setting if the value is one of its accepted choices."""
+    confirmations, error = _CHOICE_SETTINGS[key]
+    message = confirmations.get(value)
+    if message is None:
+        return error
+    return _apply({key: value}, message)
+
 @mcp.tool()
 async def get_voice_settings() -> str:
     """
@@ -17,41 +122,26 @@ async def get_voice_settings() -> str:
     Returns:
         Formatted display of all current voice settings.
     """
+    global _rendered_settings
     settings = settings_manager.load_settings()
     
-    result = []
-    result.append("🎙️ CURRENT VOICE SETTINGS")
-    result.append("=" * 50)
-    
-    result.append("\n🔊 TEXT-TO-SPEECH:")
-    result.append(f"  Provider: {settings.tts_provider}")
-    result.append(f"  Voice: {settings.tts_voice}")
-    result.append(f"  Model: {settings.tts_model}")
-    
-    result.append("\n🗣️ SPEECH-TO-TEXT:")
-    result.append(f"  Provider: {settings.stt_provider}")
-    result.append(f"  Model: {settings.stt_model}")
+    # Serve the last rendering until the settings change
+    version = settings_manager.version
+    if _rendered_settings is not None and _rendered_settings[0] == version:
+        return _rendered_settings[1]
     
-    result.append("\n⏱️ CONVERSATION:")
-    result.append(f"  Silence timeout: {settings.silence_timeout}s")
-    result.append(f"  Max listen duration: {settings.listen_duration}s")
-    
-    result.append("\n🔧 AUDIO & OPTIONS:")
-    result.append(f"  Audio feedback: {settings.audio_feedback}")
-    result.append(f"  Allow emotions: {settings.allow_emotions}")
-    result.append(f"  Auto-start Kokoro: {settings.auto_start_kokoro}")
-    result.append(f"  Prefer local: {settings.prefer_local}")
+    # The templates read the slotted settings attributes directly
+    result = _SETTINGS_TEMPLATE.format(s=settings)
     
     # Show Gemini-specific settings if using Gemini
     if settings.tts_provider == "gemini":
-        result.append("\n🤖 GEMINI SETTINGS:")
-        result.append(f"  Model: {settings.gemini_model}")
-        result.append(f"  System prompt: {settings.gemini_system_prompt}")
+        result += _GEMINI_SETTINGS_TEMPLATE.format(s=settings)
     
     if settings.last_updated:
-        result.append(f"\n📅 Last updated: {settings.last_updated[:19]}")
+        result += _LAST_UPDATED_TEMPLATE.format(s=settings)
     
-    return "\n".join(result)
+    _rendered_settings = (version, result)
+    return result
 
 @mcp.tool()
 async def set_tts_provider(provider: str) -> str:
@@ -64,21 +154,18 @@ async def set_tts_provider(provider: str) -> str:
     Returns:
         Confirmation message.
     """
-    if provider not in ["openai", "kokoro", "gemini"]:
+    if provider not in _TTS_PROVIDERS:
         return "❌ Invalid TTS provider. Use 'openai', 'kokoro', or 'gemini'."
     
-    success = settings_manager.update_setting('tts_provider', provider)
+    updates = {'tts_provider': provider}
     
-    # Auto-update model when switching to Gemini
-    if success and provider == "gemini":
+    # Auto-update model when switching to Gemini, in the same save
+    if provider == "gemini":
         current_settings = settings_manager.load_settings()
-        if current_settings.tts_model in ["tts-1", "tts-1-hd", "gpt-4o-mini-tts"]:  # OpenAI models
-            settings_manager.update_setting('tts_model', current_settings.gemini_model)
+        if current_settings.tts_model in _OPENAI_TTS_MODELS:
+            updates['tts_model'] = current_settings.gemini_model
     
-    if success:
-        return f"✅ TTS provider set to: {provider}"
-    else:
-        return "❌ Failed to update TTS provider."
+    return _apply(updates, _TTS_PROVIDER_SET[provider])
 
 @mcp.tool()
 async def set_tts_voice(voice: str) -> str:
@@ -91,11 +178,12 @@ async def set_tts_voice(voice: str) -> str:
     Returns:
         Confirmation message.
     """
-    success = settings_manager.update_setting('tts_voice', voice)
-    if success:
-        return f"✅ TTS voice set to: {voice}"
-    else:
-        return "❌ Failed to update TTS voice."
+    message = f"✅ TTS voice set to: {voice}"
+    if voice not in _KNOWN_VOICES:
+        logger.warning(f"TTS voice {voice!r} is not in the known voice lists")
+        message += " (not a listed voice; check the spelling if TTS fails)"
+    
+    return _apply({'tts_voice': voice}, message)
 
 @mcp.tool()
 async def set_stt_provider(provider: str) -> str:
@@ -108,14 +196,7 @@ async def set_stt_provider(provider: str) -> str:
     Returns:
         Confirmation message.
     """
-    if provider not in ["openai", "local"]:
-        return "❌ Invalid STT provider. Use 'openai' or 'local'."
-    
-    success = settings_manager.update_setting('stt_provider', provider)
-    if success:
-        return f"✅ STT provider set to: {provider}"
-    else:
-        return "❌ Failed to update STT provider."
+    return _apply_choice('stt_provider', provider)
 
 @mcp.tool()
 async def set_silence_timeout(timeout: float) -> str:
@@ -128,14 +209,7 @@ async def set_silence_timeout(timeout: float) -> str:
     Returns:
         Confirmation message.
     """
-    if timeout <= 0 or timeout > 60:
-        return "❌ Silence timeout must be between 0.1 and 60 seconds."
-    
-    success = settings_manager.update_setting('silence_timeout', timeout)
-    if success:
-        return f"✅ Silence timeout set to: {timeout}s"
-    else:
-        return "❌ Failed to update silence timeout."
+    return _apply_duration('silence_timeout', timeout)
 
 @mcp.tool()
 async def set_listen_duration(duration: float) -> str:
@@ -148,14 +222,7 @@ async def set_listen_duration(duration: float) -> str:
     Returns:
         Confirmation message.
     """
-    if duration < 5 or duration > 600:
-        return "❌ Listen duration must be between 5 and 600 seconds."
-    
-    success = settings_manager.update_setting('listen_duration', duration)
-    if success:
-        return f"✅ Listen duration set to: {duration}s"
-    else:
-        return "❌ Failed to update listen duration."
+    return _apply_duration('listen_duration', duration)
 
 @mcp.tool()
 async def set_audio_feedback(feedback: str) -> str:
@@ -168,14 +235,7 @@ async def set_audio_feedback(feedback: str) -> str:
     Returns:
         Confirmation message.
     """
-    if feedback not in ["chime", "voice", "both", "none"]:
-        return "❌ Invalid audio feedback. Use 'chime', 'voice', 'both', or 'none'."
-    
-    success = settings_manager.update_setting('audio_feedback', feedback)
-    if success:
-        return f"✅ Audio feedback set to: {feedback}"
-    else:
-        return "❌ Failed to update audio feedback."
+    return _apply_choice('audio_feedback', feedback)
 
 @mcp.tool()
 async def set_allow_emotions(allow: bool) -> str:
@@ -188,45 +248,23 @@ async def set_allow_emotions(allow: bool) -> str:
     Returns:
         Confirmation message.
     """
-    success = settings_manager.update_setting('allow_emotions', allow)
-    if success:
-        status = "enabled" if allow else "disabled"
-        return f"✅ Emotional TTS {status}"
-    else:
-        return "❌ Failed to update emotion setting."
+    status = "enabled" if allow else "disabled"
+    return _apply({'allow_emotions': allow}, f"✅ Emotional TTS {status}")
 
-@mcp.tool()
-async def get_available_voices() -> str:
-    """
-    Get list of available voices for each TTS provider.
-    
-    Returns:
-        List of available voices grouped by provider.
-    """
+def _build_available_voices() -> str:
+    """Render the voice list once; it only depends on constants."""
     result = []
     result.append("🎵 AVAILABLE VOICES")
     result.append("=" * 40)
     
     result.append("\n🤖 OPENAI TTS:")
-    openai_voices = ["alloy", "echo", "fable", "nova", "onyx", "shimmer"]
-    for voice in openai_voices:
-        result.append(f"  • {voice}")
+    result.extend(f"  • {voice}" for voice in _OPENAI_VOICES)
     
     result.append("\n🏠 KOKORO TTS (Local):")
-    kokoro_voices = ["af_sky", "af_sarah", "am_adam", "af_nicole", "am_michael"]
-    for voice in kokoro_voices:
-        result.append(f"  • {voice}")
+    result.extend(f"  • {voice}" for voice in _KOKORO_VOICES)
     
     result.append("\n🤖 GEMINI TTS (AI Studio):")
-    gemini_voices = [
-        "Aoede", "Callisto", "Charon", "Deimos", "Echo", "Europa",
-        "Fenrir", "Ganymede", "Hera", "Io", "Kore", "Lunara",
-        "Minerva", "Naia", "Nova", "Oberon", "Phobos", "Quorra",
-        "Rhea", "Selene", "Titan", "Umbra", "Vega", "Whisper",
-        "Xara", "Yuki", "Zephyr", "Astra", "Cypher", "Delta"
-    ]
-    for voice in gemini_voices:
-        result.append(f"  • {voice}")
+    result.extend(f"  • {voice}" for voice in _GEMINI_VOICES)
     
     result.append("\n💡 USAGE:")
     result.append("Use set_tts_voice('voice_name') to change voice")
@@ -235,6 +273,18 @@ async def get_available_voices() -> str:
     
     return "\n".join(result)
 
+_AVAILABLE_VOICES = _build_available_voices()
+
+@mcp.tool()
+async def get_available_voices() -> str:
+    """
+    Get list of available voices for each TTS provider.
+    
+    Returns:
+        List of available voices grouped by provider.
+    """
+    return _AVAILABLE_VOICES
+
 @mcp.tool()
 async def reset_voice_settings() -> str:
     """
@@ -244,16 +294,8 @@ async def reset_voice_settings() -> str:
         Confirmation message.
     """
     try:
-        # Delete settings file to force defaults
-        if settings_manager.settings_file.exists():
-            settings_manager.settings_file.unlink()
-        
-        # Clear cached settings
-        settings_manager._settings = None
-        
-        # Reload and apply defaults
-        settings_manager.load_settings()
-        settings_manager.apply_to_environment()
+        # Overwrite the saved settings with defaults in a single write
+        settings_manager.reset_settings()
         
         return "✅ Voice settings reset to defaults."
         
@@ -270,11 +312,13 @@ async def quick_setup_local() -> str:
         Setup confirmation message.
     """
     try:
-        settings_manager.update_setting('tts_provider', 'kokoro')
-        settings_manager.update_setting('tts_voice', 'af_sky')
-        settings_manager.update_setting('stt_provider', 'local')
-        settings_manager.update_setting('auto_start_kokoro', True)
-        settings_manager.update_setting('prefer_local', True)
+        settings_manager.update_settings({
+            'tts_provider': 'kokoro',
+            'tts_voice': 'af_sky',
+            'stt_provider': 'local',
+            'auto_start_kokoro': True,
+            'prefer_local': True,
+        })
         
         return "✅ QUICK SETUP: Local processing configured (Kokoro TTS + Whisper STT)"
         
@@ -290,11 +334,13 @@ async def quick_setup_cloud() -> str:
         Setup confirmation message.
     """
     try:
-        settings_manager.update_setting('tts_provider', 'openai')
-        settings_manager.update_setting('tts_voice', 'nova')
-        settings_manager.update_setting('stt_provider', 'openai')
-        settings_manager.update_setting('allow_emotions', True)
-        settings_manager.update_setting('prefer_local', False)
+        settings_manager.update_settings({
+            'tts_provider': 'openai',
+            'tts_voice': 'nova',
+            'stt_provider': 'openai',
+            'allow_emotions': True,
+            'prefer_local': False,
+        })
         
         return "✅ QUICK SETUP: Cloud processing configured (OpenAI TTS + STT)"
         
@@ -310,11 +356,13 @@ async def quick_setup_hybrid() -> str:
         Setup confirmation message.
     """
     try:
-        settings_manager.update_setting('tts_provider', 'openai')
-        settings_manager.update_setting('tts_voice', 'nova')
-        settings_manager.update_setting('stt_provider', 'local')
-        settings_manager.update_setting('allow_emotions', True)
-        settings_manager.update_setting('prefer_local', True)
+        settings_manager.update_settings({
+            'tts_provider': 'openai',
+            'tts_voice': 'nova',
+            'stt_provider': 'local',
+            'allow_emotions': True,
+            'prefer_local': True,
+        })
         
         return "✅ QUICK SETUP: Hybrid processing configured (OpenAI TTS + Local Whisper STT)"
         
@@ -332,23 +380,14 @@ async def set_gemini_model(model: str) -> str:
     Returns:
         Confirmation message.
     """
-    model_mapping = {
-        "flash": "gemini-2.5-flash-preview-tts",
-        "pro": "gemini-2.5-pro-preview-tts"
-    }
-    
-    if model in model_mapping:
-        full_model = model_mapping[model]
-    elif model in model_mapping.values():
+    if model in _GEMINI_MODELS:
+        full_model = _GEMINI_MODELS[model]
+    elif model in _GEMINI_MODEL_NAMES:
         full_model = model
     else:
         return "❌ Invalid Gemini model. Use 'flash' or 'pro'."
     
-    success = settings_manager.update_setting('gemini_model', full_model)
-    if success:
-        return f"✅ Gemini model set to: {model} ({full_model})"
-    else:
-        return "❌ Failed to update Gemini model."
+    return _apply({'gemini_model': full_model}, f"✅ Gemini model set to: {model} ({full_model})")
 
 @mcp.tool()
 async def set_gemini_prompt(prompt: str) -> str:
@@ -364,11 +403,10 @@ async def set_gemini_prompt(prompt: str) -> str:
     if not prompt or len(prompt.strip()) < 3:
         return "❌ System prompt must be at least 3 characters long."
     
-    success = settings_manager.update_setting('gemini_system_prompt', prompt.strip())
-    if success:
-        return f"✅ Gemini system prompt set to: {prompt[:50]}{'...' if len(prompt) > 50 else ''}"
-    else:
-        return "❌ Failed to update Gemini system prompt."
+    return _apply(
+        {'gemini_system_prompt': prompt.strip()},
+        f"✅ Gemini system prompt set to: {prompt[:50]}{'...' if len(prompt) > 50 else ''}"
+    )
 
 @mcp.tool()
 async def quick_setup_gemini() -> str:
@@ -379,11 +417,13 @@ async def quick_setup_gemini() -> str:
         Setup confirmation message.
     """
     try:
-        settings_manager.update_setting('tts_provider', 'gemini')
-        settings_manager.update_setting('tts_voice', 'Zephyr')
-        settings_manager.update_setting('gemini_model', 'gemini-2.5-flash-preview-tts')
-        settings_manager.update_setting('stt_provider', 'local')
-        settings_manager.update_setting('prefer_local', True)
+        settings_manager.update_settings({
+            'tts_provider': 'gemini',
+            'tts_voice': GEMINI_DEFAULT_VOICE,
+            'gemini_model': GEMINI_DEFAULT_MODEL,
+            'stt_provider': 'local',
+            'prefer_local': True,
+        })
         
         return "✅ QUICK SETUP: Gemini TTS + Local Whisper STT configured"
         